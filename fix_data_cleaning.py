@@ -4,12 +4,47 @@ import numpy as np
 from datetime import datetime
 import json
 import os
+import sys
 
-def quick_fix_cleaning():
+# Add src to path (stage cache dipakai bersama data_cleaning.py)
+sys.path.append('src')
+
+from stage_cache import StageCache, code_version
+
+QUICK_FIX_CACHE_PATH = 'data/cache/cleaning/quick_fix_stage_cache.pkl'
+
+# Kolom yang dibaca row-local stages (input fingerprint stage cache)
+ROW_LOCAL_COLUMNS = ['salary_min', 'salary_max', 'industry', 'company_size', 'employment_type',
+                     'remote_option', 'required_skills']
+
+def row_local_stages(jobs_df):
+    """Fill default dan derived features yang output tiap row-nya hanya tergantung row itu"""
+    # Fill missing categorical with mode or default
+    jobs_df['industry'] = jobs_df['industry'].fillna('Technology')
+    jobs_df['company_size'] = jobs_df['company_size'].fillna('Medium (50-500)')
+    jobs_df['employment_type'] = jobs_df['employment_type'].fillna('Full-time')
+    jobs_df['remote_option'] = jobs_df['remote_option'].fillna('On-site')
+    jobs_df['required_skills'] = jobs_df['required_skills'].fillna('General Programming')
+    
+    # Add derived features
+    jobs_df['salary_avg'] = (jobs_df['salary_min'] + jobs_df['salary_max']) / 2
+    
+    # Salary categories
+    jobs_df['salary_category'] = pd.cut(
+        jobs_df['salary_min'], 
+        bins=[0, 5000000, 10000000, 15000000, float('inf')],
+        labels=['Entry (2-5M)', 'Mid (5-10M)', 'Senior (10-15M)', 'Expert (15M+)']
+    )
+    return jobs_df
+
+def quick_fix_cleaning(use_cache=True):
     """Quick fix untuk data cleaning dengan error handling yang lebih baik"""
     
     print("🔧 Quick Fix - Data Cleaning...")
     
+    # Row yang tidak berubah sejak run sebelumnya diambil dari cache (invalid kalau script ini berubah)
+    stage_cache = StageCache(QUICK_FIX_CACHE_PATH, version=code_version(sys.modules[__name__])) if use_cache else None
+    
     # Load raw data
     print("📥 Loading raw data...")
     raw_jobs = pd.read_csv('data/raw/it_jobs_raw.csv')
@@ -21,16 +56,15 @@ def quick_fix_cleaning():
     # Handle missing values
     jobs_df = raw_jobs.copy()
     
-    # Fill missing salaries with median
+    # Fill missing salaries with median (statistik global, selalu dihitung ulang)
     jobs_df['salary_min'] = jobs_df['salary_min'].fillna(jobs_df['salary_min'].median())
     jobs_df['salary_max'] = jobs_df['salary_max'].fillna(jobs_df['salary_max'].median())
     
-    # Fill missing categorical with mode or default
-    jobs_df['industry'] = jobs_df['industry'].fillna('Technology')
-    jobs_df['company_size'] = jobs_df['company_size'].fillna('Medium (50-500)')
-    jobs_df['employment_type'] = jobs_df['employment_type'].fillna('Full-time')
-    jobs_df['remote_option'] = jobs_df['remote_option'].fillna('On-site')
-    jobs_df['required_skills'] = jobs_df['required_skills'].fillna('General Programming')
+    # Default fills + salary_avg/salary_category; dengan stage cache hanya row baru/berubah
+    if stage_cache is not None:
+        jobs_df = stage_cache.apply(jobs_df, row_local_stages, ROW_LOCAL_COLUMNS)
+    else:
+        jobs_df = row_local_stages(jobs_df)
     
     # Remove duplicates
     initial_count = len(jobs_df)
@@ -40,16 +74,6 @@ def quick_fix_cleaning():
     
     print(f"📉 Removed {initial_count - final_count} duplicates")
     
-    # Add derived features
-    jobs_df['salary_avg'] = (jobs_df['salary_min'] + jobs_df['salary_max']) / 2
-    
-    # Salary categories
-    jobs_df['salary_category'] = pd.cut(
-        jobs_df['salary_min'], 
-        bins=[0, 5000000, 10000000, 15000000, float('inf')],
-        labels=['Entry (2-5M)', 'Mid (5-10M)', 'Senior (10-15M)', 'Expert (15M+)']
-    )
-    
     # Basic tech data cleaning
     tech_df = raw_tech.copy()
     tech_df = tech_df.drop_duplicates()
@@ -90,6 +114,9 @@ def quick_fix_cleaning():
             'experience_levels': jobs_df['experience_level'].value_counts().to_dict()
         }
     }
+    if stage_cache is not None:
+        stage_cache.save()
+        quality_report['stage_cache'] = stage_cache.stats()
     
     # Save quality report with proper serialization
     try:
@@ -120,6 +147,10 @@ def quick_fix_cleaning():
     print(f"✅ Jobs cleaned: {len(jobs_df)} records")
     print(f"✅ Tech trends cleaned: {len(tech_df)} records")
     print(f"✅ Files saved to data/processed/")
+    if stage_cache is not None:
+        cache_stats = quality_report['stage_cache']
+        print(f"✅ Stage cache: {cache_stats['hits']:,} hits, {cache_stats['misses']:,} misses "
+              f"({cache_stats['hit_rate']:.1%} hit rate)")
     
     # Show sample of cleaned data
     print("\n🔍 Sample cleaned data:")
@@ -128,4 +159,4 @@ def quick_fix_cleaning():
     return jobs_df, tech_df
 
 if __name__ == "__main__":
-    jobs_df, tech_df = quick_fix_cleaning()
\ No newline at end of file
+    jobs_df, tech_df = quick_fix_cleaning(use_cache='--no-cache' not in sys.argv[1:])
\ No newline at end of file
@@ -0,0 +1,29 @@
+# run_data_cleaning.py
+import sys
+import argparse
+
+# Add src to path
+sys.path.append('src')
+
+from data_cleaning import main
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run IT market data cleaning")
+    parser.add_argument('--chunk-size', type=int, default=None,
+                        help="Clean out-of-core in two streaming passes with this many rows per chunk")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Clean jobs in memory on a process pool with this many workers")
+    parser.add_argument('--jobs-path', default='data/raw/it_jobs_raw.csv',
+                        help="Raw jobs CSV or partition folder (e.g. data/raw/it_jobs_raw)")
+    parser.add_argument('--tech-path', default='data/raw/tech_trends_raw.csv',
+                        help="Raw tech trends CSV or partition folder")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Recompute every row instead of reusing cached stage outputs")
+    parser.add_argument('--near-duplicates', action='store_true',
+                        help="Also remove reposted jobs with slightly different wording (MinHash/LSH)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Clean only data/raw/it_jobs_new.csv and append jobs not yet in the processed dataset")
+    args = parser.parse_args()
+    
+    main(chunk_size=args.chunk_size, workers=args.workers, jobs_path=args.jobs_path, tech_path=args.tech_path,
+         use_cache=not args.no_cache, near_duplicates=args.near_duplicates, incremental=args.incremental)
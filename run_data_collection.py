@@ -1,6 +1,7 @@
 # run_data_collection.py
 import sys
 import os
+import argparse
 
 # Add src to path
 sys.path.append('src')
@@ -8,12 +9,46 @@ sys.path.append('src')
 from data_collection import main
 
 if __name__ == "__main__":
-    # Run data collection
-    job_data, tech_data = main()
-    
-    print(f"\n📈 Data Collection Results:")
-    print(f"Jobs dataset shape: {job_data.shape}")
-    print(f"Tech trends shape: {tech_data.shape}")
+    parser = argparse.ArgumentParser(description="Run IT market data collection")
+    parser.add_argument('--stream', action='store_true',
+                        help="Write record batches to partitioned files instead of one CSV")
+    parser.add_argument('--rows', type=int, default=None,
+                        help="Number of generated job records (default: 800)")
+    parser.add_argument('--chunk-size', type=int, default=100000,
+                        help="Records per batch in streaming mode")
+    parser.add_argument('--shards', type=int, default=None,
+                        help="Generate in N deterministic shards on a process pool (streaming mode)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Process pool size for sharded generation (default: CPU count)")
+    parser.add_argument('--listing-url', action='append', dest='listing_urls', default=None,
+                        help="Job portal listing page to scrape (repeatable); default is simulated scraping")
+    parser.add_argument('--survey-path', default=None,
+                        help="Real Stack Overflow survey results CSV (default: simulated survey)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Append only postings newer than the per-source watermarks")
+    args = parser.parse_args()
     
-    print(f"\n📋 Sample job record:")
-    print(job_data.iloc[0].to_dict())
\ No newline at end of file
+    # Run data collection
+    if args.incremental:
+        new_data = main(incremental=True, n_rows=args.rows, listing_urls=args.listing_urls)
+        
+        print(f"\n📈 Data Collection Results:")
+        print(f"New job records: {len(new_data)}")
+    elif args.stream:
+        summary = main(streaming=True, n_rows=args.rows, chunk_size=args.chunk_size,
+                       n_shards=args.shards, max_workers=args.workers,
+                       listing_urls=args.listing_urls, survey_path=args.survey_path)
+        
+        print(f"\n📈 Data Collection Results:")
+        print(f"Job records: {summary['job_records']:,}")
+        print(f"Tech trend records: {summary['tech_records']:,}")
+    else:
+        job_data, tech_data = main(n_rows=args.rows, listing_urls=args.listing_urls,
+                                   survey_path=args.survey_path)
+        
+        print(f"\n📈 Data Collection Results:")
+        print(f"Jobs dataset shape: {job_data.shape}")
+        print(f"Tech trends shape: {tech_data.shape}")
+        
+        print(f"\n📋 Sample job record:")
+        print(job_data.iloc[0].to_dict())
@@ -0,0 +1,139 @@
+# run_pipeline.py
+import sys
+import argparse
+
+import pandas as pd
+
+# Add src to path
+sys.path.append('src')
+
+import data_collection
+import data_cleaning
+from data_cleaning import ITJobDataCleaner, DEDUP_INDEX_DIR, open_stage_cache, record_cleaning_snapshot
+from dedup_index import DedupIndex
+from near_duplicates import NearDuplicateDetector
+from pipeline import Artifact, Pipeline, Stage
+from schema import JOB_SCHEMA, TECH_SCHEMA, load_metadata
+from columnar_store import parquet_path, read_dataset
+from snapshot_store import SnapshotStore
+from verify_data import verify_collected_data
+
+RAW_JOBS = 'data/raw/it_jobs_raw.csv'
+RAW_TECH = 'data/raw/tech_trends_raw.csv'
+CLEANED_JOBS = 'data/processed/it_jobs_cleaned.csv'
+CLEANED_TECH = 'data/processed/tech_trends_cleaned.csv'
+JOB_STORE_MANIFEST = 'data/processed/it_jobs/manifest.json'
+QUALITY_REPORT = 'data/processed/data_quality_report.json'
+
+# Module di src/ yang dipakai tiap stage (source-nya ikut fingerprint)
+COLLECTION_MODULES = ['data_collection', 'scraping', 'http_cache', 'survey_loader', 'skill_matcher',
+                      'salary_parser', 'snapshot_store']
+CLEANING_MODULES = ['data_cleaning', 'stage_cache', 'dedup_index', 'near_duplicates', 'date_parser',
+                    'schema', 'skill_matrix', 'columnar_store', 'job_store']
+
+
+def build_pipeline(args):
+    """collect → clean_jobs ∥ clean_tech → report, snapshot; verify (raw data) paralel dengan cleaning"""
+    stage_cache = open_stage_cache() if not args.no_cache and not args.workers else None
+    cleaner = ITJobDataCleaner(
+        stage_cache=stage_cache,
+        near_duplicates=NearDuplicateDetector() if args.near_duplicates else None,
+        dedup_index=DedupIndex(DEDUP_INDEX_DIR)
+    )
+
+    def collect(**inputs):
+        job_data, tech_data = data_collection.main(n_rows=args.rows, listing_urls=args.listing_urls,
+                                                   survey_path=args.survey_path)
+        return {'raw_jobs': job_data, 'raw_tech': tech_data}
+
+    def clean_jobs(raw_jobs):
+        cleaner.raw_jobs = raw_jobs
+        collection = SnapshotStore().latest('collection')
+        if collection is not None:
+            cleaner.use_collection_snapshot(collection)
+        cleaner.clean_job_data(workers=args.workers)
+        cleaner.save_cleaned_jobs()
+        if stage_cache is not None:
+            stage_cache.save()
+        return {'cleaned_jobs': cleaner.cleaned_jobs}
+
+    def clean_tech(raw_tech):
+        cleaner.raw_tech = raw_tech
+        cleaner.clean_tech_data()
+        cleaner.save_cleaned_tech()
+        return {'cleaned_tech': cleaner.cleaned_tech}
+
+    def report(cleaned_jobs, cleaned_tech):
+        cleaner.cleaned_jobs, cleaner.cleaned_tech = cleaned_jobs, cleaned_tech
+        if not cleaner.memory_stats:
+            # clean_jobs di-skip: metadata dan memory stats dari metadata file
+            saved = load_metadata(CLEANED_JOBS)
+            cleaner.job_metadata, cleaner.memory_stats = saved['metadata'], saved['memory_stats']
+        cleaner.save_quality_report(QUALITY_REPORT)
+        return {}
+
+    def snapshot(cleaned_jobs, cleaned_tech):
+        if not cleaner.job_metadata:
+            cleaner.job_metadata = load_metadata(CLEANED_JOBS)['metadata']
+        record_cleaning_snapshot(cleaner, {'jobs': cleaned_jobs, 'tech': cleaned_tech})
+        return {}
+
+    def verify(raw_jobs, raw_tech):
+        verify_collected_data({RAW_JOBS: raw_jobs, RAW_TECH: raw_tech})
+        return {}
+
+    artifacts = {
+        'raw_jobs': Artifact(RAW_JOBS, pd.read_csv),
+        'raw_tech': Artifact(RAW_TECH, pd.read_csv),
+        'cleaned_jobs': Artifact([CLEANED_JOBS, 'data/processed/it_jobs_cleaned.metadata.json',
+                                  'data/processed/it_jobs_skills.npz', parquet_path(CLEANED_JOBS),
+                                  JOB_STORE_MANIFEST],
+                                 lambda path: read_dataset(path, JOB_SCHEMA)),
+        'cleaned_tech': Artifact([CLEANED_TECH, parquet_path(CLEANED_TECH)],
+                                 lambda path: read_dataset(path, TECH_SCHEMA)),
+        'quality_report': Artifact(QUALITY_REPORT)
+    }
+    collect_inputs = []
+    if args.survey_path:
+        artifacts['survey'] = Artifact(args.survey_path)
+        collect_inputs.append('survey')
+
+    stages = [
+        Stage('collect', collect, inputs=collect_inputs, outputs=['raw_jobs', 'raw_tech'],
+              modules=[sys.modules[name] for name in COLLECTION_MODULES],
+              params={'rows': args.rows, 'listing_urls': args.listing_urls}),
+        Stage('clean_jobs', clean_jobs, inputs=['raw_jobs'], outputs=['cleaned_jobs'],
+              modules=[sys.modules[name] for name in CLEANING_MODULES],
+              params={'near_duplicates': args.near_duplicates}),
+        Stage('clean_tech', clean_tech, inputs=['raw_tech'], outputs=['cleaned_tech'],
+              modules=[sys.modules[name] for name in CLEANING_MODULES]),
+        Stage('report', report, inputs=['cleaned_jobs', 'cleaned_tech'], outputs=['quality_report'],
+              modules=[data_cleaning, sys.modules['data_profiler']]),
+        Stage('snapshot', snapshot, inputs=['cleaned_jobs', 'cleaned_tech'],
+              modules=[sys.modules['snapshot_store']]),
+        Stage('verify', verify, inputs=['raw_jobs', 'raw_tech'], modules=[sys.modules['verify_data']])
+    ]
+    return Pipeline(stages, artifacts, max_workers=args.parallel,
+                    force=[stage.name for stage in stages] if 'all' in args.force else args.force)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run collection, cleaning and verification as one pipeline")
+    parser.add_argument('--rows', type=int, default=None,
+                        help="Number of generated job records (default: 800)")
+    parser.add_argument('--survey-path', default=None,
+                        help="Real Stack Overflow survey results CSV (default: simulated survey)")
+    parser.add_argument('--listing-url', action='append', dest='listing_urls', default=None,
+                        help="Job portal listing page to scrape (repeatable); default is simulated scraping")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Clean jobs on a process pool with this many workers")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Recompute every row instead of reusing cached stage outputs")
+    parser.add_argument('--near-duplicates', action='store_true',
+                        help="Also remove reposted jobs with slightly different wording (MinHash/LSH)")
+    parser.add_argument('--parallel', type=int, default=2,
+                        help="Number of independent stages run at the same time")
+    parser.add_argument('--force', action='append', default=[],
+                        help="Rerun this stage even if it is up to date (repeatable, 'all' for every stage)")
+    args = parser.parse_args()
+
+    build_pipeline(args).run()
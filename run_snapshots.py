@@ -0,0 +1,63 @@
+# run_snapshots.py
+import sys
+import argparse
+
+import pandas as pd
+
+# Add src to path
+sys.path.append('src')
+
+from snapshot_store import SnapshotStore
+
+# Kolom yang ditampilkan untuk posting yang berubah
+DIFF_COLUMNS = ['company', 'title', 'location', 'salary_min', 'salary_max', 'posted_date']
+
+
+def show_log(store):
+    print(f"{'Version':<9}{'Kind':<12}{'Parent':<9}{'Created':<21}Tables")
+    for version in store.versions():
+        tables = ', '.join(f"{name} {table['rows']:,} rows ({table['written']}/{len(table['partitions'])} "
+                           f"partitions written)" for name, table in version['tables'].items())
+        created = version['created_at'][:19].replace('T', ' ')
+        print(f"{version['id']:<9}{version['kind']:<12}{version['parent'] or '-':<9}{created:<21}{tables}")
+
+
+def show_diff(store, old_id, new_id, table, limit):
+    diff = store.diff(old_id, new_id, table)
+    stats = diff['stats']
+    print(f"🔍 {table}: {old_id} → {new_id} ({stats['partitions_compared']} of {stats['partitions']} partitions "
+          f"compared, {stats['rows_compared']:,} index rows)")
+
+    for name, label in [('added', '➕ Added'), ('removed', '➖ Removed'), ('changed', '✏️ Changed')]:
+        rows = diff[name]
+        print(f"\n{label}: {len(rows):,}")
+        if len(rows):
+            columns = [col for col in DIFF_COLUMNS if col in rows.columns] or list(rows.columns)
+            with pd.option_context('display.width', 160, 'display.max_columns', None):
+                print(rows[columns].head(limit).to_string(index=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="List dataset snapshot versions or diff two of them")
+    parser.add_argument('old', nargs='?', default=None,
+                        help="Older version id (default: parent of the newer version)")
+    parser.add_argument('new', nargs='?', default=None,
+                        help="Newer version id (default: latest version of --kind)")
+    parser.add_argument('--kind', choices=['collection', 'cleaning'], default='cleaning',
+                        help="Snapshot lineage used for default versions")
+    parser.add_argument('--table', default='jobs', help="Table to diff (jobs or tech)")
+    parser.add_argument('--log', action='store_true', help="List versions instead of diffing")
+    parser.add_argument('--limit', type=int, default=10, help="Rows shown per diff section")
+    args = parser.parse_args()
+
+    store = SnapshotStore()
+    if args.log:
+        show_log(store)
+        sys.exit()
+
+    new = store.get(args.new) if args.new else store.latest(args.kind)
+    old_id = args.old or (new and new['parent'])
+    if new is None or old_id is None:
+        print("❌ Need two snapshot versions to diff (run collection/cleaning at least twice).")
+        sys.exit(1)
+    show_diff(store, old_id, new['id'], args.table, args.limit)
@@ -0,0 +1,89 @@
+# scripts/benchmark_generation.py
+import sys
+import os
+import time
+import argparse
+import tempfile
+from datetime import datetime
+
+import numpy as np
+
+# Add src to path (jalankan dari root repository)
+sys.path.append('src')
+
+from data_collection import ITJobDataCollector, generate_sharded_job_data
+
+SIZES = [1000, 100000, 10000000]
+SLICE_ROWS = 1000000  # 10M rows digenerate per 1M supaya tidak butuh RAM puluhan GB
+
+
+def benchmark_legacy(collector, n_rows=800):
+    """Baseline: row-by-row generate_realistic_job_data (fixed 800 rows)"""
+    start = time.perf_counter()
+    df = collector.generate_realistic_job_data()
+    elapsed = time.perf_counter() - start
+    return len(df), elapsed
+
+
+def benchmark_vectorized(collector, n_rows):
+    """Generate n_rows dengan vectorized engine, per slice, dan buang hasilnya"""
+    rng = np.random.default_rng(42)
+    reference_time = datetime.now()
+
+    generated = 0
+    start = time.perf_counter()
+    while generated < n_rows:
+        size = min(SLICE_ROWS, n_rows - generated)
+        df = collector.generate_job_data_vectorized(
+            n_rows=size, rng=rng, start_id=generated + 1, reference_time=reference_time
+        )
+        generated += len(df)
+        del df
+    elapsed = time.perf_counter() - start
+    return generated, elapsed
+
+
+def benchmark_sharded(n_rows, n_shards, max_workers):
+    """Sharded generation ke partition files di temporary directory"""
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        result = generate_sharded_job_data(
+            n_rows, n_shards, max_workers=max_workers, output_dir=output_dir,
+            reference_time=datetime(2024, 1, 1)
+        )
+        elapsed = time.perf_counter() - start
+    return result['rows'], elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job data generation")
+    parser.add_argument('sizes', nargs='*', type=int, default=SIZES)
+    parser.add_argument('--sharded-rows', type=int, default=None,
+                        help="Also benchmark sharded generation with this many rows")
+    parser.add_argument('--shards', type=int, default=32)
+    args = parser.parse_args()
+
+    collector = ITJobDataCollector()
+    sizes = args.sizes
+
+    print("⏱️ Job data generation benchmark")
+    print("=" * 50)
+
+    rows, elapsed = benchmark_legacy(collector)
+    print(f"{'legacy (row loop)':<22} {rows:>12,} rows {elapsed:>9.3f}s {rows / elapsed:>14,.0f} rows/s")
+
+    for n_rows in sizes:
+        rows, elapsed = benchmark_vectorized(collector, n_rows)
+        print(f"{'vectorized':<22} {rows:>12,} rows {elapsed:>9.3f}s {rows / elapsed:>14,.0f} rows/s")
+
+    if args.sharded_rows:
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            rows, elapsed = benchmark_sharded(args.sharded_rows, args.shards, workers)
+            label = f"sharded ({workers} workers)"
+            print(f"{label:<22} {rows:>12,} rows {elapsed:>9.3f}s {rows / elapsed:>14,.0f} rows/s")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# scripts/benchmark_job_store.py
+import sys
+import os
+import time
+import argparse
+import contextlib
+import io
+import tempfile
+
+import pandas as pd
+
+# Add src to path (jalankan dari root repository)
+sys.path.append('src')
+
+from data_collection import ITJobDataCollector
+from data_cleaning import ITJobDataCleaner
+from schema import JOB_SCHEMA
+from columnar_store import read_dataset, write_parquet
+from job_store import PartitionedJobStore
+
+# Kolom yang di-load dashboard (DASHBOARD_JOB_COLUMNS di dashboard_fixed.py)
+DASHBOARD_COLUMNS = ['title', 'company', 'location', 'salary_avg', 'experience_level', 'remote_option',
+                     'required_skills']
+
+
+def prepare_history(rows_per_month, months):
+    """Cleaned jobs untuk `months` bulan terakhir: batch generated yang tanggalnya digeser per bulan"""
+    cleaner = ITJobDataCleaner(verbose=False)
+    df = ITJobDataCollector().generate_job_data_vectorized(n_rows=rows_per_month)
+    with contextlib.redirect_stdout(io.StringIO()):
+        cleaner._pin_reference_time(df)
+        df = cleaner._compact_jobs(cleaner._transform_jobs(df))
+
+    batches = []
+    for month in range(months):
+        batch = df.copy()
+        offset = pd.DateOffset(months=month)
+        batch['posted_date'] -= offset
+        batch['application_deadline'] -= offset
+        batches.append(batch)
+    return cleaner, pd.concat(batches, ignore_index=True)
+
+
+def timed(read, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = read()
+        best = min(best, time.perf_counter() - start)
+    return best, df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dashboard load: flat Parquet vs posted_date partitions")
+    parser.add_argument('months', type=int, nargs='*', default=[3, 12, 36])
+    parser.add_argument('--rows-per-month', type=int, default=50000)
+    args = parser.parse_args()
+
+    print("⏱️ Job store benchmark (load = best of 3, dashboard columns)")
+    print("=" * 78)
+    print(f"{'months':>7} {'rows':>11} {'flat load':>10} {'store all':>10} {'store active':>13} "
+          f"{'active rows':>12} {'opened':>8}")
+
+    for months in args.months:
+        cleaner, df = prepare_history(args.rows_per_month, months)
+
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, 'it_jobs_cleaned.csv')
+            write_parquet(df, csv_path, cleaner.job_metadata)
+            store = PartitionedJobStore(os.path.join(directory, 'it_jobs'))
+            store.write(df, cleaner.job_metadata)
+
+            flat, _ = timed(lambda: read_dataset(csv_path, JOB_SCHEMA, DASHBOARD_COLUMNS))
+            store_all, _ = timed(lambda: store.load(DASHBOARD_COLUMNS))
+            store_active, active = timed(lambda: store.load(DASHBOARD_COLUMNS, active_only=True))
+            opened = f"{store.scan_stats['opened']}/{store.scan_stats['partitions']}"
+
+            print(f"{months:>7} {len(df):>11,} {flat:>9.2f}s {store_all:>9.2f}s {store_active:>12.2f}s "
+                  f"{len(active):>12,} {opened:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# scripts/benchmark_skill_extraction.py
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Add src to path (jalankan dari root repository)
+sys.path.append('src')
+
+from data_collection import ITJobDataCollector
+from skill_matcher import SkillMatcher
+
+FILLER = ['experience', 'required', 'with', 'strong', 'knowledge', 'of', 'and', 'team',
+          'building', 'scalable', 'services', 'in', 'a', 'fast', 'growing', 'company']
+
+
+def make_skill_list(n_skills):
+    """Skill dictionary: skill asli collector + skill sintetis sampai n_skills"""
+    skills = list(ITJobDataCollector.SKILL_KEYWORDS) + list(ITJobDataCollector.SKILLS_POOL)
+    skills = list(dict.fromkeys(skills))[:n_skills]
+    skills += [f'Framework{i:04d}' for i in range(n_skills - len(skills))]
+    return skills
+
+
+def make_descriptions(n_descriptions, skills, seed=42):
+    """Description unik (dengan nomor posting) berisi filler dan beberapa skill"""
+    rng = np.random.default_rng(seed)
+    descriptions = []
+    for i in range(n_descriptions):
+        words = list(rng.choice(FILLER, size=25)) + list(rng.choice(skills, size=4))
+        rng.shuffle(words)
+        descriptions.append(f'Posting {i}: ' + ' '.join(words))
+    return pd.Series(descriptions)
+
+
+def legacy_extract_skills(description, skills_keywords):
+    """Implementasi lama: substring scan per keyword"""
+    found_skills = []
+    for skill in skills_keywords:
+        if skill.lower() in description.lower():
+            found_skills.append(skill)
+
+    return ', '.join(found_skills) if found_skills else 'General Programming'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill extraction")
+    parser.add_argument('--descriptions', type=int, default=20000)
+    parser.add_argument('--skills', type=int, nargs='*', default=[10, 5000])
+    args = parser.parse_args()
+
+    print("⏱️ Skill extraction benchmark (descriptions/s)")
+    print("=" * 64)
+    print(f"{'skills':>8} {'legacy loop':>16} {'SkillMatcher':>16} {'speedup':>9} {'build':>9}")
+
+    for n_skills in args.skills:
+        skills = make_skill_list(n_skills)
+        descriptions = make_descriptions(args.descriptions, skills)
+
+        start = time.perf_counter()
+        for description in descriptions:
+            legacy_extract_skills(description, skills)
+        legacy_rate = len(descriptions) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matcher.extract_batch(descriptions)
+        matcher_rate = len(descriptions) / (time.perf_counter() - start)
+
+        print(f"{n_skills:>8,} {legacy_rate:>14,.0f}/s {matcher_rate:>14,.0f}/s "
+              f"{matcher_rate / legacy_rate:>8.1f}x {build_time * 1000:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
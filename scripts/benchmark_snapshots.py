@@ -0,0 +1,91 @@
+# scripts/benchmark_snapshots.py
+import sys
+import time
+import argparse
+import contextlib
+import io
+import tempfile
+
+import pandas as pd
+
+# Add src to path (jalankan dari root repository)
+sys.path.append('src')
+
+from data_collection import ITJobDataCollector
+from data_cleaning import ITJobDataCleaner, DUPLICATE_KEYS
+from snapshot_store import SnapshotStore
+
+
+def prepare_history(rows_per_month, months):
+    """Cleaned jobs untuk `months` bulan terakhir: batch generated yang tanggalnya digeser per bulan"""
+    cleaner = ITJobDataCleaner(verbose=False)
+    df = ITJobDataCollector().generate_job_data_vectorized(n_rows=rows_per_month)
+    with contextlib.redirect_stdout(io.StringIO()):
+        cleaner._pin_reference_time(df)
+        df = cleaner._compact_jobs(cleaner._transform_jobs(df))
+
+    batches = []
+    for month in range(months):
+        batch = df.copy()
+        offset = pd.DateOffset(months=month)
+        batch['posted_date'] -= offset
+        batch['application_deadline'] -= offset
+        # Key unik per bulan supaya diff tidak memasangkan posting dari bulan lain
+        batch['company'] = batch['company'].astype(str) + f' #{month}'
+        batches.append(batch)
+    return pd.concat(batches, ignore_index=True)
+
+
+def full_diff(old, new):
+    """Baseline: bandingkan seluruh isi dua version (join semua row)"""
+    merged = old.merge(new, on=DUPLICATE_KEYS, how='outer', suffixes=('_old', '_new'), indicator=True)
+    return (merged['_merge'] == 'right_only').sum(), (merged['_merge'] == 'left_only').sum()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark snapshot commit/diff vs full dataset comparison")
+    parser.add_argument('--months', type=int, default=24)
+    parser.add_argument('--rows-per-month', type=int, default=20000)
+    parser.add_argument('--changes', type=int, nargs='*', default=[10, 1000, 10000])
+    args = parser.parse_args()
+
+    df = prepare_history(args.rows_per_month, args.months)
+    latest_month = df['posted_date'] >= df['posted_date'].max() - pd.Timedelta(days=20)
+
+    print(f"⏱️ Snapshot benchmark: {len(df):,} cleaned jobs over {args.months} months")
+    print("=" * 90)
+    print(f"{'changed rows':>13} {'commit':>8} {'written':>9} {'diff':>8} {'compared':>10} "
+          f"{'full load+join':>15} {'added/changed':>14}")
+
+    for n_changes in args.changes:
+        with tempfile.TemporaryDirectory() as directory:
+            store = SnapshotStore(directory)
+            old = store.commit('cleaning', {'jobs': df})
+
+            # Posting baru dan salary berubah di bulan terakhir saja (seperti collection harian)
+            changed = df.copy()
+            rows = changed.index[latest_month][:n_changes // 2]
+            changed.loc[rows, 'salary_max'] = changed.loc[rows, 'salary_max'] + 1
+            added = df[latest_month].head(n_changes - len(rows)).copy()
+            added['title'] = added['title'].astype(str) + ' (new)'
+            changed = pd.concat([changed, added], ignore_index=True)
+
+            start = time.perf_counter()
+            new = store.commit('cleaning', {'jobs': changed})
+            commit = time.perf_counter() - start
+
+            start = time.perf_counter()
+            counts = store.diff_counts(old['id'], new['id'])
+            diff = time.perf_counter() - start
+
+            start = time.perf_counter()
+            full_diff(store.load(old['id'], 'jobs'), store.load(new['id'], 'jobs'))
+            full = time.perf_counter() - start
+
+            written = f"{new['tables']['jobs']['written']}/{len(new['tables']['jobs']['partitions'])}"
+            print(f"{n_changes:>13,} {commit:>7.2f}s {written:>9} {diff:>7.3f}s {counts['rows_compared']:>10,} "
+                  f"{full:>14.2f}s {counts['added']:>7,}/{counts['changed']:<6,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# scripts/benchmark_storage.py
+import sys
+import os
+import time
+import argparse
+import contextlib
+import io
+import tempfile
+
+# Add src to path (jalankan dari root repository)
+sys.path.append('src')
+
+from data_collection import ITJobDataCollector
+from data_cleaning import ITJobDataCleaner
+from date_parser import OUTPUT_DATE_FORMAT
+from schema import JOB_SCHEMA, read_csv_with_schema, save_metadata
+from columnar_store import parquet_path, read_dataset, write_parquet
+
+# Kolom yang di-load dashboard (DASHBOARD_JOB_COLUMNS di dashboard_fixed.py)
+PROJECTED_COLUMNS = ['title', 'company', 'location', 'salary_avg', 'experience_level', 'remote_option',
+                     'required_skills']
+
+
+def prepare_cleaned(n_rows):
+    """Generated jobs → stage cleaning 1-6 + compact schema, tanpa dedup (supaya tetap n_rows)"""
+    cleaner = ITJobDataCleaner(verbose=False)
+    df = ITJobDataCollector().generate_job_data_vectorized(n_rows=n_rows)
+    with contextlib.redirect_stdout(io.StringIO()):
+        cleaner._pin_reference_time(df)
+        df = cleaner._compact_jobs(cleaner._transform_jobs(df))
+    return cleaner, df
+
+
+def timed(read, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = read()
+        best = min(best, time.perf_counter() - start)
+    return best, df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CSV vs Parquet storage for cleaned jobs")
+    parser.add_argument('sizes', type=int, nargs='*', default=[1000000])
+    args = parser.parse_args()
+
+    print("⏱️ Storage benchmark (read = best of 3)")
+    print("=" * 86)
+    print(f"{'rows':>10} {'format':>8} {'size MB':>9} {'write':>8} {'read all':>9} "
+          f"{'read 7 cols':>12} {'dtypes kept':>12}")
+
+    for n_rows in args.sizes:
+        cleaner, df = prepare_cleaned(n_rows)
+
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, 'it_jobs_cleaned.csv')
+
+            start = time.perf_counter()
+            df.to_csv(csv_path, index=False, date_format=OUTPUT_DATE_FORMAT)
+            save_metadata(csv_path, cleaner.job_metadata, df)
+            csv_write = time.perf_counter() - start
+
+            start = time.perf_counter()
+            write_parquet(df, csv_path, cleaner.job_metadata)
+            parquet_write = time.perf_counter() - start
+
+            csv_all, from_csv = timed(lambda: read_csv_with_schema(csv_path, JOB_SCHEMA))
+            csv_projected, _ = timed(lambda: read_csv_with_schema(csv_path, JOB_SCHEMA, PROJECTED_COLUMNS))
+            parquet_all, from_parquet = timed(lambda: read_dataset(csv_path, JOB_SCHEMA))
+            parquet_projected, _ = timed(lambda: read_dataset(csv_path, JOB_SCHEMA, PROJECTED_COLUMNS))
+
+            rows = [
+                ('csv', os.path.getsize(csv_path), csv_write, csv_all, csv_projected, from_csv),
+                ('parquet', os.path.getsize(parquet_path(csv_path)), parquet_write, parquet_all,
+                 parquet_projected, from_parquet)
+            ]
+            for name, size, write, read_all, read_projected, loaded in rows:
+                kept = (loaded.dtypes.astype(str) == df.dtypes.astype(str)).all()
+                print(f"{n_rows:>10,} {name:>8} {size / 1e6:>9.1f} {write:>7.2f}s {read_all:>8.2f}s "
+                      f"{read_projected:>11.2f}s {str(kept):>12}")
+
+
+if __name__ == "__main__":
+    main()
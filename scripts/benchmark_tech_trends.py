@@ -0,0 +1,94 @@
+# scripts/benchmark_tech_trends.py
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Add src to path (jalankan dari root repository)
+sys.path.append('src')
+
+from data_collection import ITJobDataCollector
+
+SIZES = [500, 50000, 500000]
+
+TECHNOLOGIES = [
+    'JavaScript', 'Python', 'Java', 'TypeScript', 'C#', 'PHP', 'C++',
+    'React', 'Node.js', 'Angular', 'Vue.js', 'Laravel', 'Django',
+    'Spring Boot', 'Express.js', 'MySQL', 'PostgreSQL', 'MongoDB',
+    'Docker', 'Kubernetes', 'AWS', 'Azure', 'Git', 'Linux'
+]
+
+
+def make_survey(n_respondents, seed=42):
+    """Survey sintetis dengan distribusi yang sama seperti load_stackoverflow_data"""
+    rng = np.random.default_rng(seed)
+    num_techs = rng.integers(3, 9, size=n_respondents)
+    order = np.argsort(rng.random((n_respondents, len(TECHNOLOGIES))), axis=1)
+    names = np.array(TECHNOLOGIES, dtype=object)
+
+    technologies = [', '.join(names[row[:k]]) for row, k in zip(order, num_techs)]
+
+    return pd.DataFrame({
+        'respondent_id': np.arange(1, n_respondents + 1),
+        'country': rng.choice(['Indonesia', 'Singapore', 'Malaysia', 'Thailand'], size=n_respondents),
+        'experience_years': rng.integers(1, 16, size=n_respondents),
+        'technologies': technologies,
+        'salary_usd': rng.integers(15000, 120001, size=n_respondents),
+        'company_size': rng.choice(['Small', 'Medium', 'Large'], size=n_respondents),
+        'remote_work': rng.choice(['Never', 'Sometimes', 'Always'], size=n_respondents)
+    })
+
+
+def legacy_process_stackoverflow_data(so_data):
+    """Implementasi lama (iterrows) sebagai baseline"""
+    tech_trends = []
+    for _, row in so_data.iterrows():
+        techs = row['technologies'].split(', ')
+        for tech in techs:
+            tech_trends.append({
+                'technology': tech,
+                'country': row['country'],
+                'experience_years': row['experience_years'],
+                'salary_usd': row['salary_usd'],
+                'company_size': row['company_size']
+            })
+
+    return pd.DataFrame(tech_trends)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tech trend extraction")
+    parser.add_argument('sizes', nargs='*', type=int, default=SIZES)
+    args = parser.parse_args()
+
+    collector = ITJobDataCollector()
+
+    print("⏱️ Tech trend builder benchmark (iterrows vs explode)")
+    print("=" * 72)
+    print(f"{'respondents':>12} {'trend rows':>12} {'iterrows':>10} {'explode':>10} {'speedup':>9} {'MB before':>10} {'MB after':>9}")
+
+    for n_respondents in args.sizes:
+        survey = make_survey(n_respondents)
+
+        legacy, legacy_time = timed(legacy_process_stackoverflow_data, survey)
+        vectorized, vectorized_time = timed(collector._process_stackoverflow_data, survey)
+
+        # Hasilnya harus sama (selain dtype categorical)
+        pd.testing.assert_frame_equal(legacy, vectorized.astype(legacy.dtypes.to_dict()), check_dtype=False)
+
+        legacy_mb = legacy.memory_usage(deep=True).sum() / 1e6
+        vectorized_mb = vectorized.memory_usage(deep=True).sum() / 1e6
+        print(f"{n_respondents:>12,} {len(vectorized):>12,} {legacy_time:>9.3f}s {vectorized_time:>9.3f}s "
+              f"{legacy_time / vectorized_time:>8.1f}x {legacy_mb:>10.1f} {vectorized_mb:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
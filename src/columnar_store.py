@@ -0,0 +1,177 @@
+# src/columnar_store.py
+import json
+import os
+
+import pandas as pd
+
+from schema import apply_schema, load_metadata, read_csv_with_schema
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # tanpa pyarrow hanya CSV yang ditulis/dibaca
+    pa = pq = None
+
+PARQUET_AVAILABLE = pq is not None
+
+# Key-value metadata file Parquet untuk metadata dataset (dataset_version, reference_time, ...)
+DATASET_METADATA_KEY = 'it_market.metadata'
+
+
+def parquet_path(csv_path):
+    """data/processed/it_jobs_cleaned.csv → data/processed/it_jobs_cleaned.parquet"""
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+
+def _file_schema(schema):
+    """Schema chunk pertama dengan dictionary index int32: chunk berikutnya bisa punya
+    lebih banyak category"""
+    fields = [
+        pa.field(field.name, pa.dictionary(pa.int32(), field.type.value_type), field.nullable)
+        if pa.types.is_dictionary(field.type) else field
+        for field in schema
+    ]
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+class ParquetWriter:
+    """Tulis DataFrame (satu atau beberapa chunk) ke satu Parquet file.
+
+    dtype pandas (category, Int8, datetime64, ...) tersimpan di file, jadi reader tidak
+    perlu parse ulang tanggal atau membangun category. Metadata dataset ditulis saat
+    close() dan file baru muncul setelah itu. Tanpa pyarrow semua method no-op.
+    """
+
+    def __init__(self, csv_path):
+        self.path = parquet_path(csv_path)
+        self.writer = None
+
+    def write(self, df):
+        if pq is None:
+            return
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self.writer is None:
+            self.schema = _file_schema(table.schema)
+            self.writer = pq.ParquetWriter(self.path + '.tmp', self.schema)
+        self.writer.write_table(table.cast(self.schema))
+
+    def close(self, metadata=None):
+        if self.writer is None:
+            return
+        self.writer.add_key_value_metadata({DATASET_METADATA_KEY: json.dumps(metadata or {})})
+        self.writer.close()
+        os.replace(self.path + '.tmp', self.path)
+
+
+def write_parquet(df, csv_path, metadata=None):
+    """Parquet di samping CSV (tidak ditulis kalau pyarrow tidak ter-install)"""
+    writer = ParquetWriter(csv_path)
+    writer.write(df)
+    writer.close(metadata)
+
+
+def has_parquet(csv_path):
+    """Parquet ada dan tidak lebih lama dari CSV (incremental cleaning hanya append ke CSV)"""
+    path = parquet_path(csv_path)
+    if pq is None or not os.path.exists(path):
+        return False
+    return not os.path.exists(csv_path) or os.path.getmtime(path) >= os.path.getmtime(csv_path)
+
+
+def read_dataset(csv_path, schema, columns=None):
+    """Load dataset dengan compact dtypes, hanya kolom yang dibutuhkan (columns=None = semua).
+
+    Parquet dipakai kalau ada dan up-to-date, selain itu CSV + schema.
+    Metadata dataset ada di df.attrs['metadata'] seperti read_csv_with_schema.
+    """
+    if not has_parquet(csv_path):
+        return read_csv_with_schema(csv_path, schema, columns)
+
+    parquet = pq.ParquetFile(parquet_path(csv_path))
+    if columns is not None:
+        columns = [col for col in columns if col in parquet.schema_arrow.names]
+    df = _to_pandas(parquet.read(columns=columns), schema)
+    df.attrs['metadata'] = _file_metadata(parquet)
+    return df
+
+
+def iter_dataset(csv_path, schema, chunk_size=100000):
+    """read_dataset per chunk (batch dari Parquet atau chunk CSV + schema), untuk file
+    yang tidak perlu di-load utuh. Metadata dataset tidak dipasang di tiap chunk."""
+    if has_parquet(csv_path):
+        parquet = pq.ParquetFile(parquet_path(csv_path))
+        for batch in parquet.iter_batches(batch_size=chunk_size):
+            yield _to_pandas(pa.Table.from_batches([batch]), schema)
+        return
+
+    date_format = load_metadata(csv_path)['date_format']
+    categorical = {col: 'category' for col, dtype in schema.items() if dtype == 'category'}
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_size, dtype=categorical):
+        yield apply_schema(chunk, schema, date_format)
+
+
+def read_datasets(csv_paths, schema, columns=None):
+    """Beberapa file dengan schema yang sama (mis. partition) sebagai satu DataFrame.
+
+    Parquet di-concat sebagai Arrow table lalu dikonversi sekali, jadi category tiap
+    file disatukan oleh pyarrow. Metadata dataset diambil dari file pertama.
+    """
+    if not all(has_parquet(path) for path in csv_paths):
+        return concat_frames([read_dataset(path, schema, columns) for path in csv_paths])
+
+    files = [pq.ParquetFile(parquet_path(path)) for path in csv_paths]
+    if columns is not None:
+        columns = [col for col in columns if col in files[0].schema_arrow.names]
+    tables = _unify_dictionaries([parquet.read(columns=columns) for parquet in files])
+    df = _to_pandas(pa.concat_tables(tables, promote_options='permissive'), schema)
+    df.attrs['metadata'] = _file_metadata(files[0])
+    return df
+
+
+def concat_frames(frames):
+    """pd.concat yang mempertahankan category: category tiap frame bisa beda (pd.concat
+    mengubahnya jadi object), jadi disamakan dulu. Hasilnya unordered seperti category
+    yang dibaca dari file"""
+    for col in frames[0].select_dtypes('category').columns:
+        categories = dict.fromkeys(value for frame in frames for value in frame[col].cat.categories)
+        dtype = pd.CategoricalDtype(list(categories))
+        for frame in frames:
+            frame[col] = frame[col].astype(dtype)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _unify_dictionaries(tables):
+    """Kolom yang di satu file category (dictionary) tapi di file lain string biasa
+    (mis. snapshot partition lama vs baru) di-encode jadi dictionary juga, karena
+    concat_tables tidak bisa menggabungkan keduanya"""
+    dictionaries = {}
+    for table in tables:
+        for field in table.schema:
+            if pa.types.is_dictionary(field.type):
+                dictionaries.setdefault(field.name, field.type)
+
+    unified = []
+    for table in tables:
+        for name, dtype in dictionaries.items():
+            index = table.schema.get_field_index(name)
+            if index >= 0 and not pa.types.is_dictionary(table.schema.field(index).type):
+                column = table.column(index).cast(dtype.value_type).dictionary_encode().cast(dtype)
+                table = table.set_column(index, name, column)
+        unified.append(table)
+    return unified
+
+
+def _to_pandas(table, schema):
+    df = table.to_pandas()
+
+    # Chunk pertama tanpa NaN menyimpan int8 numpy; kalau chunk berikutnya punya NaN, pyarrow
+    # mengembalikan float → cast ulang ke nullable integer
+    floats = {col: dtype for col, dtype in schema.items()
+              if col in df.columns and dtype.startswith(('int', 'uint')) and df[col].dtype.kind == 'f'}
+    if floats:
+        df = apply_schema(df, floats)
+    return df
+
+
+def _file_metadata(parquet):
+    return json.loads(parquet.metadata.metadata.get(DATASET_METADATA_KEY.encode(), b'{}'))
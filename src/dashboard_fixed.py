@@ -7,6 +7,20 @@ from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime
 import json
+import os
+import sys
+
+# skill_matrix dan schema ada di folder yang sama (src/)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from skill_matrix import SkillMatrix
+from schema import JOB_SCHEMA, TECH_SCHEMA, remove_unused_categories
+from columnar_store import read_dataset
+from job_store import PartitionedJobStore, active_mask, dataset_reference_time
+
+# Kolom job dataset yang dipakai chart dan filter (kolom lain tidak di-load)
+DASHBOARD_JOB_COLUMNS = ['title', 'company', 'location', 'salary_avg', 'experience_level', 'remote_option',
+                         'required_skills']
 
 # Page config
 st.set_page_config(
@@ -102,11 +116,26 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 @st.cache_data
-def load_data():
+def load_data(active_only=True):
     """Load cleaned data with caching"""
     try:
-        jobs_df = pd.read_csv('data/processed/it_jobs_cleaned.csv')
-        tech_df = pd.read_csv('data/processed/tech_trends_cleaned.csv')
+        # Compact schema (category + downcast): memory per dashboard process ~3x lebih kecil.
+        # Parquet dari cleaning menyimpan dtype, jadi hanya kolom yang dipakai yang dibaca
+        job_store = PartitionedJobStore('data/processed/it_jobs')
+        if job_store.exists():
+            # Partition per bulan posted_date: partition yang semua deadline-nya sudah lewat
+            # tidak dibuka, jadi load time sebanding dengan window job aktif
+            jobs_df = job_store.load(DASHBOARD_JOB_COLUMNS, active_only=active_only)
+            csv_rows = rows = None
+        else:
+            # Tanpa store: filter active yang sama dengan store, per row setelah load CSV/Parquet
+            jobs_df = read_dataset('data/processed/it_jobs_cleaned.csv', JOB_SCHEMA,
+                                   DASHBOARD_JOB_COLUMNS + (['application_deadline'] if active_only else []))
+            csv_rows, rows = len(jobs_df), np.arange(len(jobs_df))
+            if active_only:
+                rows = np.flatnonzero(active_mask(jobs_df, dataset_reference_time(jobs_df.attrs['metadata'])))
+                jobs_df = jobs_df.iloc[rows][DASHBOARD_JOB_COLUMNS].reset_index(drop=True)
+        tech_df = read_dataset('data/processed/tech_trends_cleaned.csv', TECH_SCHEMA)
         
         # Load quality report if exists
         try:
@@ -115,7 +144,16 @@ def load_data():
         except:
             quality_report = {}
         
-        return jobs_df, tech_df, quality_report
+        # Job × skill matrix dari cleaning (row i = job ke-i di CSV, diambil row yang lolos filter);
+        # job dari store urutannya per partition, jadi matrix di-build ulang dari job yang ter-load
+        skill_matrix = None
+        if rows is not None and os.path.exists('data/processed/it_jobs_skills.npz'):
+            skill_matrix = SkillMatrix.load('data/processed/it_jobs_skills.npz')
+            skill_matrix = skill_matrix.take_rows(rows) if len(skill_matrix) == csv_rows else None
+        if skill_matrix is None or len(skill_matrix) != len(jobs_df):
+            skill_matrix = SkillMatrix.from_skill_strings(jobs_df['required_skills'])
+        
+        return jobs_df, tech_df, quality_report, skill_matrix
     except FileNotFoundError:
         st.error("❌ Data files not found! Please run data collection and cleaning first.")
         st.stop()
@@ -144,7 +182,7 @@ def create_salary_analysis(df):
     
     with col2:
         # Salary by location
-        location_salary = df.groupby('location')['salary_avg'].mean().sort_values(ascending=False).head(10)
+        location_salary = df.groupby('location', observed=True)['salary_avg'].mean().sort_values(ascending=False).head(10)
         
         fig_salary_loc = px.bar(
             x=location_salary.values,
@@ -171,8 +209,8 @@ def create_salary_analysis(df):
         st.metric("Median Salary", f"Rp {median_salary:,.0f}")
     
     with col2:
-        highest_paying = df.groupby('title')['salary_avg'].mean().idxmax()
-        highest_salary = df.groupby('title')['salary_avg'].mean().max()
+        highest_paying = df.groupby('title', observed=True)['salary_avg'].mean().idxmax()
+        highest_salary = df.groupby('title', observed=True)['salary_avg'].mean().max()
         st.metric("Highest Paying Role", f"{highest_paying}", f"Rp {highest_salary:,.0f}")
     
     with col3:
@@ -180,16 +218,11 @@ def create_salary_analysis(df):
                          df[df['experience_level'] == 'Junior']['salary_avg'].mean() - 1) * 100)
         st.metric("Junior to Senior Growth", f"{salary_growth:.1f}%")
 
-def create_skills_analysis(df):
+def create_skills_analysis(df, skill_matrix):
     """Create skills demand analysis - FIXED VERSION"""
     
-    # Extract all skills
-    all_skills = []
-    for skills_str in df['required_skills'].dropna():
-        skills = [skill.strip() for skill in str(skills_str).split(',')]
-        all_skills.extend(skills)
-    
-    skill_counts = pd.Series(all_skills).value_counts().head(15)
+    # Skill counts langsung dari sparse matrix (tanpa split string per row)
+    skill_counts = skill_matrix.skill_counts().head(15)
     
     col1, col2 = st.columns(2)
     
@@ -213,11 +246,8 @@ def create_skills_analysis(df):
     
     with col2:
         # Skills by salary
-        skill_salary = {}
-        for skill in skill_counts.head(10).index:
-            mask = df['required_skills'].str.contains(skill, case=False, na=False)
-            if mask.any():
-                skill_salary[skill] = df[mask]['salary_avg'].mean()
+        skill_means = skill_matrix.skill_means(df['salary_avg'])
+        skill_salary = skill_means.reindex(skill_counts.head(10).index).dropna().to_dict()
         
         if skill_salary:
             skill_salary_df = pd.DataFrame(list(skill_salary.items()), 
@@ -250,12 +280,12 @@ def create_skills_analysis(df):
     data_skills = ['SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Python', 'Tableau']
     devops_skills = ['Docker', 'Kubernetes', 'AWS', 'Azure', 'Linux', 'Git']
     
-    categories = {
-        'Frontend': sum([skill_counts.get(skill, 0) for skill in frontend_skills]),
-        'Backend': sum([skill_counts.get(skill, 0) for skill in backend_skills]),
-        'Data & Analytics': sum([skill_counts.get(skill, 0) for skill in data_skills]),
-        'DevOps & Cloud': sum([skill_counts.get(skill, 0) for skill in devops_skills])
-    }
+    categories = skill_matrix.category_counts({
+        'Frontend': frontend_skills,
+        'Backend': backend_skills,
+        'Data & Analytics': data_skills,
+        'DevOps & Cloud': devops_skills
+    })
     
     fig_categories = px.pie(
         values=list(categories.values()),
@@ -429,7 +459,7 @@ def create_geographic_analysis(df):
     else:
         st.info("💡 **Market Opportunity**: No major IT job postings detected in Lampung. This represents a significant opportunity for Newus Technology to establish market leadership in the region!")
 
-def create_business_insights(df):
+def create_business_insights(df, skill_matrix):
     """Create business insights for Newus Technology - FINAL VERSION"""
     
     st.markdown("## 🎯 Strategic Insights for Newus Technology")
@@ -450,12 +480,7 @@ def create_business_insights(df):
     """, unsafe_allow_html=True)
     
     # Technology recommendations - ALL CONTENT IN HEADER BOX
-    top_skills = []
-    for skills_str in df['required_skills'].dropna():
-        skills = [skill.strip() for skill in str(skills_str).split(',')]
-        top_skills.extend(skills)
-    
-    skill_counts = pd.Series(top_skills).value_counts().head(10)
+    skill_counts = skill_matrix.skill_counts().head(10)
     
     # Build technology list HTML
     tech_list_html = "<p>Based on market demand analysis, Newus Technology should prioritize:</p><div style='display: flex; gap: 2rem;'><div style='flex: 1;'><ul>"
@@ -485,7 +510,7 @@ def create_business_insights(df):
     """, unsafe_allow_html=True)
     
     # Talent Acquisition Strategy - ALL CONTENT IN HEADER BOX
-    avg_salaries = df.groupby('experience_level')['salary_avg'].mean()
+    avg_salaries = df.groupby('experience_level', observed=True)['salary_avg'].mean()
     
     # Build salary list HTML
     salary_list_html = "<p>Competitive salary benchmarks for different experience levels:</p><ul>"
@@ -528,11 +553,15 @@ def main():
     st.markdown('<h1 class="main-header">💻 IT Market Analysis Dashboard</h1>', unsafe_allow_html=True)
     st.markdown('<p style="text-align: center; font-size: 1.2rem; color: #666;">Strategic Intelligence for Newus Technology - "New Experience With Us"</p>', unsafe_allow_html=True)
     
-    # Load data
-    jobs_df, tech_df, quality_report = load_data()
-    
     # Sidebar filters
     st.sidebar.header("🔍 Dashboard Filters")
+    active_only = st.sidebar.checkbox("Active jobs only (deadline not passed)", value=True)
+    
+    # Load data
+    jobs_df, tech_df, quality_report, skill_matrix = load_data(active_only)
+    if len(jobs_df) == 0:
+        st.warning("⚠️ No active job postings. Uncheck 'Active jobs only' to see all jobs.")
+        st.stop()
     
     # Experience level filter
     exp_levels = ['All'] + list(jobs_df['experience_level'].unique())
@@ -565,6 +594,12 @@ def main():
         (filtered_df['salary_avg'] <= max_salary)
     ]
     
+    # Category yang hilang karena filter tidak ikut muncul di chart
+    filtered_df = remove_unused_categories(filtered_df)
+    
+    # Row skill matrix mengikuti filter (index jobs_df = posisi row di matrix)
+    filtered_skills = skill_matrix.take_rows(filtered_df.index.to_numpy())
+    
     # Show filtered data info
     st.sidebar.markdown("---")
     st.sidebar.markdown(f"**📊 Showing {len(filtered_df)} of {len(jobs_df)} jobs**")
@@ -583,13 +618,13 @@ def main():
         create_salary_analysis(filtered_df)
     
     with tab3:
-        create_skills_analysis(filtered_df)
+        create_skills_analysis(filtered_df, filtered_skills)
     
     with tab4:
         create_geographic_analysis(filtered_df)
     
     with tab5:
-        create_business_insights(filtered_df)
+        create_business_insights(filtered_df, filtered_skills)
     
     # Footer
     st.markdown("---")
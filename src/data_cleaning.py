@@ -2,34 +2,438 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import glob
+import os
 import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from skill_matrix import SkillMatrix, load_vocabulary
+from stage_cache import StageCache, code_version
+from dedup_index import DedupIndex, key_hashes
+from near_duplicates import NearDuplicateDetector
+from date_parser import OUTPUT_DATE_FORMAT, parse_dates
+from schema import (JOB_SCHEMA, TECH_SCHEMA, METADATA_COLUMNS, apply_schema, split_metadata,
+                    load_metadata, migrate_metadata_columns, save_metadata)
+from data_profiler import DataProfiler
+from columnar_store import ParquetWriter, iter_dataset, write_parquet
+from job_store import PartitionedJobStore
+from snapshot_store import SINGLE_PARTITION, SnapshotStore, print_snapshot_summary
+
+def _lookup_scores(values, table, default=0):
+    """Score per row lewat lookup table atas categorical codes (bukan apply per row)"""
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    scores = np.array([table.get(value, default) for value in uniques] + [default], dtype=float)
+    return scores[codes]  # code -1 (NaN) → default di elemen terakhir
+
+# Standardize skill names
+SKILL_MAPPING = {
+    'javascript': 'JavaScript',
+    'python': 'Python',
+    'java': 'Java',
+    'php': 'PHP',
+    'react': 'React',
+    'vue': 'Vue.js',
+    'angular': 'Angular',
+    'node': 'Node.js',
+    'nodejs': 'Node.js',
+    'mysql': 'MySQL',
+    'postgresql': 'PostgreSQL',
+    'mongodb': 'MongoDB'
+}
+
+# Standardize experience levels
+EXPERIENCE_MAPPING = {
+    'junior': 'Junior',
+    'mid': 'Mid',
+    'senior': 'Senior',
+    'lead': 'Senior'
+}
+
+# Near-duplicate key di _remove_duplicates
+DUPLICATE_KEYS = ['company', 'title', 'location']
+
+# Output stage row-local per fingerprint row (lihat stage_cache.py)
+STAGE_CACHE_PATH = 'data/cache/cleaning/stage_cache.pkl'
+
+# Hash key (DUPLICATE_KEYS) job yang sudah ada di processed dataset
+DEDUP_INDEX_DIR = 'data/cache/dedup'
+
+# Folder (di output_dir) cleaned jobs yang dipartisi per bulan posted_date (lihat job_store.py)
+JOB_STORE_NAME = 'it_jobs'
+
+# Skill categories (substring match); bit ke-i di skill_category_mask = category ke-i
+SKILL_CATEGORIES = [
+    ('Frontend', ['react', 'vue', 'angular', 'javascript', 'html', 'css']),
+    ('Backend', ['python', 'java', 'php', 'node', 'django', 'laravel']),
+    ('Database', ['mysql', 'postgresql', 'mongodb', 'sql']),
+    ('DevOps', ['docker', 'kubernetes', 'aws', 'azure', 'devops']),
+    ('Data', ['pandas', 'numpy', 'tableau', 'powerbi', 'analytics'])
+]
+
+def _skill_category_mask(skill):
+    skill_lower = skill.lower()
+    
+    mask = 0
+    for bit, (_, keywords) in enumerate(SKILL_CATEGORIES):
+        if any(keyword in skill_lower for keyword in keywords):
+            mask |= 1 << bit
+    return mask
+
+def _group_statistics(df, columns, stat, by):
+    """Statistic per group untuk tiap row (frame selebar columns, sejajar dengan df).
+    
+    Semua columns dihitung dalam satu groupby; row dengan group key NaN dapat NaN.
+    Mode: nilai paling sering, kalau seri ambil yang terkecil (sama dengan Series.mode).
+    """
+    if not by:
+        if stat == 'mode':
+            modes = {col: df[col].mode() for col in columns}
+            return {col: mode.iloc[0] for col, mode in modes.items() if not mode.empty}
+        return df[columns].agg(stat).to_dict()
+    
+    if stat != 'mode':
+        return df.groupby(by, observed=True, sort=False)[columns].transform(stat)
+    
+    keys = df[by].reset_index(drop=True)
+    fills = {}
+    for col in columns:
+        counts = df.groupby(by + [col], observed=True, sort=False).size().rename('_count').reset_index()
+        counts = counts.sort_values(['_count', col], ascending=[False, True], kind='stable')
+        modes = counts.drop_duplicates(subset=by)[by + [col]]
+        fills[col] = keys.merge(modes, on=by, how='left')[col].to_numpy()
+    return pd.DataFrame(fills, index=df.index)
+
+def _standardize_experience_level(levels):
+    return levels.str.lower().map(EXPERIENCE_MAPPING).fillna(levels)
+
+def _statistics_from_counts(counts, stat, by):
+    """Statistic per group dari value counts (index by + [column], dijumlah dari semua chunk).
+    
+    Hasilnya sama dengan groupby(by)[column].<stat>() atas data lengkap; tanpa by
+    hasilnya satu nilai (None kalau kolom kosong). Mendukung 'median', 'mean', 'mode'.
+    """
+    col = counts.index.names[-1]
+    frame = counts.rename('_count').reset_index()
+    keys = list(by)
+    if not keys:
+        frame['_group'] = 0
+        keys = ['_group']
+    
+    if stat == 'mode':
+        frame = frame.sort_values(['_count', col], ascending=[False, True], kind='stable')
+        result = frame.drop_duplicates(subset=keys).set_index(keys)[col]
+    elif stat == 'mean':
+        frame['_sum'] = frame[col] * frame['_count']
+        sums = frame.groupby(keys)[['_sum', '_count']].sum()
+        result = sums['_sum'] / sums['_count']
+    elif stat == 'median':
+        # Nilai di rank tengah: row counts dengan rank [end - count, end) memuat rank tsb
+        frame = frame.sort_values(keys + [col], kind='stable')
+        end = frame.groupby(keys)['_count'].cumsum()
+        total = frame.groupby(keys)['_count'].transform('sum')
+        begin = end - frame['_count']
+        lower = frame[col].where((begin <= (total - 1) // 2) & ((total - 1) // 2 < end))
+        upper = frame[col].where((begin <= total // 2) & (total // 2 < end))
+        group_keys = [frame[key] for key in keys]
+        result = (lower.groupby(group_keys).first() + upper.groupby(group_keys).first()) / 2
+    else:
+        raise ValueError(f"Statistic '{stat}' tidak bisa dihitung dari chunk (pakai median, mean atau mode)")
+    
+    if not by:
+        return result.iloc[0] if len(result) else None
+    return result
+
+def _broadcast_statistics(df, stats, by):
+    """Statistic per group (hasil _statistics_from_counts) → fill value per row"""
+    if not by:
+        return {col: value for col, value in stats.items() if value is not None and not pd.isna(value)}
+    
+    table = pd.DataFrame(stats)
+    table.index = table.index.set_names(by)
+    table = table.reset_index()
+    table[by] = table[by].astype(object)
+    
+    keys = df[by].astype(object).reset_index(drop=True)
+    fills = keys.merge(table, on=by, how='left')
+    return pd.DataFrame({col: fills[col].to_numpy() for col in stats}, index=df.index)
+
+def _add_counts(total, counts):
+    return counts if total is None else total.add(counts, fill_value=0)
+
+def _merge_numeric_dtypes(dtypes, chunk_dtypes):
+    """Catat dtype numeric per kolom supaya semua chunk dibaca dengan dtype yang sama
+    seperti kalau file dibaca sekaligus (int di satu chunk + float di chunk lain → float).
+    None = kolom non-numeric (dtype dibiarkan)."""
+    for col, dtype in chunk_dtypes.items():
+        if col in dtypes and dtypes[col] is None:
+            continue
+        if dtype is None or not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+            dtypes[col] = None
+        else:
+            dtypes[col] = np.result_type(dtypes[col], dtype) if col in dtypes else dtype
+    return dtypes
+
+def _iter_csv_chunks(path, chunk_size, dtype=None):
+    """Baca CSV per chunk (chunk_size None = satu frame per file); path boleh satu
+    file atau folder partition (part-*.csv)"""
+    files = sorted(glob.glob(os.path.join(path, 'part-*.csv'))) if os.path.isdir(path) else [path]
+    dtype = {col: value for col, value in (dtype or {}).items() if value is not None}
+    for file in files:
+        if chunk_size is None:
+            yield pd.read_csv(file, dtype=dtype or None)
+            continue
+        for chunk in pd.read_csv(file, chunksize=chunk_size, dtype=dtype or None):
+            yield chunk
+
+def _merge_partial_stats(total, partial):
+    """Gabung dua hasil _partial_stats (counts dijumlah, dtype di-promote)"""
+    if total is None:
+        return partial
+    rules = []
+    for total_counts, partial_counts in zip(total['rules'], partial['rules']):
+        merged = dict(total_counts)
+        for col, counts in partial_counts.items():
+            merged[col] = _add_counts(merged.get(col), counts)
+        rules.append(merged)
+    
+    return {
+        'rules': rules,
+        'salary': _add_counts(total['salary'], partial['salary']),
+        'dtypes': _merge_numeric_dtypes(dict(total['dtypes']), partial['dtypes']),
+        'metadata': {col: _add_counts(total['metadata'].get(col), counts)
+                     for col, counts in partial['metadata'].items()}
+    }
+
+def _sum_skill_stats(parts):
+    """Gabung skill_cleaning_stats per chunk/partition (unique dihitung per bagian)"""
+    total = {'rows': 0, 'unique_values': 0, 'seconds': 0.0, 'estimated_seconds_saved': 0.0, 'cached_rows': 0}
+    for part in parts:
+        for key in total:
+            total[key] += part.get(key, 0)
+    total['unique_ratio'] = total['unique_values'] / total['rows'] if total['rows'] else 0.0
+    return total
+
+def _job_profiler():
+    """Profiler untuk quality report job dataset (percentile salary, top location/skill)"""
+    return DataProfiler(quantile_columns=['salary_min', 'salary_max', 'salary_avg'],
+                        heavy_hitter_columns=['location', 'experience_level'], skills_column='required_skills')
+
+def _latest_collection_date(collection_dates):
+    """Reference time untuk days_since_posted: collection date terbaru (now() kalau tidak ada)"""
+    latest = parse_dates(pd.Series(collection_dates, dtype=object))[0].max()
+    return pd.Timestamp(datetime.now()) if pd.isna(latest) else latest
+
+def _standardize_location(locations):
+    """Title case + alias kota ('dki jakarta' → 'Jakarta'); juga dipakai untuk key
+    partition parallel cleaning supaya varian penulisan masuk partition yang sama"""
+    locations = locations.str.title()
+    locations = locations.str.replace('Dki Jakarta', 'Jakarta')
+    return locations.str.replace('Yogyakarta', 'Yogya')
+
+def _first_occurrence(df, subset, seen):
+    """Mask row yang key-nya belum muncul di chunk ini maupun chunk sebelumnya.
+    
+    seen adalah sorted array hash (uint64) key yang sudah disimpan; return (mask, seen baru).
+    """
+    hashes = key_hashes(df, subset)
+    keep = ~pd.Series(hashes).duplicated().to_numpy() & ~np.isin(hashes, seen)
+    return keep, np.union1d(seen, hashes[keep])
+
+def _normalize_unique_skills(values):
+    """Normalize dan categorize tiap required_skills string (nilai unik).
+    
+    Keyword category tidak mengandung koma/spasi, jadi mask satu string = OR mask
+    per skill; hasil per skill token di-cache karena jumlahnya jauh lebih kecil lagi.
+    """
+    token_cache = {}
+    cleaned = []
+    masks = np.zeros(len(values), dtype=np.uint8)
+    
+    for i, skills_str in enumerate(values):
+        if pd.isna(skills_str) or skills_str == '':
+            skills_str = 'General Programming'
+        
+        # Map ke nama standar, buang duplikat (urutan pertama muncul tetap)
+        skills = {}
+        mask = 0
+        for token in str(skills_str).split(','):
+            entry = token_cache.get(token)
+            if entry is None:
+                skill = token.strip()
+                skill = SKILL_MAPPING.get(skill.lower(), skill)
+                entry = token_cache[token] = (skill, _skill_category_mask(skill))
+            skills[entry[0]] = None
+            mask |= entry[1]
+        
+        cleaned.append(', '.join(skills))
+        masks[i] = mask
+    
+    return cleaned, masks
+
+def _skill_category_name(mask):
+    """Bitmask → 'Frontend, Backend' (atau 'General' kalau kosong)"""
+    categories = [name for bit, (name, _) in enumerate(SKILL_CATEGORIES) if mask & (1 << bit)]
+    return ', '.join(categories) if categories else 'General'
 
 class ITJobDataCleaner:
-    def __init__(self):
+    # Location tier (based on typical salary levels)
+    TIER_1_CITIES = ['Jakarta', 'Remote']
+    TIER_2_CITIES = ['Bandung', 'Surabaya', 'Yogya']
+    
+    # Komponen attractiveness score per kategori
+    REMOTE_OPTION_SCORES = {'Remote': 20, 'Hybrid': 20}
+    COMPANY_SIZE_SCORES = {'Large (500+)': 10, 'Medium (50-500)': 5}
+    EXPERIENCE_SCORES = {'Mid': 40, 'Senior': 35}
+    
+    # Imputation rules, dijalankan berurutan (rule berikutnya hanya mengisi yang masih kosong):
+    # 'stat' = nama aggregation pandas ('median', 'mean', ...) atau 'mode', dihitung per
+    # group 'by' (kosong = global); 'value' = nilai konstan; 'default' = kalau stat kosong.
+    # Contoh group lebih detail: {'columns': [...], 'stat': 'median', 'by': ['experience_level', 'location']}
+    IMPUTATION_RULES = [
+        # Fill missing salary dengan median berdasarkan experience level
+        {'columns': ['salary_min', 'salary_max'], 'stat': 'median', 'by': ['experience_level']},
+        # Fill missing categorical dengan mode
+        {'columns': ['industry', 'company_size', 'employment_type', 'remote_option'], 'stat': 'mode',
+         'default': 'Unknown'},
+        # Fill missing skills
+        {'columns': ['required_skills'], 'value': 'General Programming'}
+    ]
+    
+    # Kolom yang dibaca stage 2-5 (input fingerprint stage cache)
+    ROW_LOCAL_COLUMNS = ['salary_min', 'salary_max', 'experience_level', 'location', 'required_skills',
+                         'posted_date', 'application_deadline', 'data_collection_date']
+    
+    def __init__(self, imputation_rules=None, verbose=True, stage_cache=None, near_duplicates=None,
+                 dedup_index=None):
+        self.imputation_rules = imputation_rules or self.IMPUTATION_RULES
+        self.verbose = verbose
+        self.stage_cache = stage_cache
+        self.near_duplicates = near_duplicates
+        self.dedup_index = dedup_index
         self.cleaned_data = None
         self.tech_data = None
         
-    def load_raw_data(self):
-        """Load raw data dari hasil collection"""
+        # Global stats dari pass 1 (chunked mode); None = dihitung dari DataFrame yang dibersihkan
+        self.imputation_stats = None
+        self.level_salary_means = None
+        self.reference_time = None
+        self.metadata_columns = METADATA_COLUMNS
+        
+        # Format tanggal per kolom, dideteksi sekali per run (dipakai ulang antar chunk)
+        self.date_formats = {}
+        
+        # Snapshot collection dari raw data ini (collection date dan dataset version ada di sana),
+        # atau metadata file raw data yang di-migrate dari layout lama kalau belum ada snapshot
+        self.collection_snapshot = None
+        self.raw_metadata = {}
+        
+        # Konstanta dataset (dataset_version, data_collection_date) dan bytes per row sebelum/sesudah schema
+        self.job_metadata = {}
+        self.memory_stats = {}
+        self.skill_matrix = None
+        
+        # Profile single-pass untuk quality report (di-update per chunk di chunked mode)
+        self.job_profile = None
+        self.tech_profile = None
+    
+    def _log(self, message):
+        if self.verbose:
+            print(message)
+    
+    def use_collection_snapshot(self, version):
+        """Raw data dari collection ini tidak membawa data_collection_date/dataset_version
+        per row: keduanya diambil dari snapshot version-nya"""
+        self.collection_snapshot = version
+    
+    def use_raw_metadata(self, jobs_path):
+        """Tanpa snapshot collection: dataset_version/data_collection_date dari metadata file
+        raw data (ditulis migrate_metadata_columns untuk raw data layout lama)"""
+        self.raw_metadata = load_metadata(jobs_path)['metadata']
+    
+    def _snapshot_metadata(self):
+        if self.collection_snapshot is None:
+            return {col: self.raw_metadata[col] for col in METADATA_COLUMNS if col in self.raw_metadata}
+        return {'dataset_version': self.collection_snapshot['id'],
+                'data_collection_date': self.collection_snapshot['metadata'].get('data_collection_date')}
+    
+    def _collection_dates(self, row_dates):
+        """Collection date dari kolom per row (raw data lama), snapshot collection atau
+        metadata file raw data"""
+        collection_date = self._snapshot_metadata().get('data_collection_date')
+        if len(row_dates) or collection_date is None:
+            return row_dates
+        return [collection_date]
+        
+    def load_raw_data(self, jobs_path='data/raw/it_jobs_raw.csv', tech_path='data/raw/tech_trends_raw.csv'):
+        """Load raw data dari hasil collection (file CSV atau folder partition)"""
         print("📥 Loading raw data...")
         
-        self.raw_jobs = pd.read_csv('data/raw/it_jobs_raw.csv')
-        self.raw_tech = pd.read_csv('data/raw/tech_trends_raw.csv')
+        self.raw_jobs = pd.concat(_iter_csv_chunks(jobs_path, None), ignore_index=True)
+        self.raw_tech = pd.concat(_iter_csv_chunks(tech_path, None), ignore_index=True)
         
         print(f"✅ Loaded {len(self.raw_jobs)} job records")
         print(f"✅ Loaded {len(self.raw_tech)} tech trend records")
         
         return self.raw_jobs, self.raw_tech
     
-    def clean_job_data(self):
-        """Comprehensive cleaning untuk job dataset"""
+    def clean_job_data(self, workers=None, n_partitions=None):
+        """Comprehensive cleaning untuk job dataset (workers = parallel di process pool)"""
         print("🧹 Cleaning job dataset...")
         
-        df = self.raw_jobs.copy()
+        if workers:
+            df = self._clean_jobs_parallel(workers, n_partitions or 4 * workers)
+        else:
+            df = self.raw_jobs.copy()
+            self._pin_reference_time(df)
+            
+            # 1-6. Imputation, cleaning dan derived features
+            df = self._transform_jobs(df)
+            
+            # 7. Remove duplicates
+            df = self._remove_duplicates(df)
+        
+        # 7b. Near-duplicates (repost dengan wording berbeda), opsional
+        if self.near_duplicates is not None:
+            df = self._remove_near_duplicates(df)
+        
+        # 8. Intern skills → job × skill sparse matrix (row i = job ke-i)
+        self.skill_matrix = SkillMatrix.from_skill_strings(df['required_skills'])
         
+        # 9. Compact schema: category + downcast numerics, konstanta dataset → metadata
+        df = self._compact_jobs(df)
+        
+        self.cleaned_jobs = df
+        print(f"✅ Job data cleaned: {len(df)} records remaining")
+        
+        return df
+    
+    def _transform_jobs(self, df):
+        """Stage 1-6 untuk job records (tanpa dedup); dipakai in-memory dan per chunk"""
         # 1. Handle missing values
         df = self._handle_missing_values(df)
         
+        # 2-5. Stage row-local; dengan stage cache hanya row baru/berubah yang diproses
+        if self.stage_cache is not None:
+            self.skill_cleaning_stats = _sum_skill_stats([])  # tetap 0 kalau semua row cache hit
+            hits = self.stage_cache.hits
+            df = self.stage_cache.apply(df, self._row_local_stages, self.ROW_LOCAL_COLUMNS)
+            # Row cache hit tidak di-normalize ulang: dilaporkan terpisah di summary
+            self.skill_cleaning_stats['cached_rows'] = self.stage_cache.hits - hits
+        else:
+            df = self._row_local_stages(df)
+        
+        # Days since posted tergantung reference_time, jadi tidak ikut di-cache
+        df = self._add_days_since_posted(df)
+        
+        # 6. Create derived features (butuh statistik per group, selalu dihitung ulang)
+        df = self._create_derived_features(df)
+        
+        return df
+    
+    def _row_local_stages(self, df):
+        """Stage 2-5: output tiap row hanya tergantung row itu sendiri"""
         # 2. Clean salary data
         df = self._clean_salary_data(df)
         
@@ -42,16 +446,128 @@ class ITJobDataCleaner:
         # 5. Fix date columns
         df = self._clean_date_columns(df)
         
-        # 6. Create derived features
-        df = self._create_derived_features(df)
-        
-        # 7. Remove duplicates
-        df = self._remove_duplicates(df)
+        return df
+    
+    def _clean_jobs_parallel(self, workers, n_partitions):
+        """Parallel cleaning: hash partition raw jobs, stats global dari partial aggregates.
+        
+        Partition ditentukan hash key dedup (company, title, location) setelah location
+        di-standardize seperti stage 3, jadi semua kandidat duplikat ada di partition yang
+        sama dan urutan aslinya tetap; dedup per partition + sort index = first occurrence
+        menang seperti _remove_duplicates.
+        """
+        print(f"   ⚡ Parallel cleaning: {n_partitions} partitions, {workers} workers")
+        
+        df = self.raw_jobs
+        keys = df[DUPLICATE_KEYS].astype(object).assign(location=_standardize_location(df['location'].astype(object)))
+        hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+        partition_ids = hashes % np.uint64(n_partitions)
+        partitions = [df[partition_ids == i] for i in range(n_partitions)]
+        partitions = [partition for partition in partitions if len(partition)]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Phase 1: partial aggregates per partition → merge → global stats
+            stats = None
+            for partial in executor.map(_partition_stats, [(self.imputation_rules, p) for p in partitions]):
+                stats = _merge_partial_stats(stats, partial)
+            self._set_global_stats(stats)
+            
+            # Phase 2: broadcast global stats, transform + dedup per partition
+            state = {
+                'imputation_rules': self.imputation_rules,
+                'imputation_stats': self.imputation_stats,
+                'level_salary_means': self.level_salary_means,
+                'reference_time': self.reference_time
+            }
+            results = list(executor.map(_clean_partition, [(state, p) for p in partitions]))
         
-        self.cleaned_jobs = df
-        print(f"✅ Job data cleaned: {len(df)} records remaining")
+        self.skill_cleaning_stats = _sum_skill_stats([skill_stats for _, skill_stats in results])
         
-        return df
+        return pd.concat([part for part, _ in results]).sort_index()
+    
+    def compute_global_stats(self, jobs_path, chunk_size=100000):
+        """Pass 1 chunked cleaning: stream raw jobs dan hitung stats yang butuh seluruh data.
+        
+        Return (dtype numeric per kolom input, kolom output yang harus float) untuk pass 2.
+        """
+        stats = None
+        for chunk in _iter_csv_chunks(jobs_path, chunk_size):
+            stats = _merge_partial_stats(stats, self._partial_stats(chunk))
+        return self._set_global_stats(stats)
+    
+    def _salary_keys(self):
+        salary_keys = ['experience_level', 'salary_min', 'salary_max']
+        for rule in self.imputation_rules:
+            if set(rule['columns']) & {'salary_min', 'salary_max'}:
+                salary_keys += [key for key in rule.get('by', []) if key not in salary_keys]
+        return salary_keys
+    
+    def _partial_stats(self, df):
+        """Aggregate yang bisa di-merge (value counts) dari satu chunk atau partition.
+        
+        Value counts per imputation rule/group untuk median, mean dan mode (exact);
+        counts (experience_level, salary_min, salary_max) untuk salary mean per level.
+        """
+        rule_counts = []
+        for rule in self.imputation_rules:
+            counts = {}
+            if 'stat' in rule:
+                by = list(rule.get('by', []))
+                for col in rule['columns']:
+                    if col in df.columns:
+                        counts[col] = df.groupby(by + [col], observed=True).size() if by else df[col].value_counts()
+            rule_counts.append(counts)
+        
+        dtypes = _merge_numeric_dtypes({}, df.dtypes)
+        metadata = {col: df[col].value_counts(dropna=False) for col in METADATA_COLUMNS if col in df.columns}
+        keys = self._salary_keys()
+        if 'posted_date' in df.columns:
+            posted, self.date_formats['posted_date'] = parse_dates(df['posted_date'], self.date_formats.get('posted_date'))
+            df = df[keys].assign(_posted_missing=posted.isna())
+            keys = keys + ['_posted_missing']
+        
+        return {
+            'rules': rule_counts,
+            'salary': df.groupby(keys, dropna=False, observed=True).size(),
+            'dtypes': dtypes,
+            'metadata': metadata
+        }
+    
+    def _set_global_stats(self, stats):
+        """Global stats dari partial aggregates yang sudah di-merge.
+        
+        Rata-rata salary per level untuk salary_competitiveness bergantung pada hasil
+        imputation dan filter salary, jadi tabel counts salary di-impute dan di-filter
+        dengan stage yang sama, lalu diambil weighted mean per level.
+        """
+        self.imputation_stats = [
+            {col: _statistics_from_counts(col_counts, rule['stat'], rule.get('by', []))
+             for col, col_counts in counts.items()} if 'stat' in rule else None
+            for rule, counts in zip(self.imputation_rules, stats['rules'])
+        ]
+        
+        verbose, self.verbose = self.verbose, False
+        table = stats['salary'].rename('_count').reset_index()
+        table = self._clean_salary_data(self._handle_missing_values(table))
+        self.verbose = verbose
+        
+        levels = _standardize_experience_level(table['experience_level'])
+        weighted = (table['salary_avg'] * table['_count']).groupby(levels).sum()
+        self.level_salary_means = weighted / table['_count'].groupby(levels).sum()
+        
+        # Kolom metadata yang konstan di seluruh file dipindah ke metadata dataset
+        self.metadata_columns = [col for col, counts in stats['metadata'].items() if len(counts) <= 1]
+        if self.reference_time is None:
+            collection_dates = stats['metadata'].get('data_collection_date')
+            collection_dates = [] if collection_dates is None else collection_dates.index
+            self.reference_time = _latest_collection_date(self._collection_dates(collection_dates))
+        
+        # days_since_posted jadi float kalau ada posted_date kosong di row yang lolos filter
+        float_columns = []
+        if '_posted_missing' in table.columns and table['_posted_missing'].any():
+            float_columns.append('days_since_posted')
+        
+        return stats['dtypes'], float_columns
     
     def clean_tech_data(self):
         """Clean technology trends data"""
@@ -62,6 +578,15 @@ class ITJobDataCleaner:
         # Remove duplicates
         df = df.drop_duplicates()
         
+        df = apply_schema(self._transform_tech(df), TECH_SCHEMA)
+        
+        self.cleaned_tech = df
+        print(f"✅ Tech data cleaned: {len(df)} records remaining")
+        
+        return df
+    
+    def _transform_tech(self, df):
+        """Cleaning tech trends setelah dedup; dipakai in-memory dan per chunk"""
         # Clean technology names
         df['technology'] = df['technology'].str.strip()
         df['technology'] = df['technology'].str.title()
@@ -73,43 +598,34 @@ class ITJobDataCleaner:
         # Convert to IDR (approximate)
         df['salary_idr'] = df['salary_usd'] * 15000  # 1 USD = 15,000 IDR
         
-        self.cleaned_tech = df
-        print(f"✅ Tech data cleaned: {len(df)} records remaining")
-        
         return df
     
     def _handle_missing_values(self, df):
-        """Handle missing values dengan strategi yang tepat"""
-        print("   🔧 Handling missing values...")
+        """Handle missing values dengan strategi yang tepat (lihat IMPUTATION_RULES)"""
+        self._log("   🔧 Handling missing values...")
         
-        # Fill missing salary dengan median berdasarkan experience level
-        for level in df['experience_level'].unique():
-            mask = (df['experience_level'] == level)
+        for i, rule in enumerate(self.imputation_rules):
+            columns = [col for col in rule['columns'] if col in df.columns]
+            if not columns or not df[columns].isna().any().any():
+                continue
             
-            if df.loc[mask, 'salary_min'].isna().any():
-                median_min = df.loc[mask, 'salary_min'].median()
-                df.loc[mask, 'salary_min'] = df.loc[mask, 'salary_min'].fillna(median_min)
+            if 'value' in rule:
+                fills = rule['value']
+            elif self.imputation_stats is not None:
+                stats = {col: self.imputation_stats[i][col] for col in columns if col in self.imputation_stats[i]}
+                fills = _broadcast_statistics(df, stats, rule.get('by', []))
+            else:
+                fills = _group_statistics(df, columns, rule['stat'], rule.get('by', []))
             
-            if df.loc[mask, 'salary_max'].isna().any():
-                median_max = df.loc[mask, 'salary_max'].median()
-                df.loc[mask, 'salary_max'] = df.loc[mask, 'salary_max'].fillna(median_max)
-        
-        # Fill missing categorical dengan mode
-        categorical_cols = ['industry', 'company_size', 'employment_type', 'remote_option']
-        for col in categorical_cols:
-            if col in df.columns and df[col].isna().any():
-                mode_value = df[col].mode().iloc[0] if not df[col].mode().empty else 'Unknown'
-                df[col] = df[col].fillna(mode_value)
-        
-        # Fill missing skills
-        if 'required_skills' in df.columns:
-            df['required_skills'] = df['required_skills'].fillna('General Programming')
+            df[columns] = df[columns].fillna(fills)
+            if 'default' in rule:
+                df[columns] = df[columns].fillna(rule['default'])
         
         return df
     
     def _clean_salary_data(self, df):
         """Clean dan validate salary data"""
-        print("   💰 Cleaning salary data...")
+        self._log("   💰 Cleaning salary data...")
         
         # Ensure salary_min <= salary_max
         mask = df['salary_min'] > df['salary_max']
@@ -135,15 +651,7 @@ class ITJobDataCleaner:
     
     def _standardize_categories(self, df):
         """Standardize categorical variables"""
-        print("   📊 Standardizing categories...")
-        
-        # Standardize experience levels
-        exp_mapping = {
-            'junior': 'Junior',
-            'mid': 'Mid',
-            'senior': 'Senior',
-            'lead': 'Senior'
-        }
+        self._log("   📊 Standardizing categories...")
         
         # Standardize company sizes
         size_mapping = {
@@ -155,165 +663,152 @@ class ITJobDataCleaner:
         }
         
         # Apply mappings
-        df['experience_level'] = df['experience_level'].str.lower().map(exp_mapping).fillna(df['experience_level'])
+        df['experience_level'] = _standardize_experience_level(df['experience_level'])
         
         # Clean location names
-        df['location'] = df['location'].str.title()
-        df['location'] = df['location'].str.replace('Dki Jakarta', 'Jakarta')
-        df['location'] = df['location'].str.replace('Yogyakarta', 'Yogya')
+        df['location'] = _standardize_location(df['location'])
         
         return df
     
     def _clean_skills_data(self, df):
         """Clean dan standardize skills data"""
-        print("   🛠️ Cleaning skills data...")
-        
-        # Standardize skill names
-        skill_mapping = {
-            'javascript': 'JavaScript',
-            'python': 'Python',
-            'java': 'Java',
-            'php': 'PHP',
-            'react': 'React',
-            'vue': 'Vue.js',
-            'angular': 'Angular',
-            'node': 'Node.js',
-            'nodejs': 'Node.js',
-            'mysql': 'MySQL',
-            'postgresql': 'PostgreSQL',
-            'mongodb': 'MongoDB'
+        self._log("   🛠️ Cleaning skills data...")
+        
+        # required_skills banyak yang sama persis: normalize + categorize nilai unik saja
+        codes, uniques = pd.factorize(df['required_skills'], use_na_sentinel=True)
+        
+        start = time.perf_counter()
+        cleaned, masks = _normalize_unique_skills(list(uniques) + [np.nan])
+        elapsed = time.perf_counter() - start
+        
+        # Broadcast ke row (code -1 = NaN → elemen terakhir)
+        df['required_skills'] = np.array(cleaned, dtype=object)[codes]
+        df['skill_category_mask'] = masks[codes]
+        category_names = [_skill_category_name(mask) for mask in range(1 << len(SKILL_CATEGORIES))]
+        df['skill_category'] = np.array(category_names, dtype=object)[masks[codes]]
+        
+        n_rows, n_unique = len(df), len(uniques) + int((codes < 0).any())
+        self.skill_cleaning_stats = {
+            'rows': n_rows,
+            'unique_values': n_unique,
+            'unique_ratio': n_unique / n_rows if n_rows else 0.0,
+            'seconds': elapsed,
+            # Perkiraan: biaya normalize per nilai × row yang tidak perlu diproses ulang
+            'estimated_seconds_saved': elapsed / len(cleaned) * max(n_rows - n_unique, 0)
         }
         
-        def clean_skills(skills_str):
-            if pd.isna(skills_str) or skills_str == '':
-                return 'General Programming'
-            
-            # Split skills
-            skills = [skill.strip() for skill in str(skills_str).split(',')]
-            
-            # Clean each skill
-            cleaned_skills = []
-            for skill in skills:
-                skill_lower = skill.lower()
-                cleaned_skill = skill_mapping.get(skill_lower, skill)
-                if cleaned_skill not in cleaned_skills:
-                    cleaned_skills.append(cleaned_skill)
-            
-            return ', '.join(cleaned_skills)
-        
-        df['required_skills'] = df['required_skills'].apply(clean_skills)
-        
-        # Create skill categories
-        def categorize_skills(skills_str):
-            skills_lower = str(skills_str).lower()
-            
-            categories = []
-            if any(skill in skills_lower for skill in ['react', 'vue', 'angular', 'javascript', 'html', 'css']):
-                categories.append('Frontend')
-            if any(skill in skills_lower for skill in ['python', 'java', 'php', 'node', 'django', 'laravel']):
-                categories.append('Backend')
-            if any(skill in skills_lower for skill in ['mysql', 'postgresql', 'mongodb', 'sql']):
-                categories.append('Database')
-            if any(skill in skills_lower for skill in ['docker', 'kubernetes', 'aws', 'azure', 'devops']):
-                categories.append('DevOps')
-            if any(skill in skills_lower for skill in ['pandas', 'numpy', 'tableau', 'powerbi', 'analytics']):
-                categories.append('Data')
-            
-            return ', '.join(categories) if categories else 'General'
-        
-        df['skill_category'] = df['required_skills'].apply(categorize_skills)
-        
         return df
     
     def _clean_date_columns(self, df):
         """Clean date columns"""
-        print("   📅 Cleaning date columns...")
+        self._log("   📅 Cleaning date columns...")
         
         date_columns = ['posted_date', 'application_deadline', 'data_collection_date']
         
+        # Format dideteksi sekali per kolom, hanya tanggal unik yang di-parse
         for col in date_columns:
             if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
+                df[col], self.date_formats[col] = parse_dates(df[col], self.date_formats.get(col))
         
-        # Calculate days since posted
+        return df
+    
+    def _pin_reference_time(self, df):
+        """days_since_posted dihitung terhadap collection date terbaru, bukan waktu run,
+        jadi cleaning ulang data yang sama menghasilkan output yang sama"""
+        if self.reference_time is None:
+            collection_dates = df['data_collection_date'].unique() if 'data_collection_date' in df.columns else []
+            self.reference_time = _latest_collection_date(self._collection_dates(collection_dates))
+        return self.reference_time
+    
+    def _add_days_since_posted(self, df):
+        """Calculate days since posted (terhadap reference_time yang di-pin)"""
         if 'posted_date' in df.columns:
-            df['days_since_posted'] = (datetime.now() - df['posted_date']).dt.days
+            reference_time = self._pin_reference_time(df)
+            df['days_since_posted'] = (reference_time - df['posted_date']).dt.days
         
         return df
     
     def _create_derived_features(self, df):
         """Create additional useful features"""
-        print("   ⚙️ Creating derived features...")
+        self._log("   ⚙️ Creating derived features...")
         
         # Salary competitiveness score (compared to market average by level)
-        level_avg_salary = df.groupby('experience_level')['salary_avg'].mean()
-        df['salary_competitiveness'] = df.apply(
-            lambda row: row['salary_avg'] / level_avg_salary[row['experience_level']], 
-            axis=1
-        )
+        if self.level_salary_means is not None:
+            level_avg_salary = df['experience_level'].map(self.level_salary_means)
+        else:
+            level_avg_salary = df.groupby('experience_level')['salary_avg'].transform('mean')
+        df['salary_competitiveness'] = df['salary_avg'] / level_avg_salary
         
         # Location tier (based on typical salary levels)
-        tier_1_cities = ['Jakarta', 'Remote']
-        tier_2_cities = ['Bandung', 'Surabaya', 'Yogya']
-        
-        def get_city_tier(location):
-            if location in tier_1_cities:
-                return 'Tier 1'
-            elif location in tier_2_cities:
-                return 'Tier 2'
-            else:
-                return 'Tier 3'
-        
-        df['city_tier'] = df['location'].apply(get_city_tier)
+        df['city_tier'] = np.select(
+            [df['location'].isin(self.TIER_1_CITIES), df['location'].isin(self.TIER_2_CITIES)],
+            ['Tier 1', 'Tier 2'],
+            default='Tier 3'
+        ).astype(object)
         
         # Job attractiveness score (combination of factors)
-        def calculate_attractiveness(row):
-            score = 0
-            
-            # Salary factor (30%)
-            score += (row['salary_competitiveness'] - 1) * 30
-            
-            # Remote option factor (20%)
-            if row['remote_option'] in ['Remote', 'Hybrid']:
-                score += 20
-            
-            # Company size factor (10%)
-            if row['company_size'] == 'Large (500+)':
-                score += 10
-            elif row['company_size'] == 'Medium (50-500)':
-                score += 5
-            
-            # Experience match factor (40%)
-            if row['experience_level'] == 'Mid':
-                score += 40  # Most balanced
-            elif row['experience_level'] == 'Senior':
-                score += 35
-            else:
-                score += 30
-            
-            return max(0, min(100, score))  # Normalize to 0-100
+        # Salary factor (30%)
+        score = (df['salary_competitiveness'].to_numpy() - 1) * 30
+        # Remote option factor (20%)
+        score += _lookup_scores(df['remote_option'], self.REMOTE_OPTION_SCORES)
+        # Company size factor (10%)
+        score += _lookup_scores(df['company_size'], self.COMPANY_SIZE_SCORES)
+        # Experience match factor (40%), Mid paling balanced
+        score += _lookup_scores(df['experience_level'], self.EXPERIENCE_SCORES, default=30)
         
-        df['attractiveness_score'] = df.apply(calculate_attractiveness, axis=1)
+        df['attractiveness_score'] = np.clip(score, 0, 100)  # Normalize to 0-100
         
         return df
     
     def _remove_duplicates(self, df):
         """Remove duplicate records"""
-        print("   🔄 Removing duplicates...")
+        self._log("   🔄 Removing duplicates...")
         
         initial_count = len(df)
         
-        # Remove exact duplicates
-        df = df.drop_duplicates()
-        
-        # Remove near-duplicates (same company, title, location)
-        df = df.drop_duplicates(subset=['company', 'title', 'location'], keep='first')
+        # Same company, title, location (exact duplicate juga punya key yang sama,
+        # jadi drop_duplicates() atas semua kolom tidak perlu dijalankan terpisah)
+        df = df.drop_duplicates(subset=DUPLICATE_KEYS, keep='first')
         
         final_count = len(df)
         removed = initial_count - final_count
         
         if removed > 0:
-            print(f"   📉 Removed {removed} duplicate records")
+            self._log(f"   📉 Removed {removed} duplicate records")
+        
+        return df
+    
+    def _compact_jobs(self, df):
+        """Apply JOB_SCHEMA dan pindahkan kolom konstan ke self.job_metadata"""
+        before = df.memory_usage(deep=True).sum()
+        df, metadata = split_metadata(apply_schema(df, JOB_SCHEMA), self.metadata_columns)
+        self.job_metadata = self.job_metadata or {**self._snapshot_metadata(), **metadata,
+                                                  'reference_time': str(self.reference_time)}
+        
+        # Dijumlah per chunk di chunked mode
+        total = self.memory_stats or {'rows': 0, 'bytes_before': 0, 'bytes_after': 0}
+        self.memory_stats = {
+            'rows': total['rows'] + len(df),
+            'bytes_before': total['bytes_before'] + int(before),
+            'bytes_after': total['bytes_after'] + int(df.memory_usage(deep=True).sum())
+        }
+        self._log(f"   🗜️ Compact schema: {self._bytes_per_row('bytes_before'):.0f} → "
+                  f"{self._bytes_per_row('bytes_after'):.0f} bytes per row")
+        return df
+    
+    def _bytes_per_row(self, key):
+        rows = self.memory_stats.get('rows', 0)
+        return self.memory_stats[key] / rows if rows else 0.0
+    
+    def _remove_near_duplicates(self, df):
+        """Remove job yang di-repost dengan wording sedikit berbeda (MinHash/LSH)"""
+        self._log("   🔍 Detecting near-duplicates...")
+        
+        df = df[self.near_duplicates.find(df)]
+        
+        stats = self.near_duplicates.stats
+        self._log(f"   📉 Removed {stats['near_duplicates']} near-duplicate records "
+                  f"({stats['candidate_pairs']:,} candidate pairs, {stats['seconds_per_100k_rows']:.2f}s per 100k rows)")
         
         return df
     
@@ -321,93 +816,369 @@ class ITJobDataCleaner:
         """Generate comprehensive data quality report"""
         print("📋 Generating data quality report...")
         
+        # In-memory: profile seluruh DataFrame sebagai satu chunk
+        if self.job_profile is None:
+            self.job_profile = _job_profiler().update(self.cleaned_jobs, self.skill_matrix)
+        if self.tech_profile is None:
+            self.tech_profile = DataProfiler().update(self.cleaned_tech)
+        jobs, tech = self.job_profile, self.tech_profile
+        
         report = {
             'timestamp': datetime.now(),
             'job_dataset': {
-                'total_records': len(self.cleaned_jobs),
-                'total_columns': len(self.cleaned_jobs.columns),
-                'missing_values': self.cleaned_jobs.isnull().sum().sum(),
+                'total_records': jobs.rows,
+                'total_columns': len(jobs.dtypes),
+                'missing_values': jobs.missing_values(),
                 'duplicate_records': 0,
-                'data_types': self.cleaned_jobs.dtypes.value_counts().to_dict()
+                'data_types': jobs.data_types(),
+                'distinct_values': jobs.distinct_counts(),
+                'bytes_per_row': {
+                    'before': self._bytes_per_row('bytes_before'),
+                    'after': self._bytes_per_row('bytes_after')
+                },
+                'metadata': self.job_metadata
             },
             'tech_dataset': {
-                'total_records': len(self.cleaned_tech),
-                'total_columns': len(self.cleaned_tech.columns),
-                'missing_values': self.cleaned_tech.isnull().sum().sum(),
-                'unique_technologies': self.cleaned_tech['technology'].nunique()
+                'total_records': tech.rows,
+                'total_columns': len(tech.dtypes),
+                'missing_values': tech.missing_values(),
+                'unique_technologies': tech.distinct_counts().get('technology'),
+                'bytes_per_row': tech.bytes_per_row()
             },
             'business_insights': {
                 'salary_range': {
-                    'min': self.cleaned_jobs['salary_min'].min(),
-                    'max': self.cleaned_jobs['salary_max'].max(),
-                    'average': self.cleaned_jobs['salary_avg'].mean()
+                    'min': jobs.minimum('salary_min'),
+                    'max': jobs.maximum('salary_max'),
+                    'average': jobs.mean('salary_avg')
                 },
-                'top_locations': self.cleaned_jobs['location'].value_counts().head().to_dict(),
-                'top_skills': self._get_top_skills(),
-                'experience_distribution': self.cleaned_jobs['experience_level'].value_counts().to_dict()
+                # Approximate (quantile sketch)
+                'salary_percentiles': {col: jobs.percentiles(col) for col in jobs.quantiles},
+                'top_locations': jobs.top('location', 5),
+                'top_skills': jobs.top('skills', 10),
+                'experience_distribution': jobs.top('experience_level')
             }
         }
         
+        if self.stage_cache is not None:
+            report['stage_cache'] = self.stage_cache.stats()
+        if self.near_duplicates is not None:
+            report['near_duplicates'] = self.near_duplicates.stats
+        if self.dedup_index is not None:
+            report['dedup_index'] = self.dedup_index.stats()
+        
         return report
     
-    def _get_top_skills(self):
-        """Extract top skills from dataset"""
-        all_skills = []
-        for skills_str in self.cleaned_jobs['required_skills'].dropna():
-            skills = [skill.strip() for skill in str(skills_str).split(',')]
-            all_skills.extend(skills)
+    def save_cleaned_jobs(self, output_dir='data/processed'):
+        """Job CSV + metadata file + skill matrix (juga dipakai stage clean_jobs di pipeline)"""
+        jobs_output = os.path.join(output_dir, 'it_jobs_cleaned.csv')
+        self.cleaned_jobs.to_csv(jobs_output, index=False, date_format=OUTPUT_DATE_FORMAT)
+        save_metadata(jobs_output, self.job_metadata, self.cleaned_jobs, memory_stats=self.memory_stats)
+        write_parquet(self.cleaned_jobs, jobs_output, self.job_metadata)
+        PartitionedJobStore(os.path.join(output_dir, JOB_STORE_NAME)).write(self.cleaned_jobs, self.job_metadata)
+        # Skill id dari run sebelumnya dipertahankan, skill baru di belakang
+        skills_output = os.path.join(output_dir, 'it_jobs_skills.npz')
+        self.skill_matrix = SkillMatrix.concat([self.skill_matrix], load_vocabulary(skills_output))
+        self.skill_matrix.save(skills_output)
+        
+        # Index key job yang sekarang ada di processed dataset (untuk incremental cleaning)
+        if self.dedup_index is not None:
+            self.dedup_index.rebuild(key_hashes(self.cleaned_jobs, DUPLICATE_KEYS))
+    
+    def save_cleaned_tech(self, output_dir='data/processed'):
+        tech_output = os.path.join(output_dir, 'tech_trends_cleaned.csv')
+        self.cleaned_tech.to_csv(tech_output, index=False)
+        write_parquet(self.cleaned_tech, tech_output)
+    
+    def save_quality_report(self, path='data/processed/data_quality_report.json'):
+        report = self.generate_data_quality_report()
         
-        skill_counts = pd.Series(all_skills).value_counts()
-        return skill_counts.head(10).to_dict()
+        import json
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+        return report
     
     def save_cleaned_data(self):
         """Save cleaned datasets"""
         print("💾 Saving cleaned data...")
         
         # Save main dataset
-        self.cleaned_jobs.to_csv('data/processed/it_jobs_cleaned.csv', index=False)
-        self.cleaned_tech.to_csv('data/processed/tech_trends_cleaned.csv', index=False)
+        self.save_cleaned_jobs()
+        self.save_cleaned_tech()
         
         # Save data quality report
-        report = self.generate_data_quality_report()
-        
-        import json
-        with open('data/processed/data_quality_report.json', 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        self.save_quality_report()
         
         print("✅ Cleaned data saved successfully!")
         print(f"📁 Job dataset: data/processed/it_jobs_cleaned.csv ({len(self.cleaned_jobs)} records)")
         print(f"📁 Tech dataset: data/processed/tech_trends_cleaned.csv ({len(self.cleaned_tech)} records)")
+        print(f"📁 Partitioned jobs: data/processed/{JOB_STORE_NAME}/ (per posted_date month)")
+        print(f"📁 Skill matrix: data/processed/it_jobs_skills.npz "
+              f"({len(self.skill_matrix.vocabulary)} skills, {self.skill_matrix.nnz} job-skill pairs)")
         print(f"📁 Quality report: data/processed/data_quality_report.json")
         
         return self.cleaned_jobs, self.cleaned_tech
 
-def main():
+def _partition_stats(task):
+    """Phase 1 parallel cleaning (worker): partial aggregates satu partition"""
+    imputation_rules, partition = task
+    return ITJobDataCleaner(imputation_rules, verbose=False)._partial_stats(partition)
+
+def _clean_partition(task):
+    """Phase 2 parallel cleaning (worker): stage 1-7 satu partition dengan global stats"""
+    state, partition = task
+    cleaner = ITJobDataCleaner(state['imputation_rules'], verbose=False)
+    cleaner.imputation_stats = state['imputation_stats']
+    cleaner.level_salary_means = state['level_salary_means']
+    cleaner.reference_time = state['reference_time']
+    
+    df = cleaner._remove_duplicates(cleaner._transform_jobs(partition.copy()))
+    return df, cleaner.skill_cleaning_stats
+
+def run_chunked_cleaning(cleaner, jobs_path='data/raw/it_jobs_raw.csv',
+                         tech_path='data/raw/tech_trends_raw.csv', output_dir='data/processed',
+                         chunk_size=100000):
+    """Out-of-core cleaning dalam dua pass untuk raw file yang lebih besar dari RAM.
+    
+    Pass 1 menghitung global stats (imputation, salary mean per level), pass 2 stream
+    ulang, menjalankan stage row-local per chunk dan append ke output. Dedup memakai
+    hash key yang sudah ditulis, jadi row pertama tetap menang lintas chunk.
+    """
+    print(f"🌊 Chunked cleaning: chunk_size={chunk_size:,}")
+    verbose, cleaner.verbose = cleaner.verbose, False
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Pass 1: global statistics
+    print("   1️⃣ Pass 1: computing global statistics...")
+    job_dtypes, float_columns = cleaner.compute_global_stats(jobs_path, chunk_size)
+    tech_dtypes = {}
+    for chunk in _iter_csv_chunks(tech_path, chunk_size):
+        _merge_numeric_dtypes(tech_dtypes, chunk.dtypes)
+    
+    # Pass 2: transform per chunk dan append ke output
+    print("   2️⃣ Pass 2: cleaning chunks...")
+    jobs_output = os.path.join(output_dir, 'it_jobs_cleaned.csv')
+    jobs_parquet = ParquetWriter(jobs_output)
+    job_store = PartitionedJobStore(os.path.join(output_dir, JOB_STORE_NAME))
+    job_store.begin()
+    seen = np.zeros(0, dtype=np.uint64)
+    skill_parts = []
+    cleaner.job_profile, cleaner.tech_profile = _job_profiler(), DataProfiler()
+    skill_stats = []
+    raw_jobs = cleaned_jobs = 0
+    
+    for i, chunk in enumerate(_iter_csv_chunks(jobs_path, chunk_size, dtype=job_dtypes)):
+        raw_jobs += len(chunk)
+        chunk = cleaner._transform_jobs(chunk)
+        chunk[float_columns] = chunk[float_columns].astype(float)
+        skill_stats.append(cleaner.skill_cleaning_stats)
+        
+        keep, seen = _first_occurrence(chunk, DUPLICATE_KEYS, seen)
+        chunk = cleaner._compact_jobs(chunk[keep])
+        chunk.to_csv(jobs_output, mode='w' if i == 0 else 'a', header=i == 0, index=False,
+                     date_format=OUTPUT_DATE_FORMAT)
+        jobs_parquet.write(chunk)
+        job_store.write_chunk(chunk)
+        skill_parts.append(SkillMatrix.from_skill_strings(chunk['required_skills']))
+        cleaner.job_profile.update(chunk, skill_parts[-1])
+        cleaned_jobs += len(chunk)
+        print(f"   💾 {raw_jobs:,} job records processed, {cleaned_jobs:,} written")
+    save_metadata(jobs_output, cleaner.job_metadata, chunk, memory_stats=cleaner.memory_stats)
+    jobs_parquet.close(cleaner.job_metadata)
+    job_store.commit(cleaner.job_metadata)
+    
+    tech_output = os.path.join(output_dir, 'tech_trends_cleaned.csv')
+    tech_parquet = ParquetWriter(tech_output)
+    job_seen, seen = seen, np.zeros(0, dtype=np.uint64)
+    raw_tech = cleaned_tech = 0
+    for i, chunk in enumerate(_iter_csv_chunks(tech_path, chunk_size, dtype=tech_dtypes)):
+        raw_tech += len(chunk)
+        keep, seen = _first_occurrence(chunk, None, seen)
+        chunk = apply_schema(cleaner._transform_tech(chunk[keep]), TECH_SCHEMA)
+        chunk.to_csv(tech_output, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+        tech_parquet.write(chunk)
+        cleaner.tech_profile.update(chunk)
+        cleaned_tech += len(chunk)
+    tech_parquet.close()
+    
+    skills_output = os.path.join(output_dir, 'it_jobs_skills.npz')
+    cleaner.skill_matrix = SkillMatrix.concat(skill_parts, load_vocabulary(skills_output))
+    cleaner.skill_matrix.save(skills_output)
+    if cleaner.dedup_index is not None:
+        cleaner.dedup_index.rebuild(job_seen)
+    
+    cleaner.skill_cleaning_stats = _sum_skill_stats(skill_stats)
+    cleaner.verbose = verbose
+    cleaner.save_quality_report(os.path.join(output_dir, 'data_quality_report.json'))
+    
+    print("✅ Cleaned data saved successfully!")
+    print(f"📁 Job dataset: {jobs_output} ({cleaned_jobs:,} records)")
+    print(f"📁 Tech dataset: {tech_output} ({cleaned_tech:,} records)")
+    print(f"📁 Skill matrix: {os.path.join(output_dir, 'it_jobs_skills.npz')} "
+          f"({len(cleaner.skill_matrix.vocabulary)} skills, {cleaner.skill_matrix.nnz} job-skill pairs)")
+    print(f"📁 Quality report: {os.path.join(output_dir, 'data_quality_report.json')}")
+    
+    return {
+        'raw_job_records': raw_jobs,
+        'job_records': cleaned_jobs,
+        'raw_tech_records': raw_tech,
+        'tech_records': cleaned_tech
+    }
+
+def run_incremental_cleaning(cleaner, new_rows_path='data/raw/it_jobs_new.csv', output_dir='data/processed'):
+    """Clean hanya row baru dari incremental collection dan append ke processed dataset.
+    
+    Duplicate terhadap job yang sudah ada dicek lewat persistent DedupIndex, jadi
+    processed CSV tidak dibaca ulang: biaya sebanding dengan jumlah row baru.
+    Imputation dan salary competitiveness memakai statistik batch baru.
+    """
+    print(f"⏩ Incremental cleaning: {new_rows_path}")
+    cleaner.raw_jobs = pd.read_csv(new_rows_path)
+    
+    df = cleaner._remove_duplicates(cleaner._transform_jobs(cleaner.raw_jobs.copy()))
+    if cleaner.near_duplicates is not None:
+        df = cleaner._remove_near_duplicates(df)
+    
+    keep, hashes = cleaner.dedup_index.filter_new(df, DUPLICATE_KEYS)
+    df = cleaner._compact_jobs(df[keep])
+    print(f"   🔁 {int((~keep).sum())} jobs already in processed dataset, {len(df)} new")
+    
+    # Append dengan urutan kolom processed dataset yang sudah ada
+    jobs_output = os.path.join(output_dir, 'it_jobs_cleaned.csv')
+    migrate_metadata_columns(jobs_output)
+    exists = os.path.exists(jobs_output)
+    if exists:
+        df = df.reindex(columns=pd.read_csv(jobs_output, nrows=0).columns)
+    df.to_csv(jobs_output, mode='a' if exists else 'w', header=not exists, index=False,
+              date_format=OUTPUT_DATE_FORMAT)
+    cleaner.cleaned_jobs = df
+    # Store partisi: hanya partition posted_date yang dapat row baru ditulis ulang
+    job_store = PartitionedJobStore(os.path.join(output_dir, JOB_STORE_NAME))
+    if job_store.exists():
+        job_store.append(df)
+    
+    skills_output = os.path.join(output_dir, 'it_jobs_skills.npz')
+    skill_parts = [SkillMatrix.load(skills_output)] if exists and os.path.exists(skills_output) else []
+    cleaner.skill_matrix = SkillMatrix.concat(skill_parts + [SkillMatrix.from_skill_strings(df['required_skills'])],
+                                              load_vocabulary(skills_output))
+    cleaner.skill_matrix.save(skills_output)
+    
+    # Index baru di-update setelah output tersimpan
+    cleaner.dedup_index.add(hashes)
+    
+    print(f"📁 Job dataset: {jobs_output} (+{len(df):,} records)")
+    print(f"📁 Skill matrix: {skills_output} ({len(cleaner.skill_matrix):,} jobs)")
+    
+    return {
+        'raw_job_records': len(cleaner.raw_jobs),
+        'job_records': len(df)
+    }
+
+def record_cleaning_snapshot(cleaner, tables, append=False, store=None):
+    """Catat cleaning run sebagai snapshot version (metadata = metadata dataset job).
+    
+    tables = {'jobs': ..., 'tech': ...} (DataFrame atau iterable (partition key, DataFrame
+    atau iterator chunk));
+    append=True: job baru ditambahkan ke version cleaning terakhir (incremental).
+    """
+    store = store or SnapshotStore()
+    if append:
+        version = store.append('cleaning', 'jobs', tables['jobs'], cleaner.job_metadata)
+    else:
+        version = store.commit('cleaning', tables, cleaner.job_metadata)
+    print_snapshot_summary(store, version)
+    return version
+
+def open_stage_cache(path=STAGE_CACHE_PATH):
+    """Stage cache untuk versi code cleaning saat ini (cache lama otomatis invalid)"""
+    return StageCache(path, version=code_version(sys.modules[__name__], sys.modules[StageCache.__module__],
+                                                 sys.modules[parse_dates.__module__]))
+
+def main(chunk_size=None, workers=None, jobs_path='data/raw/it_jobs_raw.csv', tech_path='data/raw/tech_trends_raw.csv',
+         use_cache=True, near_duplicates=False, incremental=False):
     """Main function untuk data cleaning"""
     print("🧹 Starting Data Cleaning Process...")
     print("=" * 50)
     
-    # Initialize cleaner
-    cleaner = ITJobDataCleaner()
+    # Initialize cleaner (stage cache tidak dipakai worker process pool)
+    stage_cache = open_stage_cache() if use_cache and not workers else None
+    cleaner = ITJobDataCleaner(
+        stage_cache=stage_cache,
+        near_duplicates=NearDuplicateDetector() if near_duplicates else None,
+        dedup_index=DedupIndex(DEDUP_INDEX_DIR)
+    )
+    snapshots = SnapshotStore()
+    collection = snapshots.latest('collection')
+    if collection is not None:
+        cleaner.use_collection_snapshot(collection)
+    else:
+        cleaner.use_raw_metadata(jobs_path)
     
-    # Load raw data
-    raw_jobs, raw_tech = cleaner.load_raw_data()
-    
-    # Clean datasets
-    cleaned_jobs = cleaner.clean_job_data()
-    cleaned_tech = cleaner.clean_tech_data()
-    
-    # Generate and save results
-    final_jobs, final_tech = cleaner.save_cleaned_data()
+    if incremental:
+        # Hanya row baru dari incremental collection; tech dataset tidak berubah
+        summary = run_incremental_cleaning(cleaner)
+        raw_counts = (summary['raw_job_records'], 0)
+        final_counts = (summary['job_records'], 0)
+        final_jobs = final_tech = None
+        record_cleaning_snapshot(cleaner, {'jobs': cleaner.cleaned_jobs}, append=True, store=snapshots)
+    elif chunk_size:
+        # Out-of-core: raw file tidak pernah dibaca sekaligus
+        summary = run_chunked_cleaning(cleaner, jobs_path, tech_path, chunk_size=chunk_size)
+        raw_counts = (summary['raw_job_records'], summary['raw_tech_records'])
+        final_counts = (summary['job_records'], summary['tech_records'])
+        final_jobs = final_tech = None
+        # Output dibaca ulang per chunk (partition posted_date juga tidak pernah utuh di memory)
+        job_store = PartitionedJobStore(os.path.join('data/processed', JOB_STORE_NAME))
+        tech_output = os.path.join('data/processed', 'tech_trends_cleaned.csv')
+        record_cleaning_snapshot(cleaner, {
+            'jobs': job_store.iter_partitions(chunk_size=chunk_size),
+            'tech': [(SINGLE_PARTITION, iter_dataset(tech_output, TECH_SCHEMA, chunk_size))]
+        }, store=snapshots)
+    else:
+        # Load raw data
+        raw_jobs, raw_tech = cleaner.load_raw_data(jobs_path, tech_path)
+        
+        # Clean datasets
+        cleaned_jobs = cleaner.clean_job_data(workers=workers)
+        cleaned_tech = cleaner.clean_tech_data()
+        
+        # Generate and save results
+        final_jobs, final_tech = cleaner.save_cleaned_data()
+        raw_counts = (len(raw_jobs), len(raw_tech))
+        final_counts = (len(final_jobs), len(final_tech))
+        record_cleaning_snapshot(cleaner, {'jobs': final_jobs, 'tech': final_tech}, store=snapshots)
     
     # Print summary
     print("\n📊 Cleaning Summary:")
-    print(f"Jobs: {len(raw_jobs)} → {len(final_jobs)} records")
-    print(f"Tech: {len(raw_tech)} → {len(final_tech)} records")
+    print(f"Jobs: {raw_counts[0]} → {final_counts[0]} records")
+    print(f"Tech: {raw_counts[1]} → {final_counts[1]} records")
+    
+    skill_stats = cleaner.skill_cleaning_stats
+    cached_rows = skill_stats.get('cached_rows', 0)
+    if skill_stats['rows'] == 0 and cached_rows:
+        print(f"Skills: all {cached_rows:,} rows served from stage cache (no skills normalized)")
+    else:
+        print(f"Skills: {skill_stats['unique_values']:,} unique of {skill_stats['rows']:,} rows "
+              f"({skill_stats['unique_ratio']:.1%}), ~{skill_stats['estimated_seconds_saved']:.3f}s saved "
+              f"by normalizing unique values once"
+              + (f", {cached_rows:,} more rows from stage cache" if cached_rows else ""))
+    print(f"Memory: {cleaner._bytes_per_row('bytes_before'):.0f} → {cleaner._bytes_per_row('bytes_after'):.0f} "
+          f"bytes per job row with compact schema")
+    
+    if stage_cache is not None:
+        # Incremental run hanya melihat batch baru: entry full dataset tetap disimpan
+        stage_cache.save(prune=not incremental)
+        cache_stats = stage_cache.stats()
+        print(f"Stage cache: {cache_stats['hits']:,} hits, {cache_stats['misses']:,} misses "
+              f"({cache_stats['hit_rate']:.1%} hit rate), {cache_stats['entries']:,} entries")
+    
+    if cleaner.near_duplicates is not None and cleaner.near_duplicates.stats:
+        near_stats = cleaner.near_duplicates.stats
+        print(f"Near-duplicates: {near_stats['near_duplicates']:,} removed, {near_stats['candidate_pairs']:,} "
+              f"candidate pairs examined, {near_stats['seconds_per_100k_rows']:.2f}s per 100k rows")
     
     print("\n✅ Data cleaning completed successfully!")
     
     return final_jobs, final_tech
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -6,17 +6,113 @@ import time
 from datetime import datetime, timedelta
 import json
 import random
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from scraping import LISTING_COLUMNS, AsyncListingFetcher
+from http_cache import HTTPResponseCache
+from watermarks import WatermarkStore
+from survey_loader import SurveyTechTable, load_survey_chunked
+from skill_matcher import DEFAULT_SKILL_ALIASES, SkillMatcher
+from salary_parser import parse_salary_text
+from schema import metadata_path, migrate_metadata_columns
+from snapshot_store import SnapshotStore, print_snapshot_summary
+
+# Urutan kolom it_jobs_raw.csv (generated data + scraped data). Collection date dan
+# dataset version tidak lagi di tiap row: dicatat di snapshot version (snapshot_store.py)
+RAW_JOB_COLUMNS = [
+    'job_id', 'title', 'company', 'location', 'industry', 'salary_min', 'salary_max',
+    'experience_level', 'experience_years_min', 'experience_years_max', 'company_size',
+    'employment_type', 'remote_option', 'required_skills', 'posted_date',
+    'application_deadline', 'source'
+]
+
+# Watermark per source untuk incremental collection (ditulis juga oleh full/streaming run)
+WATERMARK_PATH = 'data/raw/watermarks.json'
 
 class ITJobDataCollector:
-    def __init__(self):
+    # Comprehensive data definitions
+    JOB_TITLES = [
+        'Software Developer', 'Data Analyst', 'Frontend Developer',
+        'Backend Developer', 'Full Stack Developer', 'DevOps Engineer',
+        'UI/UX Designer', 'Mobile Developer', 'Data Scientist',
+        'System Administrator', 'Database Administrator', 'QA Engineer',
+        'Product Manager', 'Scrum Master', 'Technical Lead',
+        'Cloud Engineer', 'Security Engineer', 'Business Analyst'
+    ]
+
+    COMPANIES = [
+        'Tokopedia', 'Gojek', 'Bukalapak', 'Traveloka', 'Blibli',
+        'Shopee', 'OVO', 'Dana', 'Grab', 'Sea Group',
+        'Local Tech Startup', 'Digital Consulting', 'Software House',
+        'Bank Digital', 'Fintech Company', 'E-commerce Platform',
+        'Government Agency', 'Multinational Corp', 'Healthcare Tech'
+    ]
+
+    LOCATIONS = [
+        'Jakarta', 'Bandung', 'Surabaya', 'Yogyakarta', 'Semarang',
+        'Medan', 'Makassar', 'Bali', 'Lampung', 'Palembang',
+        'Malang', 'Solo', 'Batam', 'Remote', 'Hybrid'
+    ]
+
+    SKILLS_POOL = [
+        'Python', 'JavaScript', 'Java', 'PHP', 'C#', 'Go', 'Ruby',
+        'React', 'Vue.js', 'Angular', 'Node.js', 'Laravel', 'Django',
+        'Spring Boot', 'Express.js', 'Flask', 'FastAPI',
+        'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Elasticsearch',
+        'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP',
+        'Git', 'Jenkins', 'Terraform', 'Linux', 'Nginx'
+    ]
+
+    INDUSTRIES = [
+        'E-commerce', 'Fintech', 'Healthcare', 'Education', 'Transportation',
+        'Food & Beverage', 'Gaming', 'Media', 'Government', 'Consulting'
+    ]
+
+    # Distribusi yang dipakai oleh generator (legacy dan vectorized)
+    EXPERIENCE_LEVELS = ['Junior', 'Mid', 'Senior']
+    EXPERIENCE_P = [0.4, 0.4, 0.2]
+    # randint bounds (high exclusive) dalam juta rupiah, per experience level
+    BASE_SALARY_BANDS = [(4, 8), (8, 15), (15, 30)]
+    EXPERIENCE_YEARS = [(0, 2), (3, 6), (7, 15)]
+    LOCATION_MULTIPLIERS = {
+        'Jakarta': 1.2, 'Remote': 1.2,
+        'Bandung': 1.1, 'Surabaya': 1.1,
+        'Lampung': 0.8, 'Palembang': 0.8
+    }
+    COMPANY_SIZES = ['Startup (<50)', 'Medium (50-500)', 'Large (500+)']
+    COMPANY_SIZE_P = [0.3, 0.4, 0.3]
+    EMPLOYMENT_TYPES = ['Full-time', 'Contract', 'Part-time']
+    EMPLOYMENT_TYPE_P = [0.8, 0.15, 0.05]
+    REMOTE_OPTIONS = ['On-site', 'Remote', 'Hybrid']
+    REMOTE_OPTION_P = [0.4, 0.3, 0.3]
+
+    # Skill yang dicari di description hasil scraping
+    SKILL_KEYWORDS = ['Python', 'JavaScript', 'Java', 'PHP', 'React', 'Vue.js',
+                      'Node.js', 'Laravel', 'SQL', 'MySQL', 'Tableau']
+
+    def __init__(self, http_cache_dir='data/cache/http', cache_ttl_by_source=None):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self.http_cache_dir = http_cache_dir
+        self.cache_ttl_by_source = cache_ttl_by_source
+        self.http_cache = None
+        self.scrape_stats = None
+        self.listing_urls = None
+        self.survey_path = None
+        self.collection_date = None
+        self.skill_matcher = SkillMatcher(self.SKILL_KEYWORDS, aliases=DEFAULT_SKILL_ALIASES)
         
-    def load_stackoverflow_data(self):
+    def load_stackoverflow_data(self, survey_path=None, chunk_size=50000, countries=None):
         """Load dan process Stack Overflow Developer Survey data"""
         print("📥 Loading Stack Overflow Developer Survey data...")
         
+        if survey_path:
+            # File survey asli di-stream per chunk jadi respondent × technology sparse table
+            return load_survey_chunked(survey_path, chunk_size=chunk_size, countries=countries)
+        
         # Simulasi data SO survey karena file asli sangat besar
         # Dalam praktik nyata, download dari: https://insights.stackoverflow.com/survey
         
@@ -45,10 +141,13 @@ class ITJobDataCollector:
         
         return pd.DataFrame(survey_data)
     
-    def light_web_scraping(self):
+    def light_web_scraping(self, listing_urls=None, **fetcher_options):
         """Light scraping dari job portal (minimal dan ethical)"""
         print("🕷️ Performing light web scraping...")
         
+        if listing_urls:
+            return self.scrape_listing_pages(listing_urls, **fetcher_options)
+        
         jobs_data = []
         
         # Simulasi scraping result (dalam praktik nyata, scrape dari job portal)
@@ -87,56 +186,44 @@ class ITJobDataCollector:
         for i in range(30):  # Generate 30 scraped-like records
             base_job = random.choice(sample_scraped_jobs)
             job = base_job.copy()
-            job['job_id'] = f'SCRAPED_{i+1:03d}'
-            job['posted_date'] = (datetime.now() - timedelta(days=random.randint(1, 30))).strftime('%Y-%m-%d')
+            posted = datetime.now() - timedelta(days=random.randint(1, 30))
+            job['posted_date'] = posted.strftime('%Y-%m-%d')
+            # Id posting stabil seperti id portal: id yang sama selalu punya posted_date yang sama,
+            # jadi watermark bisa mengenalinya di incremental run berikutnya
+            job['job_id'] = f"SCRAPED_{posted:%Y%m%d}_{i+1:03d}"
             jobs_data.append(job)
         
         time.sleep(1)  # Be respectful
         return pd.DataFrame(jobs_data)
     
+    def scrape_listing_pages(self, listing_urls, **fetcher_options):
+        """Fetch listing pages secara concurrent (rate limited per host) dan parse job cards"""
+        if self.http_cache is None and self.http_cache_dir:
+            self.http_cache = HTTPResponseCache(self.http_cache_dir, ttl_by_source=self.cache_ttl_by_source)
+        
+        fetcher = AsyncListingFetcher(headers=self.headers, cache=self.http_cache, **fetcher_options)
+        jobs_data = fetcher.fetch(listing_urls)
+        self.scrape_stats = fetcher.stats()
+        
+        print(f"   🌐 {self.scrape_stats['pages']} pages fetched in {self.scrape_stats['elapsed_seconds']:.2f}s "
+              f"({self.scrape_stats['pages_per_second']:.1f} pages/s, "
+              f"p95 {self.scrape_stats['p95_latency_ms']:.0f} ms, {self.scrape_stats['errors']} errors), "
+              f"{self.scrape_stats['cache_hits']} served from cache")
+        
+        # Semua URL gagal / tidak ada card: frame kosong tetap punya kolom listing
+        return pd.DataFrame(jobs_data, columns=LISTING_COLUMNS)
+    
     def generate_realistic_job_data(self):
         """Generate comprehensive realistic job market data"""
         print("🎲 Generating realistic job market data...")
         
         np.random.seed(42)
         
-        # Comprehensive data definitions
-        job_titles = [
-            'Software Developer', 'Data Analyst', 'Frontend Developer', 
-            'Backend Developer', 'Full Stack Developer', 'DevOps Engineer', 
-            'UI/UX Designer', 'Mobile Developer', 'Data Scientist',
-            'System Administrator', 'Database Administrator', 'QA Engineer',
-            'Product Manager', 'Scrum Master', 'Technical Lead',
-            'Cloud Engineer', 'Security Engineer', 'Business Analyst'
-        ]
-        
-        companies = [
-            'Tokopedia', 'Gojek', 'Bukalapak', 'Traveloka', 'Blibli',
-            'Shopee', 'OVO', 'Dana', 'Grab', 'Sea Group',
-            'Local Tech Startup', 'Digital Consulting', 'Software House',
-            'Bank Digital', 'Fintech Company', 'E-commerce Platform',
-            'Government Agency', 'Multinational Corp', 'Healthcare Tech'
-        ]
-        
-        locations = [
-            'Jakarta', 'Bandung', 'Surabaya', 'Yogyakarta', 'Semarang',
-            'Medan', 'Makassar', 'Bali', 'Lampung', 'Palembang',
-            'Malang', 'Solo', 'Batam', 'Remote', 'Hybrid'
-        ]
-        
-        skills_pool = [
-            'Python', 'JavaScript', 'Java', 'PHP', 'C#', 'Go', 'Ruby',
-            'React', 'Vue.js', 'Angular', 'Node.js', 'Laravel', 'Django',
-            'Spring Boot', 'Express.js', 'Flask', 'FastAPI',
-            'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Elasticsearch',
-            'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP',
-            'Git', 'Jenkins', 'Terraform', 'Linux', 'Nginx'
-        ]
-        
-        industries = [
-            'E-commerce', 'Fintech', 'Healthcare', 'Education', 'Transportation',
-            'Food & Beverage', 'Gaming', 'Media', 'Government', 'Consulting'
-        ]
+        job_titles = self.JOB_TITLES
+        companies = self.COMPANIES
+        locations = self.LOCATIONS
+        skills_pool = self.SKILLS_POOL
+        industries = self.INDUSTRIES
         
         # Generate job records
         jobs_data = []
@@ -206,7 +293,92 @@ class ITJobDataCollector:
         num_skills = np.random.randint(3, 7)
         skills = np.random.choice(skills_pool, size=num_skills, replace=False)
         return ', '.join(skills)
-    
+
+    def generate_job_data_vectorized(self, n_rows=800, seed=42, rng=None, start_id=1,
+                                     reference_time=None, block_size=250000):
+        """Generate job market data secara batch: satu draw NumPy per kolom, bukan per row.
+
+        Distribusinya sama dengan generate_realistic_job_data, tapi stream random-nya
+        berbeda (numpy.random.Generator), jadi hasilnya tidak identik row-per-row.
+        """
+        if rng is None:
+            rng = np.random.default_rng(seed)
+        if reference_time is None:
+            reference_time = datetime.now()
+
+        blocks = []
+        for offset in range(0, n_rows, block_size):
+            size = min(block_size, n_rows - offset)
+            blocks.append(self._generate_job_block(rng, size, start_id + offset, reference_time))
+
+        if not blocks:
+            return self._generate_job_block(rng, 0, start_id, reference_time)
+        if len(blocks) == 1:
+            return blocks[0]
+        return pd.concat(blocks, ignore_index=True)
+
+    def _generate_job_block(self, rng, n_rows, start_id, reference_time):
+        """Generate satu block job records dengan operasi kolom NumPy"""
+        # Experience level menentukan salary band dan experience years
+        level_codes = rng.choice(len(self.EXPERIENCE_LEVELS), size=n_rows, p=self.EXPERIENCE_P)
+        bands = np.array(self.BASE_SALARY_BANDS)
+        base_salary = rng.integers(bands[level_codes, 0], bands[level_codes, 1]) * 1000000
+
+        # Location adjustment lewat lookup table multiplier
+        location_codes = rng.integers(0, len(self.LOCATIONS), size=n_rows)
+        multipliers = np.array([self.LOCATION_MULTIPLIERS.get(loc, 1.0) for loc in self.LOCATIONS])
+        adjusted_salary = (base_salary * multipliers[location_codes]).astype(np.int64)
+
+        exp_years = np.array(self.EXPERIENCE_YEARS, dtype=np.int64)
+        reference = np.datetime64(reference_time, 'us')
+
+        def pick(values, size, p=None):
+            codes = rng.choice(len(values), size=size, p=p)
+            return np.array(values, dtype=object)[codes]
+
+        job_ids = np.char.add('JOB_', np.char.zfill(np.arange(start_id, start_id + n_rows).astype(str), 4))
+
+        jobs = pd.DataFrame({
+            'job_id': job_ids.astype(object),
+            'title': pick(self.JOB_TITLES, n_rows),
+            'company': pick(self.COMPANIES, n_rows),
+            'location': np.array(self.LOCATIONS, dtype=object)[location_codes],
+            'industry': pick(self.INDUSTRIES, n_rows),
+            'salary_min': adjusted_salary,
+            'salary_max': adjusted_salary + rng.integers(2, 6, size=n_rows) * 1000000,
+            'experience_level': np.array(self.EXPERIENCE_LEVELS, dtype=object)[level_codes],
+            'experience_years_min': exp_years[level_codes, 0],
+            'experience_years_max': exp_years[level_codes, 1],
+            'company_size': pick(self.COMPANY_SIZES, n_rows, self.COMPANY_SIZE_P),
+            'employment_type': pick(self.EMPLOYMENT_TYPES, n_rows, self.EMPLOYMENT_TYPE_P),
+            'remote_option': pick(self.REMOTE_OPTIONS, n_rows, self.REMOTE_OPTION_P),
+            'required_skills': self._generate_skills_vectorized(rng, n_rows),
+            'posted_date': reference - rng.integers(1, 90, size=n_rows).astype('timedelta64[D]'),
+            'application_deadline': reference + rng.integers(7, 60, size=n_rows).astype('timedelta64[D]'),
+            'source': 'generated'
+        })
+
+        return jobs
+
+    def _generate_skills_vectorized(self, rng, n_rows, min_skills=3, max_skills=6):
+        """Sample skill tanpa replacement untuk semua row sekaligus"""
+        pool_size = len(self.SKILLS_POOL)
+        num_skills = rng.integers(min_skills, max_skills + 1, size=n_rows)
+
+        # argsort dari random keys = random permutation per row; k kolom pertama
+        # adalah sample tanpa replacement dengan urutan acak (sama seperti np.random.choice)
+        keys = rng.random((n_rows, pool_size), dtype=np.float32)
+        picked = np.argsort(keys, axis=1)[:, :max_skills]
+
+        names = np.array(self.SKILLS_POOL, dtype=object)
+        joined_names = np.array([', ' + skill for skill in self.SKILLS_POOL], dtype=object)
+
+        skills = names[picked[:, 0]]
+        for position in range(1, max_skills):
+            skills = skills + np.where(position < num_skills, joined_names[picked[:, position]], '')
+
+        return skills
+
     def combine_datasets(self, stackoverflow_data, scraped_data, generated_data):
         """Combine all data sources into unified dataset"""
         print("🔄 Combining all data sources...")
@@ -223,105 +395,411 @@ class ITJobDataCollector:
             scraped_processed
         ], ignore_index=True)
         
-        # Add metadata
-        final_dataset['data_collection_date'] = datetime.now()
-        final_dataset['dataset_version'] = '1.0'
+        # Collection date masuk metadata snapshot version, bukan kolom per row
+        self.collection_date = datetime.now()
         
         return final_dataset, so_processed
     
+    def iter_job_batches(self, n_rows=800, chunk_size=100000, seed=42):
+        """Yield job record batches dari semua source (generated, lalu scraped)"""
+        self.collection_date = datetime.now()
+        rng = np.random.default_rng(seed)
+        
+        for offset in range(0, n_rows, chunk_size):
+            yield self.generate_job_data_vectorized(
+                n_rows=min(chunk_size, n_rows - offset), rng=rng, start_id=offset + 1,
+                reference_time=self.collection_date, block_size=chunk_size
+            )
+        
+        yield from self.iter_scraped_batches()
+    
+    def iter_scraped_batches(self):
+        """Yield processed scraped job batches"""
+        yield self._process_scraped_data(self.light_web_scraping(self.listing_urls))
+    
+    def iter_tech_trend_batches(self, chunk_size=100000):
+        """Yield processed tech trend batches dari Stack Overflow survey"""
+        so_data = self.load_stackoverflow_data(self.survey_path)
+        for start in range(0, len(so_data), chunk_size):
+            if isinstance(so_data, SurveyTechTable):
+                batch = so_data.slice_respondents(start, start + chunk_size)
+            else:
+                batch = so_data.iloc[start:start + chunk_size]
+            yield self._process_stackoverflow_data(batch)
+    
     def _process_stackoverflow_data(self, so_data):
         """Process Stack Overflow survey data"""
-        # Extract technology trends
-        tech_trends = []
-        for _, row in so_data.iterrows():
-            techs = row['technologies'].split(', ')
-            for tech in techs:
-                tech_trends.append({
-                    'technology': tech,
-                    'country': row['country'],
-                    'experience_years': row['experience_years'],
-                    'salary_usd': row['salary_usd'],
-                    'company_size': row['company_size']
-                })
-        
-        return pd.DataFrame(tech_trends)
+        if isinstance(so_data, SurveyTechTable):
+            return self._process_survey_tech_table(so_data)
+        
+        # Extract technology trends: split + explode dalam satu pass
+        technologies = so_data['technologies'].reset_index(drop=True).str.split(', ').explode().dropna()
+        respondent_pos = technologies.index.to_numpy()
+        
+        # Field per respondent di-broadcast sebagai categorical codes, bukan copy string
+        def broadcast_categorical(values):
+            categorical = pd.Categorical(values)
+            return pd.Categorical.from_codes(categorical.codes[respondent_pos], categorical.categories)
+        
+        return pd.DataFrame({
+            'technology': technologies.to_numpy(),
+            'country': broadcast_categorical(so_data['country']),
+            'experience_years': so_data['experience_years'].to_numpy()[respondent_pos],
+            'salary_usd': so_data['salary_usd'].to_numpy()[respondent_pos],
+            'company_size': broadcast_categorical(so_data['company_size'])
+        })
+    
+    def _process_survey_tech_table(self, table):
+        """Tech trends langsung dari sparse table (tanpa frame survey penuh)"""
+        respondent_pos = np.repeat(np.arange(len(table)), np.diff(table.indptr))
+        respondents = table.respondents
+        
+        def broadcast_categorical(values):
+            return pd.Categorical.from_codes(values.cat.codes.to_numpy()[respondent_pos], values.cat.categories)
+        
+        return pd.DataFrame({
+            'technology': pd.Categorical.from_codes(table.indices, table.technologies),
+            'country': broadcast_categorical(respondents['country']),
+            'experience_years': respondents['experience_years'].to_numpy()[respondent_pos],
+            'salary_usd': respondents['salary_usd'].to_numpy()[respondent_pos],
+            'company_size': broadcast_categorical(respondents['company_size'])
+        })
     
     def _process_scraped_data(self, scraped_data):
         """Process and standardize scraped data"""
         processed = scraped_data.copy()
         
-        # Parse salary text to numeric
-        processed['salary_min'] = processed['salary_text'].apply(self._parse_salary_min)
-        processed['salary_max'] = processed['salary_text'].apply(self._parse_salary_max)
+        # Parse salary text to numeric (min dan max dalam satu pass)
+        salaries = parse_salary_text(processed['salary_text'])
+        processed['salary_min'] = salaries['salary_min']
+        processed['salary_max'] = salaries['salary_max']
+        
+        failed = int(salaries['salary_parse_failed'].sum())
+        if failed:
+            print(f"   ⚠️ {failed} salary texts could not be parsed, using default range")
         
         # Extract skills from description
-        processed['required_skills'] = processed['description'].apply(self._extract_skills)
+        processed['required_skills'] = self.skill_matcher.extract_batch(processed['description'])
         
         # Standardize other fields
         processed['experience_level'] = 'Mid'  # Default assumption
         processed['company_size'] = 'Medium (50-500)'  # Default assumption
-        processed['remote_option'] = processed['location'].apply(
-            lambda x: 'Remote' if 'remote' in x.lower() else 'On-site'
-        )
+        # Card tanpa location (None) dianggap on-site
+        is_remote = processed['location'].str.contains('remote', case=False, na=False)
+        processed['remote_option'] = np.where(is_remote, 'Remote', 'On-site')
         
         return processed[['job_id', 'title', 'company', 'location', 'salary_min', 
                         'salary_max', 'required_skills', 'experience_level', 
-                        'company_size', 'remote_option', 'source']]
-    
-    def _parse_salary_min(self, salary_text):
-        """Parse minimum salary from text"""
-        try:
-            # Extract first number from "8-12 juta" format
-            import re
-            numbers = re.findall(r'\d+', salary_text)
-            if numbers:
-                return int(numbers[0]) * 1000000
-        except:
-            pass
-        return 5000000  # Default
-    
-    def _parse_salary_max(self, salary_text):
-        """Parse maximum salary from text"""
-        try:
-            import re
-            numbers = re.findall(r'\d+', salary_text)
-            if len(numbers) >= 2:
-                return int(numbers[1]) * 1000000
-            elif len(numbers) == 1:
-                return int(numbers[0]) * 1000000 + 2000000
-        except:
-            pass
-        return 8000000  # Default
+                        'company_size', 'remote_option', 'posted_date', 'source']]
     
     def _extract_skills(self, description):
         """Extract skills from job description"""
-        skills_keywords = ['Python', 'JavaScript', 'Java', 'PHP', 'React', 'Vue.js', 
-                          'Node.js', 'Laravel', 'SQL', 'MySQL', 'Tableau']
+        return self.skill_matcher.extract(description)
+
+class PartitionedCSVWriter:
+    """Append record batches ke partition files (part-00000.csv, part-00001.csv, ...)"""
+    
+    def __init__(self, directory, columns=None, rows_per_file=1000000, first_part=0,
+                 clear_existing=True):
+        self.directory = directory
+        self.columns = columns
+        self.rows_per_file = rows_per_file
+        self.part_index = first_part
+        self.rows_in_part = 0
+        self.total_rows = 0
+        self.files = []
         
-        found_skills = []
-        for skill in skills_keywords:
-            if skill.lower() in description.lower():
-                found_skills.append(skill)
+        os.makedirs(directory, exist_ok=True)
+        if clear_existing:
+            _clear_partitions(directory)
+    
+    def write(self, batch):
+        """Append satu batch, pindah ke partition baru kalau rows_per_file tercapai"""
+        if self.columns is None:
+            self.columns = list(batch.columns)
+        batch = batch.reindex(columns=self.columns)
+        
+        start = 0
+        while start < len(batch):
+            if self.rows_in_part >= self.rows_per_file:
+                self.part_index += 1
+                self.rows_in_part = 0
+            
+            take = min(len(batch) - start, self.rows_per_file - self.rows_in_part)
+            path = os.path.join(self.directory, f'part-{self.part_index:05d}.csv')
+            new_file = self.rows_in_part == 0
+            
+            batch.iloc[start:start + take].to_csv(
+                path, mode='w' if new_file else 'a', header=new_file, index=False
+            )
+            if new_file:
+                self.files.append(path)
+            
+            start += take
+            self.rows_in_part += take
+            self.total_rows += take
         
-        return ', '.join(found_skills) if found_skills else 'General Programming'
+        return self.total_rows
+
+def _clear_partitions(directory):
+    """Buang partition lama dari run sebelumnya supaya output tidak tercampur"""
+    for name in os.listdir(directory):
+        if name.startswith('part-') and name.endswith('.csv'):
+            os.remove(os.path.join(directory, name))
+
+def _shard_sizes(n_rows, n_shards):
+    """Bagi n_rows serata mungkin ke n_shards (shard awal dapat sisa pembagian)"""
+    base, remainder = divmod(n_rows, n_shards)
+    return [base + (1 if shard < remainder else 0) for shard in range(n_shards)]
+
+def _generate_shard(task):
+    """Worker: generate satu shard dan tulis langsung ke partition file-nya"""
+    shard_index, seed_sequence, n_rows, start_id, reference_time, chunk_size, output_dir = task
+    
+    collector = ITJobDataCollector()
+    rng = np.random.Generator(np.random.PCG64(seed_sequence))
+    path = os.path.join(output_dir, f'part-{shard_index:05d}.csv')
+    
+    # Block size ikut menentukan urutan draw, jadi shard selalu digenerate per chunk_size
+    written = 0
+    with open(path, 'w', newline='') as f:
+        f.write(','.join(RAW_JOB_COLUMNS) + '\n')
+        for offset in range(0, n_rows, chunk_size):
+            batch = collector.generate_job_data_vectorized(
+                n_rows=min(chunk_size, n_rows - offset), rng=rng, start_id=start_id + offset,
+                reference_time=reference_time, block_size=chunk_size
+            )
+            batch = batch.reindex(columns=RAW_JOB_COLUMNS)
+            batch.to_csv(f, header=False, index=False)
+            written += len(batch)
+    
+    return path, written
+
+def generate_sharded_job_data(n_rows, n_shards, seed=42, max_workers=None,
+                              output_dir='data/raw/it_jobs_raw', reference_time=None,
+                              chunk_size=100000):
+    """Generate job data paralel di ProcessPoolExecutor, satu partition file per shard.
+
+    Setiap shard punya numpy.random.Generator sendiri dari SeedSequence(seed).spawn(),
+    jadi output byte-identical untuk seed, n_shards, chunk_size dan reference_time yang
+    sama, berapapun jumlah worker-nya. Parent hanya menerima path dan jumlah row.
+    """
+    if reference_time is None:
+        # Dipin ke awal hari supaya run ulang di hari yang sama menghasilkan file yang sama
+        reference_time = datetime.combine(datetime.now().date(), datetime.min.time())
+    
+    os.makedirs(output_dir, exist_ok=True)
+    _clear_partitions(output_dir)
+    
+    seed_sequences = np.random.SeedSequence(seed).spawn(n_shards)
+    sizes = _shard_sizes(n_rows, n_shards)
+    start_ids = np.cumsum([1] + sizes[:-1])
+    tasks = [
+        (shard, seed_sequences[shard], sizes[shard], int(start_ids[shard]),
+         reference_time, chunk_size, output_dir)
+        for shard in range(n_shards)
+    ]
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_generate_shard, tasks))
+    
+    return {
+        'files': [path for path, _ in results],
+        'rows': sum(written for _, written in results),
+        'reference_time': reference_time
+    }
+
+def _peak_rss_mb():
+    """Peak resident set size dari proses ini dalam MB (None kalau tidak tersedia)"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan bytes
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+def _print_cache_stats(collector):
+    if collector.scrape_stats and 'cache' in collector.scrape_stats:
+        cache = collector.scrape_stats['cache']
+        print(f"🗄️ HTTP cache: {cache['hits']} hits, {cache['misses']} misses, "
+              f"{cache['revalidations']} revalidations ({cache['entries']} entries, {cache['bytes']:,} bytes)")
+
+def _part_files(files, chunk_size=100000):
+    """(nama partition, chunk iterator) per partition file: file tidak pernah dibaca utuh"""
+    for path in files:
+        yield os.path.splitext(os.path.basename(path))[0], pd.read_csv(path, chunksize=chunk_size)
+
+def record_snapshot(collector, tables, append=False, store=None):
+    """Catat collection run sebagai snapshot version (collection date di metadata version).
+    
+    append=True: row baru ditambahkan ke version collection terakhir (incremental).
+    """
+    store = store or SnapshotStore()
+    metadata = {'data_collection_date': str(collector.collection_date)}
+    if append:
+        version = store.append('collection', 'jobs', tables['jobs'], metadata)
+    else:
+        version = store.commit('collection', tables, metadata)
+    print_snapshot_summary(store, version)
+    return version
+
+def _print_peak_rss():
+    peak_rss = _peak_rss_mb()
+    if peak_rss is not None:
+        print(f"🧠 Peak RSS: {peak_rss:,.1f} MB")
 
-def main():
+def run_streaming_collection(collector, n_rows=800, chunk_size=100000, n_shards=None,
+                             max_workers=None, jobs_dir='data/raw/it_jobs_raw',
+                             tech_dir='data/raw/tech_trends_raw', watermark_path=WATERMARK_PATH):
+    """Streaming collection: setiap batch langsung di-append ke partition files"""
+    print(f"🌊 Streaming mode: {n_rows:,} generated rows, chunk_size={chunk_size:,}")
+    
+    # Raw store ditulis ulang: watermark dihitung ulang dari batch yang ditulis
+    watermarks = WatermarkStore(watermark_path)
+    watermarks.reset()
+    
+    if n_shards:
+        print(f"   ⚡ Sharded generation: {n_shards} shards, max_workers={max_workers or os.cpu_count()}")
+        sharded = generate_sharded_job_data(
+            n_rows, n_shards, max_workers=max_workers, output_dir=jobs_dir, chunk_size=chunk_size
+        )
+        print(f"   💾 {sharded['rows']:,} generated job records written")
+        
+        # Scraped data masuk sebagai partition setelah partition shard terakhir
+        jobs_writer = PartitionedCSVWriter(
+            jobs_dir, columns=RAW_JOB_COLUMNS, first_part=n_shards, clear_existing=False
+        )
+        collector.collection_date = sharded['reference_time']
+        for path in sharded['files']:
+            watermarks.observe_csv(path, chunk_size=chunk_size)
+        for batch in collector.iter_scraped_batches():
+            jobs_writer.write(batch)
+            watermarks.observe(batch)
+        jobs_writer.total_rows += sharded['rows']
+        jobs_writer.files = sharded['files'] + jobs_writer.files
+    else:
+        jobs_writer = PartitionedCSVWriter(jobs_dir, columns=RAW_JOB_COLUMNS)
+        for batch in collector.iter_job_batches(n_rows=n_rows, chunk_size=chunk_size):
+            jobs_writer.write(batch)
+            watermarks.observe(batch)
+            print(f"   💾 {jobs_writer.total_rows:,} job records written")
+    
+    watermarks.save()
+    
+    tech_writer = PartitionedCSVWriter(tech_dir)
+    for batch in collector.iter_tech_trend_batches(chunk_size=chunk_size):
+        tech_writer.write(batch)
+    
+    # Snapshot per partition file: shard yang isinya sama dengan run sebelumnya dipakai bersama
+    record_snapshot(collector, {'jobs': _part_files(jobs_writer.files, chunk_size),
+                                'tech': _part_files(tech_writer.files, chunk_size)})
+    
+    print("\n📊 Data Collection Summary:")
+    print(f"📁 Main dataset: {jobs_writer.total_rows:,} job records in {len(jobs_writer.files)} partition(s)")
+    print(f"📁 Tech trends: {tech_writer.total_rows:,} technology records in {len(tech_writer.files)} partition(s)")
+    print(f"💾 Files saved to: {jobs_dir}/, {tech_dir}/")
+    _print_cache_stats(collector)
+    _print_peak_rss()
+    
+    return {
+        'job_records': jobs_writer.total_rows,
+        'tech_records': tech_writer.total_rows,
+        'job_files': jobs_writer.files,
+        'tech_files': tech_writer.files
+    }
+
+def run_incremental_collection(collector, n_rows=800, raw_path='data/raw/it_jobs_raw.csv',
+                               new_rows_path='data/raw/it_jobs_new.csv',
+                               watermark_path=WATERMARK_PATH):
+    """Incremental collection: hanya posting yang lebih baru dari watermark per source
+    yang di-append ke raw store. Row baru juga ditulis ke new_rows_path untuk step berikutnya.
+    """
+    print("⏩ Incremental mode: collecting postings newer than per-source watermarks")
+    
+    # Raw store dengan layout lama (metadata per row): kolomnya dipindah dulu ke metadata
+    # file, kalau tidak row baru ter-append dengan kolom yang bergeser
+    if migrate_metadata_columns(raw_path):
+        print(f"   🔧 Migrated legacy metadata columns out of {raw_path}")
+    
+    watermarks = WatermarkStore(watermark_path)
+    if not os.path.exists(watermark_path) and os.path.exists(raw_path):
+        # Raw store dari run sebelum ada watermark: seed dulu supaya job_id tidak dipakai ulang
+        print(f"   🌱 Seeding watermarks from {raw_path}")
+        watermarks.observe_csv(raw_path)
+    collector.collection_date = datetime.now()
+    
+    # Generated data lanjut dari job_id terakhir supaya id tidak bentrok dengan history
+    generated_state = watermarks.get('generated')
+    generated = collector.generate_job_data_vectorized(
+        n_rows=n_rows, seed=None, start_id=generated_state['next_id'], reference_time=collector.collection_date
+    )
+    generated_state['next_id'] += n_rows
+    
+    scraped = collector._process_scraped_data(collector.light_web_scraping(collector.listing_urls))
+    
+    new_batches = []
+    for source, batch in [('generated', generated), ('scraped', scraped)]:
+        new_rows = batch[watermarks.filter_new(source, batch)]
+        watermarks.advance(source, new_rows)
+        new_batches.append(new_rows)
+        print(f"   🆕 {source}: {len(new_rows)} new of {len(batch)} collected")
+    
+    new_dataset = pd.concat(new_batches, ignore_index=True).reindex(columns=RAW_JOB_COLUMNS)
+    
+    # Append ke raw store (header hanya kalau file belum ada), baru geser watermark
+    new_dataset.to_csv(raw_path, mode='a', header=not os.path.exists(raw_path), index=False)
+    new_dataset.to_csv(new_rows_path, index=False)
+    watermarks.save()
+    record_snapshot(collector, {'jobs': new_dataset}, append=True)
+    
+    print("\n📊 Data Collection Summary:")
+    print(f"📁 New job records: {len(new_dataset)} appended to {raw_path}")
+    print(f"📁 New rows list: {new_rows_path}")
+    _print_cache_stats(collector)
+    _print_peak_rss()
+    
+    return new_dataset
+
+def main(streaming=False, n_rows=None, chunk_size=100000, n_shards=None, max_workers=None,
+         listing_urls=None, incremental=False, survey_path=None):
     """Main function untuk menjalankan data collection"""
     collector = ITJobDataCollector()
+    collector.listing_urls = listing_urls
+    collector.survey_path = survey_path
     
     print("🚀 Starting IT Market Data Collection...")
     print("=" * 50)
     
+    if incremental:
+        new_dataset = run_incremental_collection(collector, n_rows=n_rows or 800)
+        print("\n✅ Data collection completed successfully!")
+        return new_dataset
+    
+    if streaming:
+        summary = run_streaming_collection(
+            collector, n_rows=n_rows or 800, chunk_size=chunk_size,
+            n_shards=n_shards, max_workers=max_workers
+        )
+        print("\n✅ Data collection completed successfully!")
+        return summary
+    
     # 1. Load Stack Overflow data
-    so_data = collector.load_stackoverflow_data()
+    so_data = collector.load_stackoverflow_data(survey_path)
     print(f"✅ Stack Overflow data loaded: {len(so_data)} records")
     
     # 2. Perform light scraping
-    scraped_data = collector.light_web_scraping()
+    scraped_data = collector.light_web_scraping(listing_urls)
     print(f"✅ Web scraping completed: {len(scraped_data)} records")
     
     # 3. Generate realistic data
-    generated_data = collector.generate_realistic_job_data()
+    if n_rows is None:
+        generated_data = collector.generate_realistic_job_data()
+    else:
+        generated_data = collector.generate_job_data_vectorized(n_rows=n_rows)
     print(f"✅ Realistic data generated: {len(generated_data)} records")
     
     # 4. Combine all datasets
@@ -331,11 +809,23 @@ def main():
     # 5. Save datasets
     final_dataset.to_csv('data/raw/it_jobs_raw.csv', index=False)
     tech_trends.to_csv('data/raw/tech_trends_raw.csv', index=False)
+    # Metadata file dari raw store lama tidak berlaku lagi (collection date ada di snapshot)
+    if os.path.exists(metadata_path('data/raw/it_jobs_raw.csv')):
+        os.remove(metadata_path('data/raw/it_jobs_raw.csv'))
+    
+    # Raw store baru → watermark dihitung ulang untuk incremental run berikutnya
+    watermarks = WatermarkStore(WATERMARK_PATH)
+    watermarks.reset()
+    watermarks.observe(final_dataset)
+    watermarks.save()
+    record_snapshot(collector, {'jobs': final_dataset, 'tech': tech_trends})
     
     print("\n📊 Data Collection Summary:")
     print(f"📁 Main dataset: {len(final_dataset)} job records")
     print(f"📁 Tech trends: {len(tech_trends)} technology records")
     print(f"💾 Files saved to: data/raw/")
+    _print_cache_stats(collector)
+    _print_peak_rss()
     
     print("\n🔍 Dataset Preview:")
     print(final_dataset.head())
@@ -0,0 +1,254 @@
+# src/data_profiler.py
+import numpy as np
+import pandas as pd
+
+from schema import apply_schema, load_metadata
+
+PERCENTILES = [10, 25, 50, 75, 90]
+
+
+def _unique_hashes(values):
+    """Hash (uint64) nilai unik non-null; numeric/datetime di-normalisasi supaya
+    dtype yang berbeda antar chunk (int8 vs Int8, datetime us vs ns) tetap sama hash-nya"""
+    values = values.dropna()
+    if pd.api.types.is_datetime64_any_dtype(values):
+        values = np.asarray(values.unique(), dtype='datetime64[ns]').view(np.int64)
+    elif pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        values = np.asarray(values.unique(), dtype=np.float64)
+    else:
+        values = np.asarray(values.unique(), dtype=object).astype(str).astype(object)
+    return pd.util.hash_array(values, categorize=False)
+
+
+def _skill_counts(skills):
+    """Jumlah row per skill dari kolom 'A, B, C' tanpa membangun SkillMatrix
+    (skill yang muncul dua kali di satu row dihitung sekali)"""
+    # String yang sama hanya di-split sekali, lalu dibobot dengan jumlah row-nya
+    codes, uniques = pd.factorize(skills, use_na_sentinel=True)
+    rows_per_value = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    split = pd.Series(uniques, dtype=object).astype(str).str.split(',').explode().str.strip()
+    pairs = pd.DataFrame({'value': split.index, 'skill': split.to_numpy()})
+    pairs = pairs[pairs['skill'] != ''].drop_duplicates()
+    return pd.Series(rows_per_value[pairs['value']], index=pairs['skill']).groupby(level=0).sum()
+
+
+class HyperLogLog:
+    """Distinct count estimate dengan 2^precision register uint8 (~0.8% error untuk precision 14).
+
+    Selama nilai unik belum melebihi 2^precision, hash disimpan exact (memory setara beberapa
+    kali register) jadi kolom kecil mendapat count yang tepat; setelah itu pindah ke register.
+    """
+
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.exact = np.zeros(0, dtype=np.uint64)
+        self.registers = None
+
+    def add(self, hashes):
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if len(hashes) == 0:
+            return
+        if self.registers is None:
+            self.exact = np.union1d(self.exact, hashes)
+            if len(self.exact) <= 2 ** self.precision:
+                return
+            hashes, self.exact = self.exact, None
+            self.registers = np.zeros(2 ** self.precision, dtype=np.uint8)
+
+        bits = 64 - self.precision
+        buckets = (hashes >> np.uint64(bits)).astype(np.int64)
+        rest = hashes & np.uint64((1 << bits) - 1)
+
+        # Rank = posisi bit 1 pertama di sisa hash (leading zeros + 1)
+        exponents = np.frexp(rest.astype(np.float64))[1]
+        ranks = np.where(rest == 0, bits + 1, bits - exponents + 1).astype(np.uint8)
+        np.maximum.at(self.registers, buckets, ranks)
+
+    def estimate(self):
+        if self.registers is None:
+            return len(self.exact)
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Linear counting: hampir exact untuk cardinality kecil
+            return int(round(m * np.log(m / zeros)))
+        return int(round(raw))
+
+
+class QuantileSketch:
+    """KLL-style quantile sketch: tiap level menyimpan maksimal k nilai dengan bobot 2^level.
+
+    Level yang penuh diurutkan lalu setengah nilainya (posisi genap atau ganjil, acak)
+    naik ke level berikutnya. Memory O(k log n), rank error sekitar 1/k.
+    """
+
+    def __init__(self, k=256, seed=42):
+        self.k = k
+        self.count = 0
+        self.levels = [np.zeros(0)]
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        values = pd.to_numeric(pd.Series(values), errors='coerce').dropna().to_numpy(dtype=np.float64)
+        self.count += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            level += 1
+            if len(items) <= self.k:
+                continue
+            items = np.sort(items)
+            paired = len(items) // 2 * 2
+            self.levels[level - 1] = items[paired:]
+            if level == len(self.levels):
+                self.levels.append(np.zeros(0))
+            promoted = items[self.rng.integers(2):paired:2]
+            self.levels[level] = np.concatenate([self.levels[level], promoted])
+
+    def percentiles(self, percentiles=PERCENTILES):
+        """{'p50': nilai, ...}; None kalau belum ada nilai"""
+        if self.count == 0:
+            return {f'p{p}': None for p in percentiles}
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2.0 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        ranks = np.cumsum(weights[order])
+        positions = np.searchsorted(ranks, np.array(percentiles) / 100 * ranks[-1]).clip(max=len(values) - 1)
+        return {f'p{p}': float(value) for p, value in zip(percentiles, values[order][positions])}
+
+
+class HeavyHitters:
+    """Misra-Gries summary: maksimal capacity counter, exact kalau nilai unik ≤ capacity.
+
+    Kalau penuh, semua counter dikurangi counter ke-(capacity+1); count yang dilaporkan
+    adalah batas bawah dengan error maksimal self.error.
+    """
+
+    def __init__(self, capacity=100):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype='int64')
+        self.error = 0
+
+    def update(self, counts):
+        """counts = Series nilai → jumlah (misalnya value_counts satu chunk)"""
+        counts = counts[counts > 0]
+        counts.index = counts.index.astype(object)
+        merged = self.counts.add(counts.astype('int64'), fill_value=0).astype('int64')
+        if len(merged) > self.capacity:
+            cutoff = int(merged.nlargest(self.capacity + 1).iloc[-1])
+            merged = merged[merged > cutoff] - cutoff
+            self.error += cutoff
+        self.counts = merged
+
+    def top(self, n=None):
+        """{nilai: count} urut count descending (seri diurutkan berdasarkan nilai)"""
+        items = sorted(self.counts.items(), key=lambda item: (-item[1], str(item[0])))
+        return {key: int(count) for key, count in items[:n]}
+
+
+class DataProfiler:
+    """Single-pass profiler: semua statistik kolom di-update per chunk.
+
+    Tiap chunk dibaca sekali untuk null count, distinct count (HyperLogLog), min/max/sum
+    kolom numeric, quantile sketch dan heavy hitters. State tidak tergantung jumlah row,
+    jadi file yang lebih besar dari RAM bisa di-profile lewat profile_csv.
+    """
+
+    def __init__(self, quantile_columns=(), heavy_hitter_columns=(), skills_column=None, capacity=100, k=256):
+        self.skills_column = skills_column
+        self.rows = 0
+        self.bytes = 0
+        self.dtypes = {}
+        self.nulls = {}
+        self.distinct = {}
+        self.numeric = {}
+        self.quantiles = {col: QuantileSketch(k) for col in quantile_columns}
+        self.heavy_hitters = {col: HeavyHitters(capacity) for col in heavy_hitter_columns}
+        if skills_column:
+            self.heavy_hitters['skills'] = HeavyHitters(capacity)
+
+    def update(self, df, skill_matrix=None):
+        """Tambahkan satu chunk (skill_matrix = SkillMatrix chunk ini kalau sudah ada)"""
+        self.rows += len(df)
+        self.bytes += int(df.memory_usage(deep=True).sum())
+
+        for col in df.columns:
+            values = df[col]
+            nulls = int(values.isna().sum())
+            # Dtype chunk pertama, atau chunk pertama yang punya NaN (int8 → Int8)
+            if col not in self.dtypes or (nulls and not self.nulls[col]):
+                self.dtypes[col] = str(values.dtype)
+            self.nulls[col] = self.nulls.get(col, 0) + nulls
+
+            self.distinct.setdefault(col, HyperLogLog()).add(_unique_hashes(values))
+
+            if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+                stats = self.numeric.setdefault(col, {'min': None, 'max': None, 'sum': 0.0, 'count': 0})
+                valid = values.dropna()
+                if len(valid):
+                    stats['min'] = valid.min() if stats['min'] is None else min(stats['min'], valid.min())
+                    stats['max'] = valid.max() if stats['max'] is None else max(stats['max'], valid.max())
+                    stats['sum'] += float(valid.astype(np.float64).sum())
+                    stats['count'] += len(valid)
+
+        for col, sketch in self.quantiles.items():
+            if col in df.columns:
+                sketch.update(df[col])
+        for col, hitters in self.heavy_hitters.items():
+            if col in df.columns:
+                hitters.update(df[col].value_counts())
+
+        if self.skills_column in df.columns:
+            counts = _skill_counts(df[self.skills_column]) if skill_matrix is None else skill_matrix.skill_counts()
+            self.heavy_hitters['skills'].update(counts)
+        return self
+
+    def missing_values(self):
+        return sum(self.nulls.values())
+
+    def data_types(self):
+        return pd.Series(self.dtypes, dtype=object).value_counts().to_dict()
+
+    def distinct_counts(self):
+        # Estimate HLL tidak boleh melebihi jumlah nilai non-null kolomnya
+        return {col: min(hll.estimate(), self.rows - self.nulls[col]) for col, hll in self.distinct.items()}
+
+    def minimum(self, col):
+        return _python_number(self.numeric[col]['min'])
+
+    def maximum(self, col):
+        return _python_number(self.numeric[col]['max'])
+
+    def mean(self, col):
+        stats = self.numeric[col]
+        return stats['sum'] / stats['count'] if stats['count'] else None
+
+    def percentiles(self, col):
+        return self.quantiles[col].percentiles()
+
+    def top(self, col, n=None):
+        return self.heavy_hitters[col].top(n)
+
+    def bytes_per_row(self):
+        return self.bytes / self.rows if self.rows else 0.0
+
+
+def _python_number(value):
+    """numpy scalar → int/float supaya report JSON berisi angka (bukan string)"""
+    if value is None or pd.isna(value):
+        return None
+    return int(value) if float(value).is_integer() else float(value)
+
+
+def profile_csv(path, schema=None, chunk_size=100000, **profiler_args):
+    """Profile CSV chunk per chunk (file boleh lebih besar dari RAM)"""
+    date_format = load_metadata(path)['date_format']
+    profiler = DataProfiler(**profiler_args)
+    categorical = {col: 'category' for col, dtype in (schema or {}).items() if dtype == 'category'}
+    for chunk in pd.read_csv(path, chunksize=chunk_size, dtype=categorical):
+        profiler.update(apply_schema(chunk, schema, date_format) if schema else chunk)
+    return profiler
@@ -0,0 +1,61 @@
+# src/date_parser.py
+import numpy as np
+import pandas as pd
+
+# Format output cleaning: readers (dashboard, chunked pass) tidak perlu menebak format lagi
+OUTPUT_DATE_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+# Format yang dicoba saat deteksi; yang cocok dengan sample terbanyak dipakai untuk semua nilai
+DATE_FORMATS = [
+    OUTPUT_DATE_FORMAT,  # generated data dan output cleaning
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',  # scraped posted_date (atribut datetime)
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S.%f'
+]
+SAMPLE_SIZE = 100
+
+
+def detect_date_format(values, formats=DATE_FORMATS):
+    """Format yang bisa parse paling banyak sample non-null (None kalau tidak ada yang cocok)"""
+    sample = pd.Series(values, dtype=object).dropna().head(SAMPLE_SIZE)
+    best_format, best_count = None, 0
+    for date_format in formats:
+        count = pd.to_datetime(sample, format=date_format, errors='coerce').notna().sum()
+        if count > best_count:
+            best_format, best_count = date_format, count
+        if count == len(sample):
+            break
+    return best_format
+
+
+def parse_dates(values, date_format=None):
+    """Pengganti pd.to_datetime(values, errors='coerce') untuk kolom dengan banyak tanggal berulang.
+
+    Format dideteksi sekali (atau diberikan), hanya nilai unik yang di-parse lalu di-broadcast
+    ke row. Nilai yang tidak cocok dengan format (sumber data campuran) di-parse ulang per nilai,
+    jadi hasilnya tidak tergantung urutan row. Return (Series datetime64, format yang dipakai).
+    """
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values, date_format
+    if not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)):
+        # Kolom numeric (misalnya semua NaN di satu chunk)
+        return pd.to_datetime(values, errors='coerce'), date_format
+
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    uniques = pd.Series(uniques, dtype=object)
+    date_format = date_format or detect_date_format(uniques)
+
+    if date_format is not None:
+        parsed = pd.to_datetime(uniques, format=date_format, errors='coerce')
+    else:
+        parsed = pd.Series(pd.NaT, index=uniques.index, dtype='datetime64[us]')
+    failed = parsed.isna()
+    if failed.any():
+        parsed[failed] = pd.to_datetime(uniques[failed], format='mixed', errors='coerce')
+
+    # Code -1 (NaN) → NaT di elemen terakhir
+    parsed = parsed.to_numpy()
+    result = np.append(parsed, np.array(['NaT'], dtype=parsed.dtype))[codes]
+    return pd.Series(result, index=values.index, name=values.name), date_format
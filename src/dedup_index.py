@@ -0,0 +1,106 @@
+# src/dedup_index.py
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+
+
+def _sorted_unique(hashes):
+    hashes = np.sort(np.asarray(hashes, dtype=np.uint64))
+    return hashes[np.r_[True, hashes[1:] != hashes[:-1]]] if len(hashes) else hashes
+
+
+def key_hashes(df, subset=None):
+    """Hash (uint64) per row atas kolom key (subset kosong = semua kolom)"""
+    keys = df[subset] if subset else df
+    return pd.util.hash_pandas_object(keys.astype(object), index=False).to_numpy()
+
+
+class DedupIndex:
+    """Persistent index hash key job yang sudah masuk processed dataset.
+
+    Tiap batch ingestion menulis satu sorted segment (keys-00000.npy, ...). Lookup
+    memakai searchsorted lewat mmap, jadi hanya page yang disentuh yang dibaca:
+    biaya per run sebanding dengan row baru, bukan dengan seluruh history.
+    Segment digabung kalau jumlahnya melebihi MAX_SEGMENTS.
+    """
+
+    MAX_SEGMENTS = 16
+
+    def __init__(self, directory='data/cache/dedup'):
+        self.directory = directory
+        self.segment_paths = sorted(glob.glob(os.path.join(directory, 'keys-*.npy')))
+        self.segments = [np.load(path, mmap_mode='r') for path in self.segment_paths]
+
+        self.lookups = 0
+        self.known = 0
+
+    def __len__(self):
+        return sum(len(segment) for segment in self.segments)
+
+    def contains(self, hashes):
+        """Boolean mask hash yang sudah ada di salah satu segment"""
+        found = np.zeros(len(hashes), dtype=bool)
+        for segment in self.segments:
+            if len(segment) == 0:
+                continue
+            positions = np.searchsorted(segment, hashes).clip(max=len(segment) - 1)
+            found |= segment[positions] == hashes
+        return found
+
+    def filter_new(self, df, subset=None):
+        """(mask, hashes baru): row pertama per key yang belum pernah di-index"""
+        hashes = key_hashes(df, subset)
+        known = self.contains(hashes)
+        keep = ~known & ~pd.Series(hashes).duplicated().to_numpy()
+
+        self.lookups += len(hashes)
+        self.known += int(known.sum())
+        return keep, hashes[keep]
+
+    def add(self, hashes):
+        """Simpan hash key baru sebagai segment baru (atomic write)"""
+        hashes = _sorted_unique(hashes)
+        if len(hashes) == 0:
+            return
+
+        last = int(os.path.basename(self.segment_paths[-1])[5:10]) if self.segment_paths else -1
+        self._write_segment(os.path.join(self.directory, f'keys-{last + 1:05d}.npy'), hashes)
+
+        if len(self.segments) > self.MAX_SEGMENTS:
+            self.compact()
+
+    def compact(self):
+        """Gabung semua segment jadi satu sorted segment"""
+        merged = _sorted_unique(np.concatenate([np.asarray(segment) for segment in self.segments]))
+        old_paths = self.segment_paths
+        self.segments, self.segment_paths = [], []
+        self._write_segment(old_paths[-1], merged)
+        for path in old_paths[:-1]:
+            os.remove(path)
+
+    def rebuild(self, hashes):
+        """Ganti seluruh index (dipakai setelah full cleaning dari raw store)"""
+        for path in self.segment_paths:
+            os.remove(path)
+        self.segments, self.segment_paths = [], []
+        self.add(hashes)
+
+    def _write_segment(self, path, hashes):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.save(f, hashes)
+        os.replace(tmp_path, path)
+
+        self.segment_paths.append(path)
+        self.segments.append(np.load(path, mmap_mode='r'))
+
+    def stats(self):
+        return {
+            'indexed_keys': len(self),
+            'segments': len(self.segments),
+            'lookups': self.lookups,
+            'known': self.known
+        }
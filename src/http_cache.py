@@ -0,0 +1,189 @@
+# src/http_cache.py
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+
+class HTTPResponseCache:
+    """Persistent HTTP response cache per URL (body + ETag/Last-Modified) di disk.
+
+    Entry yang masih dalam TTL dipakai langsung tanpa request. Entry yang sudah
+    stale direvalidasi dengan conditional request (If-None-Match/If-Modified-Since).
+    Total ukuran body dibatasi max_bytes dengan eviction LRU: index urut last_access
+    (OrderedDict, entry yang diakses pindah ke akhir), jadi eviction cukup pop dari depan.
+    Method aman dipanggil dari beberapa thread (fetcher menjalankan disk I/O di executor).
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, cache_dir='data/cache/http', max_bytes=256 * 1024 * 1024,
+                 default_ttl=3600, ttl_by_source=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        # TTL per source (host), contoh: {'www.jobstreet.co.id': 6 * 3600}
+        self.ttl_by_source = ttl_by_source or {}
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.index = self._load_index()
+        self.total_bytes = sum(entry['size'] for entry in self.index.values())
+
+    def _load_index(self):
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        if not os.path.exists(path):
+            return OrderedDict()
+        try:
+            with open(path, 'r') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            # Index rusak: mulai dari cache kosong daripada gagal collect
+            return OrderedDict()
+        # Sekali sort saat load (index lama belum tentu urut), setelah itu urutan dijaga
+        return OrderedDict(sorted(index.items(), key=lambda item: item[1]['last_access']))
+
+    def save_index(self):
+        """Tulis index secara atomic (tmp file lalu rename)"""
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        tmp_path = path + '.tmp'
+        with self._lock:
+            data = json.dumps(self.index)
+        with open(tmp_path, 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def source_of(url):
+        return urlsplit(url).netloc
+
+    def _body_path(self, key):
+        return os.path.join(self.cache_dir, key + '.body')
+
+    def lookup(self, url):
+        """Return cache entry untuk URL (atau None)"""
+        entry = self.index.get(self._key(url))
+        if entry is not None and not os.path.exists(self._body_path(self._key(url))):
+            return None
+        return entry
+
+    def is_fresh(self, entry):
+        ttl = self.ttl_by_source.get(entry['source'], self.default_ttl)
+        return time.time() - entry['stored_at'] < ttl
+
+    def conditional_headers(self, entry):
+        """Header untuk conditional request dari validator yang tersimpan"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def read_body(self, url):
+        """Body entry, atau None kalau entry-nya sudah di-evict (dianggap cache miss).
+
+        Dibaca selama memegang lock: eviction mengeluarkan key dari index di bawah lock yang
+        sama sebelum file-nya dihapus, jadi entry yang masih ada di index pasti punya file.
+        """
+        key = self._key(url)
+        with self._lock:
+            if key not in self.index:
+                return None
+            try:
+                with open(self._body_path(key), 'r', encoding='utf-8') as f:
+                    body = f.read()
+            except FileNotFoundError:
+                # File hilang di luar cache (mis. dihapus manual): buang entry-nya
+                self.total_bytes -= self.index.pop(key)['size']
+                return None
+            self._touch(key)
+        return body
+
+    def _touch(self, key):
+        entry = self.index.get(key)
+        if entry is not None:
+            entry['last_access'] = time.time()
+            self.index.move_to_end(key)
+
+    def record_hit(self, url):
+        """Body dari cache tanpa request; None kalau entry sudah tidak ada (fetch ulang)"""
+        body = self.read_body(url)
+        if body is not None:
+            with self._lock:
+                self.hits += 1
+        return body
+
+    def record_revalidation(self, url):
+        """Server menjawab 304: body lama masih valid, reset umur entry (None kalau sudah di-evict)"""
+        body = self.read_body(url)
+        if body is not None:
+            with self._lock:
+                self.revalidations += 1
+                entry = self.index.get(self._key(url))
+                if entry is not None:
+                    entry['stored_at'] = time.time()
+        return body
+
+    def store(self, url, body, etag=None, last_modified=None):
+        """Simpan response baru (miss atau berubah), lalu evict LRU kalau melebihi max_bytes"""
+        key = self._key(url)
+        data = body.encode('utf-8')
+        with open(self._body_path(key), 'wb') as f:
+            f.write(data)
+
+        now = time.time()
+        with self._lock:
+            self.misses += 1
+            old = self.index.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old['size']
+            self.index[key] = {
+                'url': url,
+                'source': self.source_of(url),
+                'etag': etag,
+                'last_modified': last_modified,
+                'size': len(data),
+                'stored_at': now,
+                'last_access': now
+            }
+            self.total_bytes += len(data)
+            evicted = self._evict()
+
+        for evicted_key in evicted:
+            try:
+                os.remove(self._body_path(evicted_key))
+            except FileNotFoundError:
+                pass
+
+    def _evict(self):
+        """Pop entry least recently used sampai total <= max_bytes, return key yang dibuang"""
+        evicted = []
+        while self.total_bytes > self.max_bytes and self.index:
+            key, entry = self.index.popitem(last=False)
+            self.total_bytes -= entry['size']
+            self.evictions += 1
+            evicted.append(key)
+        return evicted
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidations': self.revalidations,
+            'evictions': self.evictions,
+            'entries': len(self.index),
+            'bytes': self.total_bytes
+        }
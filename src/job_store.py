@@ -0,0 +1,241 @@
+# src/job_store.py
+import json
+import os
+import shutil
+
+import pandas as pd
+
+from columnar_store import (PARQUET_AVAILABLE, ParquetWriter, concat_frames, iter_dataset, read_dataset,
+                            read_datasets, write_parquet)
+from date_parser import OUTPUT_DATE_FORMAT
+from schema import JOB_SCHEMA
+
+# Periode partition → frequency pandas Period
+GRANULARITIES = {'month': 'M', 'week': 'W-SUN'}
+UNKNOWN_PARTITION = 'unknown'  # posted_date kosong
+
+# Kolom yang min/max-nya dicatat per partition (dipakai untuk pruning)
+STATS_COLUMNS = ['posted_date', 'application_deadline']
+
+
+def partition_keys(dates, granularity='month'):
+    """Tanggal awal periode per row ('2025-05-01'), 'unknown' kalau tanggal kosong"""
+    periods = dates.dt.to_period(GRANULARITIES[granularity])
+    return periods.dt.start_time.dt.strftime('%Y-%m-%d').fillna(UNKNOWN_PARTITION)
+
+
+def _timestamp(value):
+    return None if value is None else pd.Timestamp(value)
+
+
+def dataset_reference_time(metadata):
+    """as_of default untuk filter active job: reference_time dataset (collection date
+    terbaru), lalu data_collection_date, fallback waktu sekarang"""
+    reference_time = metadata.get('reference_time') or metadata.get('data_collection_date')
+    return pd.Timestamp(reference_time) if reference_time else pd.Timestamp.now()
+
+
+def active_mask(df, as_of):
+    """Job yang application_deadline-nya belum lewat pada as_of (deadline kosong = tidak aktif)"""
+    return (df['application_deadline'] >= as_of).fillna(False).to_numpy(dtype=bool)
+
+
+class PartitionedJobStore:
+    """Cleaned jobs dipartisi per bulan/minggu posted_date (satu file per partition).
+
+    manifest.json mencatat jumlah row dan min/max posted_date dan application_deadline
+    per partition, jadi loader bisa melewati partition di luar date range atau yang
+    semua deadline-nya sudah lewat tanpa membuka file-nya.
+    """
+
+    MANIFEST = 'manifest.json'
+
+    def __init__(self, directory='data/processed/it_jobs', granularity='month'):
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"granularity harus salah satu dari {list(GRANULARITIES)}")
+        self.directory = directory
+        self.granularity = granularity
+        self.manifest = {'granularity': granularity, 'metadata': {}, 'partitions': {}}
+        self.writers = None
+        self.scan_stats = {}
+
+        if os.path.exists(self._manifest_path(directory)):
+            with open(self._manifest_path(directory), 'r') as f:
+                self.manifest = json.load(f)
+            self.granularity = self.manifest['granularity']
+
+    def exists(self):
+        return os.path.exists(self._manifest_path(self.directory))
+
+    @property
+    def partitions(self):
+        return self.manifest['partitions']
+
+    def partition_keys(self, df):
+        return partition_keys(df['posted_date'], self.granularity)
+
+    # --- Write: full rewrite (begin → write_chunk → commit) atau append ---
+
+    def write(self, df, metadata=None):
+        self.begin()
+        self.write_chunk(df)
+        self.commit(metadata)
+
+    def begin(self):
+        """Mulai rewrite seluruh store di folder sementara (store lama tetap terbaca)"""
+        shutil.rmtree(self._staging, ignore_errors=True)
+        os.makedirs(self._staging)
+        self.writers = {}
+        self.manifest = {'granularity': self.granularity, 'metadata': {}, 'partitions': {}}
+
+    def write_chunk(self, df):
+        for key, part in df.groupby(self.partition_keys(df), sort=True):
+            path = self._csv_path(self._staging, key)
+            if PARQUET_AVAILABLE:
+                self.writers.setdefault(key, ParquetWriter(path)).write(part)
+            else:
+                part.to_csv(path, mode='a', header=not os.path.exists(path), index=False,
+                            date_format=OUTPUT_DATE_FORMAT)
+            self._merge_stats(key, part)
+
+    def commit(self, metadata=None):
+        """Tutup semua partition dan ganti store lama sekaligus"""
+        for writer in self.writers.values():
+            writer.close(metadata)
+        self.writers = None
+        self.manifest['metadata'] = metadata or {}
+        self._save_manifest(self._staging)
+
+        old = self.directory + '.old'
+        shutil.rmtree(old, ignore_errors=True)
+        if os.path.exists(self.directory):
+            os.replace(self.directory, old)
+        os.replace(self._staging, self.directory)
+        shutil.rmtree(old, ignore_errors=True)
+
+    def append(self, df):
+        """Tambah row (incremental cleaning): hanya partition yang kena row baru ditulis ulang"""
+        os.makedirs(self.directory, exist_ok=True)
+        for key, part in df.groupby(self.partition_keys(df), sort=True):
+            path = self._csv_path(self.directory, key)
+            if key in self.partitions:
+                part = concat_frames([self._read_partition(key), part.reset_index(drop=True)])
+                del self.partitions[key]
+            if PARQUET_AVAILABLE:
+                write_parquet(part, path, self.manifest['metadata'])
+            else:
+                part.to_csv(path, index=False, date_format=OUTPUT_DATE_FORMAT)
+            self._merge_stats(key, part)
+        self._save_manifest(self.directory)
+
+    # --- Read dengan partition pruning ---
+
+    def select_partitions(self, posted_from=None, posted_to=None, active_only=False, as_of=None):
+        """Partition yang mungkin berisi row yang cocok, hanya dari statistik manifest"""
+        posted_from, posted_to = _timestamp(posted_from), _timestamp(posted_to)
+        as_of = _timestamp(as_of) or self.reference_time()
+
+        selected = []
+        for key, stats in sorted(self.partitions.items()):
+            if posted_from is not None or posted_to is not None:
+                if stats['min']['posted_date'] is None:
+                    continue
+                if posted_to is not None and _timestamp(stats['min']['posted_date']) > posted_to:
+                    continue
+                if posted_from is not None and _timestamp(stats['max']['posted_date']) < posted_from:
+                    continue
+            if active_only:
+                latest_deadline = stats['max']['application_deadline']
+                if latest_deadline is None or _timestamp(latest_deadline) < as_of:
+                    continue
+            selected.append(key)
+        return selected
+
+    def load(self, columns=None, posted_from=None, posted_to=None, active_only=False, as_of=None):
+        """Load job dari partition yang relevan saja, lalu filter per row.
+
+        active_only = application_deadline belum lewat pada as_of (default: reference_time
+        dataset, yaitu collection date terbaru); deadline kosong dianggap tidak aktif.
+        """
+        as_of = _timestamp(as_of) or self.reference_time()
+        keys = self.select_partitions(posted_from, posted_to, active_only, as_of)
+        self.scan_stats = {'partitions': len(self.partitions), 'opened': len(keys),
+                           'skipped': len(self.partitions) - len(keys)}
+
+        # Kolom predicate ikut dibaca, lalu di-drop kalau tidak diminta
+        read_columns = columns
+        if columns is not None:
+            predicate_columns = (['posted_date'] if posted_from is not None or posted_to is not None else []) + \
+                                (['application_deadline'] if active_only else [])
+            read_columns = list(dict.fromkeys(list(columns) + predicate_columns))
+
+        if not keys:
+            return pd.DataFrame(columns=columns if columns is not None else list(JOB_SCHEMA))
+        df = read_datasets([self._csv_path(self.directory, key) for key in keys], JOB_SCHEMA, read_columns)
+
+        mask = pd.Series(True, index=df.index)
+        if posted_from is not None:
+            mask &= df['posted_date'] >= _timestamp(posted_from)
+        if posted_to is not None:
+            mask &= df['posted_date'] <= _timestamp(posted_to)
+        if active_only:
+            mask &= active_mask(df, as_of)
+        if not mask.all():
+            df = df[mask].reset_index(drop=True)
+        if columns is not None:
+            df = df[[col for col in columns if col in df.columns]]
+        df.attrs['metadata'] = dict(self.manifest['metadata'])
+        return df
+
+    def iter_partitions(self, chunk_size=None):
+        """(key, DataFrame) per partition, dibaca satu per satu. Dengan chunk_size:
+        (key, iterator chunk DataFrame) supaya partition besar juga tidak di-load utuh"""
+        for key in sorted(self.partitions):
+            if chunk_size:
+                yield key, iter_dataset(self._csv_path(self.directory, key), JOB_SCHEMA, chunk_size)
+            else:
+                yield key, self._read_partition(key)
+
+    def reference_time(self):
+        """Reference time dataset (collection date terbaru), fallback waktu sekarang"""
+        return dataset_reference_time(self.manifest['metadata'])
+
+    # --- Internal ---
+
+    @property
+    def _staging(self):
+        return self.directory + '.tmp'
+
+    @staticmethod
+    def _manifest_path(directory):
+        return os.path.join(directory, PartitionedJobStore.MANIFEST)
+
+    @staticmethod
+    def _csv_path(directory, key):
+        # Nama CSV dipakai sebagai base path (read_dataset/ParquetWriter memakai .parquet-nya)
+        return os.path.join(directory, f'{key}.csv')
+
+    def _read_partition(self, key, columns=None):
+        return read_dataset(self._csv_path(self.directory, key), JOB_SCHEMA, columns)
+
+    def _merge_stats(self, key, part):
+        stats = self.partitions.setdefault(key, {
+            'rows': 0,
+            'min': {col: None for col in STATS_COLUMNS},
+            'max': {col: None for col in STATS_COLUMNS}
+        })
+        stats['rows'] += len(part)
+        for col in STATS_COLUMNS:
+            if col not in part.columns or part[col].isna().all():
+                continue
+            low, high = part[col].min(), part[col].max()
+            if stats['min'][col] is not None:
+                low = min(low, pd.Timestamp(stats['min'][col]))
+                high = max(high, pd.Timestamp(stats['max'][col]))
+            stats['min'][col], stats['max'][col] = str(low), str(high)
+
+    def _save_manifest(self, directory):
+        tmp_path = self._manifest_path(directory) + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self._manifest_path(directory))
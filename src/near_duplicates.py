@@ -0,0 +1,148 @@
+# src/near_duplicates.py
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9+#]+')
+
+
+def _text_tokens(texts):
+    """(row id, token hash) untuk setiap token unik per text; text kosong tidak punya token"""
+    row_ids, tokens = [], []
+    for i, text in enumerate(texts):
+        unique_tokens = set(TOKEN_PATTERN.findall(text.lower()))
+        row_ids.extend([i] * len(unique_tokens))
+        tokens.extend(unique_tokens)
+
+    hashes = pd.util.hash_array(np.array(tokens, dtype=object), categorize=False)
+    return np.array(row_ids, dtype=np.int64), hashes
+
+
+class NearDuplicateDetector:
+    """MinHash + LSH untuk job yang di-repost dengan wording sedikit berbeda.
+
+    Text (title + company + description) dijadikan set token, lalu diringkas jadi
+    num_perm minhash. Signature dipotong jadi bands; hanya job yang sama persis di
+    minimal satu band yang dibandingkan (tanpa pairwise comparison seluruh data).
+    Dengan 8 bands × 8 rows, pasangan dengan Jaccard ≥ ~0.77 hampir pasti jadi kandidat.
+    """
+
+    COLUMNS = ['title', 'company', 'description']
+    # Raw job store tidak menyimpan description: skills hasil extract dari description dipakai sebagai gantinya
+    FALLBACK_COLUMNS = {'description': 'required_skills'}
+
+    def __init__(self, threshold=0.8, num_perm=64, bands=8, max_bucket_size=100, seed=42):
+        if num_perm % bands:
+            raise ValueError("num_perm harus kelipatan bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.max_bucket_size = max_bucket_size
+
+        rng = np.random.default_rng(seed)
+        # Multiply-shift hashing: (a * x + b) mod 2^64, ambil 32 bit atas
+        self.a = rng.integers(1, 2 ** 63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self.b = rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64)
+        self.stats = None
+
+    def text_columns(self, df):
+        columns = []
+        for col in self.COLUMNS:
+            col = col if col in df.columns else self.FALLBACK_COLUMNS.get(col)
+            if col in df.columns:
+                columns.append(col)
+        return columns
+
+    def signatures(self, texts):
+        """MinHash signature (n_texts × num_perm); text tanpa token → row max value"""
+        row_ids, hashes = _text_tokens(texts)
+        signatures = np.full((len(texts), self.num_perm), np.iinfo(np.uint64).max, dtype=np.uint64)
+        if len(hashes) == 0:
+            return signatures
+
+        starts = np.flatnonzero(np.r_[True, row_ids[1:] != row_ids[:-1]])
+        rows = row_ids[starts]
+        shift = np.uint64(32)
+        for p in range(self.num_perm):
+            values = (self.a[p] * hashes + self.b[p]) >> shift
+            signatures[rows, p] = np.minimum.reduceat(values, starts)
+        return signatures
+
+    def candidate_pairs(self, signatures, valid):
+        """Pasangan (i, j), i < j, yang sama persis di minimal satu band.
+
+        Per band row diurutkan berdasarkan hash band, lalu tiap row dipasangkan dengan
+        row sesudahnya di bucket yang sama (jarak 1, 2, ...). Bucket yang lebih besar dari
+        max_bucket_size (template yang sama) hanya dibandingkan dalam window itu.
+        """
+        rows_per_band = self.num_perm // self.bands
+        valid_rows = np.flatnonzero(valid)
+        n_valid = len(valid_rows)
+
+        candidates = []
+        for band in range(self.bands):
+            block = signatures[valid_rows, band * rows_per_band:(band + 1) * rows_per_band]
+            keys = pd.util.hash_pandas_object(pd.DataFrame(block), index=False).to_numpy()
+            order = np.argsort(keys, kind='stable')
+            sorted_keys = keys[order]
+
+            for distance in range(1, self.max_bucket_size):
+                same_bucket = sorted_keys[:-distance] == sorted_keys[distance:]
+                if not same_bucket.any():
+                    break
+                left, right = order[:-distance][same_bucket], order[distance:][same_bucket]
+                candidates.append(np.minimum(left, right) * n_valid + np.maximum(left, right))
+
+        if not candidates:
+            return np.zeros((0, 2), dtype=np.int64)
+        # Pair yang muncul di beberapa band dihitung sekali; index dikembalikan ke posisi signatures
+        pairs = np.unique(np.concatenate(candidates))
+        return valid_rows[np.c_[pairs // n_valid, pairs % n_valid]]
+
+    def find(self, df):
+        """Mask row yang dipertahankan: row pertama per cluster near-duplicate"""
+        start = time.perf_counter()
+        columns = self.text_columns(df)
+        text = df[columns[0]].fillna('').astype(str).str.cat(
+            [df[col].fillna('').astype(str) for col in columns[1:]], sep=' '
+        ) if columns else pd.Series('', index=df.index)
+
+        # Text identik cukup di-hash sekali; code urut kemunculan pertama
+        codes, uniques = pd.factorize(text)
+        signatures = self.signatures(list(uniques))
+        valid = signatures[:, 0] != np.iinfo(np.uint64).max
+
+        pairs = self.candidate_pairs(signatures, valid)
+        similarity = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+        matches = pairs[similarity >= self.threshold]
+
+        # Union-find: root = code terkecil (kemunculan pertama) di tiap cluster
+        parent = np.arange(len(uniques))
+
+        def find_root(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for i, j in matches:
+            root_i, root_j = find_root(i), find_root(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+        roots = np.array([find_root(x) for x in range(len(uniques))], dtype=np.int64)
+
+        keep = ~pd.Series(roots[codes]).duplicated().to_numpy()
+        elapsed = time.perf_counter() - start
+        self.stats = {
+            'rows': len(df),
+            'unique_texts': len(uniques),
+            'columns': columns,
+            'candidate_pairs': len(pairs),
+            'near_duplicate_pairs': len(matches),
+            'near_duplicates': int((~keep).sum()),
+            'seconds': elapsed,
+            'seconds_per_100k_rows': elapsed / len(df) * 100000 if len(df) else 0.0
+        }
+        return keep
@@ -0,0 +1,189 @@
+# src/pipeline.py
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from stage_cache import code_version
+
+PIPELINE_STATE_PATH = 'data/cache/pipeline/state.json'
+
+
+def file_hash(path, block_size=1 << 20):
+    """sha256 isi file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class Artifact:
+    """Hasil stage yang disimpan ke file: paths ikut fingerprint, load(paths[0]) dipakai
+    kalau stage yang menghasilkannya di-skip (tidak ada di memory)"""
+
+    def __init__(self, paths, load=None):
+        self.paths = [paths] if isinstance(paths, str) else list(paths)
+        self.load = load
+
+
+class Stage:
+    """Satu langkah pipeline: run(**inputs) → {nama artifact: nilai}.
+
+    inputs/outputs = nama artifact; modules = module yang source-nya ikut fingerprint;
+    params = argumen yang mempengaruhi hasil stage.
+    """
+
+    def __init__(self, name, run, inputs=(), outputs=(), modules=(), params=None):
+        self.name = name
+        self.run = run
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.modules = list(modules)
+        self.params = params or {}
+
+
+class Pipeline:
+    """DAG stage dengan fingerprint (hash isi input + versi code + params).
+
+    Stage yang fingerprint-nya sama dengan run terakhir dan output-nya belum berubah
+    di-skip. Stage yang input-nya sudah siap jalan bersamaan di thread pool, dan
+    DataFrame diteruskan antar stage di memory (file hanya dibaca kalau producer di-skip).
+    """
+
+    def __init__(self, stages, artifacts, state_path=PIPELINE_STATE_PATH, max_workers=2, force=()):
+        self.stages = stages
+        self.artifacts = artifacts
+        self.state_path = state_path
+        self.max_workers = max_workers
+        self.force = set(force)
+
+        self.producers = {output: stage.name for stage in stages for output in stage.outputs}
+        for stage in stages:
+            missing = [name for name in stage.inputs if name not in self.producers and name not in artifacts]
+            if missing:
+                raise ValueError(f"Stage {stage.name}: input tidak dikenal {missing}")
+
+        self.state = {'files': {}, 'stages': {}}
+        if os.path.exists(state_path):
+            with open(state_path, 'r') as f:
+                self.state.update(json.load(f))
+
+        self.values = {}
+        self.timings = []
+        self.seconds = 0.0
+        self.lock = threading.Lock()
+
+    def run(self):
+        """Jalankan semua stage sesuai dependency; return {artifact: nilai} yang ada di memory"""
+        start = time.perf_counter()
+        pending = list(self.stages)
+        done = set()
+        running = {}
+        try:
+            with ThreadPoolExecutor(self.max_workers) as pool:
+                while pending or running:
+                    for stage in list(pending):
+                        upstream = {self.producers[name] for name in stage.inputs if name in self.producers}
+                        if upstream <= done:
+                            pending.remove(stage)
+                            running[pool.submit(self._run_stage, stage)] = stage
+
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        future.result()
+                        done.add(running.pop(future).name)
+        finally:
+            self.save_state()
+        self.seconds = time.perf_counter() - start
+        self.print_timings()
+        return self.values
+
+    def _run_stage(self, stage):
+        start = time.perf_counter()
+        fingerprint = self.fingerprint(stage)
+
+        if stage.name not in self.force and self._up_to_date(stage, fingerprint):
+            status, rows = 'skipped', None
+        else:
+            print(f"▶️ Stage {stage.name}...")
+            inputs = {name: self._value(name) for name in stage.inputs}
+            outputs = stage.run(**inputs) or {}
+            record = {'fingerprint': fingerprint, 'outputs': {
+                path: self._file_hash(path) for name in stage.outputs for path in self._paths(name)
+            }}
+            with self.lock:
+                self.values.update(outputs)
+                self.state['stages'][stage.name] = record
+            status = 'ran'
+            rows = sum(len(value) for value in outputs.values() if isinstance(value, pd.DataFrame))
+
+        with self.lock:
+            self.timings.append({'stage': stage.name, 'status': status,
+                                 'seconds': time.perf_counter() - start, 'rows': rows})
+
+    def fingerprint(self, stage):
+        """sha256 atas versi code, params dan hash isi file input"""
+        inputs = {name: [self._file_hash(path) for path in self._paths(name)] for name in stage.inputs}
+        payload = json.dumps({
+            'code': code_version(*stage.modules),
+            'params': stage.params,
+            'inputs': inputs
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _up_to_date(self, stage, fingerprint):
+        record = self.state['stages'].get(stage.name)
+        if record is None or record['fingerprint'] != fingerprint:
+            return False
+        # Output yang dihapus atau diubah manual → jalankan ulang
+        return all(os.path.exists(path) and self._file_hash(path) == digest
+                   for path, digest in record['outputs'].items())
+
+    def _paths(self, name):
+        artifact = self.artifacts.get(name)
+        return artifact.paths if artifact else []
+
+    def _value(self, name):
+        """Nilai artifact dari memory; kalau producer di-skip, load dari file sekali"""
+        with self.lock:
+            if name not in self.values:
+                artifact = self.artifacts[name]
+                self.values[name] = artifact.load(artifact.paths[0]) if artifact.load else None
+            return self.values[name]
+
+    def _file_hash(self, path):
+        """Hash file di-cache per (size, mtime): file yang tidak berubah tidak dibaca ulang"""
+        if not os.path.exists(path):
+            return None
+        stat = os.stat(path)
+        with self.lock:
+            cached = self.state['files'].get(path)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            return cached['sha256']
+
+        digest = file_hash(path)
+        with self.lock:
+            self.state['files'][path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest}
+        return digest
+
+    def save_state(self):
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        tmp_path = self.state_path + '.tmp'
+        with self.lock, open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def print_timings(self):
+        print("\n⏱️ Pipeline stages:")
+        print(f"   {'Stage':<14}{'Status':<10}{'Seconds':>9}{'Rows':>10}")
+        order = {stage.name: i for i, stage in enumerate(self.stages)}
+        for timing in sorted(self.timings, key=lambda t: order[t['stage']]):
+            rows = f"{timing['rows']:,}" if timing['rows'] is not None else '-'
+            print(f"   {timing['stage']:<14}{timing['status']:<10}{timing['seconds']:>9.2f}{rows:>10}")
+        # Stage independen jalan bersamaan: wall time bisa lebih kecil dari jumlah per stage
+        print(f"   {'Wall time':<24}{self.seconds:>9.2f}")
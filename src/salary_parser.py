@@ -0,0 +1,85 @@
+# src/salary_parser.py
+import re
+
+import numpy as np
+import pandas as pd
+
+USD_TO_IDR = 15000  # 1 USD = 15,000 IDR (sama dengan data cleaning)
+
+# Default kalau salary text tidak bisa di-parse (sama dengan parser lama)
+DEFAULT_SALARY_MIN = 5000000
+DEFAULT_SALARY_MAX = 8000000
+DEFAULT_RANGE_WIDTH = 2000000  # salary_max = salary_min + 2 juta kalau hanya ada satu angka
+
+_CURRENCY = r'(?:rp\.?|idr|usd|us\$|\$)'
+_NUMBER = r'\d+(?:[.,]\d+)*'
+_UNIT = r'(?:juta|jt|ribu|rb|k|m)\b'
+_RANGE = r'(?:-|–|—|~|s/d|sd|sampai|hingga|to)'
+
+# Satu pattern untuk min dan max sekaligus, contoh yang ditangani:
+# "8-12 juta", "Rp 8.000.000 - Rp 12.000.000", "8jt - 12jt", "500rb-800rb",
+# "IDR 8,000K - 12,000K", "USD 1,500 - 2,000", "$1.5K-$2K", "7,5 juta"
+SALARY_PATTERN = re.compile(
+    rf'{_CURRENCY}?\s*(?P<min>{_NUMBER})\s*(?P<min_unit>{_UNIT})?'
+    rf'(?:\s*{_RANGE}\s*{_CURRENCY}?\s*(?P<max>{_NUMBER})\s*(?P<max_unit>{_UNIT})?)?'
+)
+USD_PATTERN = re.compile(r'usd|us\$|\$')
+
+UNIT_MULTIPLIERS = {'juta': 1e6, 'jt': 1e6, 'm': 1e6, 'ribu': 1e3, 'rb': 1e3, 'k': 1e3}
+
+
+def _to_number(values):
+    """'8.000.000' / '8,000,000' → 8000000, '7,5' / '7.5' → 7.5 (vectorized)"""
+    values = values.astype(object)
+    grouped = values.str.fullmatch(r'\d{1,3}(?:[.,]\d{3})+').fillna(False).astype(bool)
+    cleaned = values.where(~grouped, values.str.replace(r'[.,]', '', regex=True))
+    cleaned = cleaned.where(grouped, cleaned.str.replace(',', '.', regex=False))
+    return pd.to_numeric(cleaned, errors='coerce')
+
+
+def parse_salary_text(salary_text):
+    """Parse salary_min dan salary_max dari salary text dalam satu pass.
+
+    Return DataFrame (index sama dengan input) dengan salary_min/salary_max int64
+    dalam rupiah dan salary_parse_failed (bool). Row yang gagal di-parse diisi default.
+    """
+    salary_text = pd.Series(salary_text)
+
+    # Salary text banyak yang sama persis: parse nilai unik saja lalu broadcast
+    codes, uniques = pd.factorize(salary_text.astype(object).str.lower(), use_na_sentinel=True)
+    parsed = _parse_unique(pd.Series(list(uniques) + [np.nan], dtype=object))
+
+    result = parsed.iloc[codes].reset_index(drop=True)  # code -1 → row NaN terakhir
+    result.index = salary_text.index
+    return result
+
+
+def _parse_unique(text):
+    parts = text.str.extract(SALARY_PATTERN)
+
+    # Unit di belakang angka kedua berlaku untuk keduanya ("8-12 juta")
+    min_unit = parts['min_unit'].fillna(parts['max_unit'])
+    max_unit = parts['max_unit'].fillna(parts['min_unit'])
+
+    low = _to_number(parts['min'])
+    high = _to_number(parts['max'])
+    is_usd = text.str.contains(USD_PATTERN).fillna(False).astype(bool)
+
+    def to_idr(values, units):
+        multiplier = units.map(UNIT_MULTIPLIERS).astype(float)
+        # Tanpa unit: angka kecil di job board rupiah berarti juta ("8-12")
+        implicit_juta = multiplier.isna() & (values < 1000) & ~is_usd
+        multiplier = multiplier.mask(implicit_juta, 1e6).fillna(1.0)
+        return values * multiplier * np.where(is_usd, USD_TO_IDR, 1)
+
+    salary_min = to_idr(low, min_unit)
+    salary_max = to_idr(high, max_unit)
+
+    parse_failed = salary_min.isna() | (salary_min <= 0)
+    salary_max = salary_max.fillna(salary_min + DEFAULT_RANGE_WIDTH)
+
+    return pd.DataFrame({
+        'salary_min': salary_min.mask(parse_failed, DEFAULT_SALARY_MIN).round().astype('int64'),
+        'salary_max': salary_max.mask(parse_failed, DEFAULT_SALARY_MAX).round().astype('int64'),
+        'salary_parse_failed': parse_failed.to_numpy()
+    })
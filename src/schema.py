@@ -0,0 +1,189 @@
+# src/schema.py
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from date_parser import OUTPUT_DATE_FORMAT, parse_dates
+
+# Kolom string dengan sedikit nilai unik: category = code int8/int16 per row + dictionary
+JOB_CATEGORICAL_COLUMNS = [
+    'title', 'company', 'location', 'industry', 'experience_level', 'company_size',
+    'employment_type', 'remote_option', 'city_tier', 'skill_category', 'salary_category', 'source'
+]
+
+# Compact dtype per kolom job dataset (raw maupun cleaned; kolom yang tidak ada dilewati).
+# Integer yang berisi NaN otomatis jadi nullable (Int8/Int32), teks CSV tetap sama.
+JOB_SCHEMA = {
+    **{col: 'category' for col in JOB_CATEGORICAL_COLUMNS},
+    'salary_min': 'int32',  # maksimal 50 juta setelah cleaning
+    'salary_max': 'int32',
+    'experience_years_min': 'int8',
+    'experience_years_max': 'int8',
+    'days_since_posted': 'int32',
+    'skill_category_mask': 'uint8',
+    # salary_avg tetap float64: float32 di kisaran puluhan juta ditulis ke CSV sebagai '6e+06'
+    'salary_competitiveness': 'float32',
+    'attractiveness_score': 'float32',
+    # Unit yang dihasilkan date_parser (pandas 3); apply_schema menyamakan unit di pandas 2
+    'posted_date': 'datetime64[us]',
+    'application_deadline': 'datetime64[us]'
+}
+
+TECH_SCHEMA = {
+    'technology': 'category',
+    'country': 'category',
+    'company_size': 'category',
+    'experience_years': 'int8',
+    'salary_usd': 'int32',
+    'salary_idr': 'int64'  # sampai miliaran rupiah per tahun, tidak muat int32
+}
+
+# Konstanta per dataset yang di-stamp collection ke setiap row → metadata dataset
+METADATA_COLUMNS = ['dataset_version', 'data_collection_date']
+
+
+def _nullable(dtype):
+    """int32 → Int32, uint8 → UInt8 (pandas nullable integer)"""
+    return f"{'UInt' if dtype.kind == 'u' else 'Int'}{dtype.itemsize * 8}"
+
+
+def _fits_integer(values, dtype):
+    """Semua nilai (selain NaN) bulat dan masuk range dtype integer"""
+    values = pd.to_numeric(values, errors='coerce').dropna()
+    if values.empty:
+        return True
+    info = np.iinfo(dtype)
+    return bool((values % 1 == 0).all() and values.min() >= info.min and values.max() <= info.max)
+
+
+def apply_schema(df, schema, date_format=None):
+    """Cast kolom sesuai schema (kolom yang tidak ada di schema dibiarkan).
+
+    Integer yang tidak muat (raw data dengan nilai aneh) tetap memakai dtype asalnya.
+    date_format = format tanggal yang sudah diketahui (tanpa deteksi).
+    """
+    df = df.copy()
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            continue
+        if dtype.startswith('datetime'):
+            parsed = parse_dates(df[col], date_format)[0]
+            df[col] = parsed if parsed.dtype == dtype else parsed.astype(dtype)
+            continue
+
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if dtype.kind in 'iu':
+            if not _fits_integer(df[col], dtype):
+                continue
+            if df[col].isna().any():
+                dtype = _nullable(dtype)
+        df[col] = df[col].astype(dtype)
+    return df
+
+
+def split_metadata(df, columns=METADATA_COLUMNS):
+    """Pindahkan kolom yang nilainya sama di semua row ke metadata dataset.
+
+    Return (df tanpa kolom tersebut, {kolom: nilai}); kolom yang nilainya berbeda
+    antar row (misalnya hasil beberapa collection run) tetap di df.
+    """
+    metadata = {}
+    for col in columns:
+        if col in df.columns and df[col].nunique(dropna=False) <= 1:
+            value = df[col].iloc[0] if len(df) else None
+            metadata[col] = None if pd.isna(value) else str(value)
+    return df.drop(columns=list(metadata)), metadata
+
+
+def migrate_metadata_columns(csv_path, columns=METADATA_COLUMNS, chunk_size=100000):
+    """CSV layout lama (dataset_version/data_collection_date di setiap row) → kolom dibuang,
+    nilainya pindah ke metadata file. File dibaca dan ditulis ulang per chunk.
+
+    Kalau file berisi beberapa collection run, nilai row terakhir (run terbaru) yang dipakai.
+    Return metadata yang dipindah ({} kalau file sudah memakai layout baru).
+    """
+    if not os.path.exists(csv_path):
+        return {}
+    legacy = [col for col in columns if col in pd.read_csv(csv_path, nrows=0).columns]
+    if not legacy:
+        return {}
+
+    metadata = {}
+    tmp_path = csv_path + '.tmp'
+    # Semua kolom dibaca sebagai teks supaya isi kolom lain tertulis ulang apa adanya
+    for i, chunk in enumerate(pd.read_csv(csv_path, chunksize=chunk_size, dtype=str, keep_default_na=False)):
+        for col in legacy:
+            values = chunk[col][chunk[col] != '']
+            if len(values):
+                metadata[col] = values.iloc[-1]
+        chunk.drop(columns=legacy).to_csv(tmp_path, mode='a' if i else 'w', header=i == 0, index=False)
+    os.replace(tmp_path, csv_path)
+
+    saved = load_metadata(csv_path)
+    saved['metadata'] = {**saved['metadata'], **metadata}
+    with open(metadata_path(csv_path), 'w') as f:
+        json.dump(saved, f, indent=2)
+    return metadata
+
+
+def remove_unused_categories(df):
+    """Buang category yang tidak muncul lagi (misalnya setelah filter) supaya
+    value_counts/groupby tidak menghasilkan group kosong"""
+    categorical = df.select_dtypes('category').columns
+    if len(categorical) == 0:
+        return df
+    df = df.copy()
+    for col in categorical:
+        df[col] = df[col].cat.remove_unused_categories()
+    return df
+
+
+def bytes_per_row(df):
+    return df.memory_usage(deep=True).sum() / len(df) if len(df) else 0.0
+
+
+def metadata_path(csv_path):
+    """data/processed/it_jobs_cleaned.csv → data/processed/it_jobs_cleaned.metadata.json"""
+    return os.path.splitext(csv_path)[0] + '.metadata.json'
+
+
+def save_metadata(csv_path, metadata, df, date_format=OUTPUT_DATE_FORMAT, memory_stats=None):
+    with open(metadata_path(csv_path), 'w') as f:
+        json.dump({
+            'metadata': metadata,
+            'columns': {col: str(dtype) for col, dtype in df.dtypes.items()},
+            'date_format': date_format,
+            'memory_stats': memory_stats or {}
+        }, f, indent=2)
+
+
+def load_metadata(csv_path):
+    """Isi metadata file (kosong kalau CSV tidak ditulis oleh cleaning)"""
+    saved = {'metadata': {}, 'columns': {}, 'date_format': None, 'memory_stats': {}}
+    if os.path.exists(metadata_path(csv_path)):
+        with open(metadata_path(csv_path), 'r') as f:
+            saved.update(json.load(f))
+    return saved
+
+
+def read_csv_with_schema(path, schema, columns=None):
+    """Load CSV langsung ke compact dtypes; metadata dataset ada di df.attrs['metadata'].
+
+    Kalau ada metadata file dari cleaning, format tanggal sudah diketahui (tidak dideteksi).
+    columns = hanya baca kolom ini (None = semua).
+    """
+    saved = load_metadata(path)
+    categorical = {col: 'category' for col, dtype in schema.items() if dtype == 'category'}
+    usecols = None if columns is None else (lambda col: col in columns)
+    df = pd.read_csv(path, dtype=categorical, usecols=usecols)
+    return with_schema(df, schema, saved['date_format'], saved['metadata'])
+
+
+def with_schema(df, schema, date_format=None, metadata=None):
+    """apply_schema + split_metadata untuk DataFrame yang sudah di memory (misalnya
+    output collection di pipeline); hasilnya sama dengan read_csv_with_schema"""
+    df, split = split_metadata(apply_schema(df, schema, date_format))
+    df.attrs['metadata'] = {**(metadata or {}), **split}
+    return df
@@ -0,0 +1,239 @@
+# src/scraping.py
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import aiohttp
+import numpy as np
+from bs4 import BeautifulSoup
+
+# Field per job card dari parse_listing_page (juga kolom frame kalau tidak ada card sama sekali)
+LISTING_COLUMNS = ['job_id', 'title', 'company', 'location', 'salary_text', 'description',
+                   'posted_date', 'source', 'source_url']
+
+def parse_listing_page(html, url=None):
+    """Parse satu halaman listing jadi list of job dicts (jalan di worker process)"""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    def text_of(card, selector):
+        element = card.select_one(selector)
+        return element.get_text(strip=True) if element else None
+
+    jobs = []
+    for card in soup.select('.job-card'):
+        posted = card.select_one('.posted-date')
+        jobs.append({
+            'job_id': card.get('data-job-id'),
+            'title': text_of(card, '.job-title'),
+            'company': text_of(card, '.company'),
+            'location': text_of(card, '.location'),
+            'salary_text': text_of(card, '.salary'),
+            'description': text_of(card, '.description'),
+            'posted_date': posted.get('datetime') if posted else None,
+            'source': 'scraped',
+            'source_url': url
+        })
+
+    return jobs
+
+
+class TokenBucket:
+    """Async token bucket: rata-rata `rate` request/detik dengan burst sampai `capacity`"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncListingFetcher:
+    """Concurrent fetcher untuk halaman listing job portal.
+
+    Satu aiohttp session dengan connection pool dan keep-alive, concurrency cap dan
+    token bucket per host, dan parsing BeautifulSoup di process pool supaya event
+    loop tidak ter-block.
+    """
+
+    def __init__(self, headers=None, max_connections=32, per_host_limit=4,
+                 requests_per_second=5.0, burst=5, parse_workers=None, timeout=30,
+                 cache=None):
+        self.headers = headers or {}
+        self.cache = cache
+        self.max_connections = max_connections
+        self.per_host_limit = per_host_limit
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.parse_workers = parse_workers
+        self.timeout = timeout
+
+        self._buckets = {}
+        self.latencies = []  # hanya page yang benar-benar di-request (termasuk 304)
+        self.cache_hits = 0  # page fresh dari cache, tanpa request
+        self.errors = []
+        self.elapsed = 0.0
+
+    def _bucket_for(self, host):
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.requests_per_second, self.burst)
+        return self._buckets[host]
+
+    @staticmethod
+    async def _in_thread(func, *args, **kwargs):
+        """Disk I/O cache dijalankan di thread pool supaya tidak mem-block fetch lain"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+    async def _fetch_page(self, session, url):
+        """Fetch satu URL (rate limited per host), return HTML atau None kalau gagal"""
+        entry = await self._in_thread(self.cache.lookup, url) if self.cache else None
+        if entry is not None and self.cache.is_fresh(entry):
+            html = await self._in_thread(self.cache.record_hit, url)
+            if html is not None:
+                self.cache_hits += 1
+                return html
+            entry = None  # di-evict sejak lookup: fetch biasa
+
+        request_headers = self.cache.conditional_headers(entry) if entry is not None else {}
+        await self._bucket_for(urlsplit(url).netloc).acquire()
+
+        start = time.perf_counter()
+        try:
+            async with session.get(url, headers=request_headers) as response:
+                revalidated = response.status == 304 and entry is not None
+                if revalidated:
+                    html = await self._in_thread(self.cache.record_revalidation, url)
+                else:
+                    response.raise_for_status()
+                    html = await response.text()
+                    etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.errors.append((url, str(e)))
+            return None
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+        if revalidated:
+            # Body di-evict selama revalidation: lookup sekarang miss, fetch ulang tanpa validator
+            return html if html is not None else await self._fetch_page(session, url)
+        if self.cache:
+            await self._in_thread(self.cache.store, url, html, etag=etag, last_modified=last_modified)
+        return html
+
+    async def _fetch_and_parse(self, session, parse_pool, url):
+        html = await self._fetch_page(session, url)
+        if html is None:
+            return []
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(parse_pool, partial(parse_listing_page, html, url))
+
+    async def fetch_all(self, urls):
+        """Fetch dan parse semua URL secara concurrent, return list of job dicts"""
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.per_host_limit,
+            keepalive_timeout=30
+        )
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as parse_pool:
+            async with aiohttp.ClientSession(headers=self.headers, connector=connector,
+                                             timeout=timeout) as session:
+                pages = await asyncio.gather(
+                    *(self._fetch_and_parse(session, parse_pool, url) for url in urls)
+                )
+        self.elapsed = time.perf_counter() - start
+
+        if self.cache:
+            await self._in_thread(self.cache.save_index)
+
+        return [job for page in pages for job in page]
+
+    def fetch(self, urls):
+        """Synchronous wrapper untuk fetch_all"""
+        return asyncio.run(self.fetch_all(urls))
+
+    def stats(self):
+        """Throughput dan latency dari run terakhir.
+
+        pages/pages_per_second hanya menghitung page yang di-request ke server; page yang
+        langsung dari cache dihitung terpisah di cache_hits.
+        """
+        pages = len(self.latencies)
+        stats = {
+            'pages': pages,
+            'cache_hits': self.cache_hits,
+            'errors': len(self.errors),
+            'elapsed_seconds': self.elapsed,
+            'pages_per_second': pages / self.elapsed if self.elapsed else 0.0,
+            'p95_latency_ms': float(np.percentile(self.latencies, 95) * 1000) if pages else 0.0
+        }
+        if self.cache:
+            stats['cache'] = self.cache.stats()
+        return stats
+
+
+def serve_fixture_pages(directory='data/fixtures/listings', host='127.0.0.1', port=0):
+    """Jalankan HTTP server lokal yang serve fixture pages (pengganti job portal untuk testing).
+
+    Return (server, base_url); panggil server.shutdown() kalau sudah selesai.
+    """
+    handler = partial(_QuietFixtureHandler, directory=os.path.abspath(directory))
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    bound_host, bound_port = server.server_address[:2]
+    return server, f'http://{bound_host}:{bound_port}'
+
+
+class _QuietFixtureHandler(SimpleHTTPRequestHandler):
+    # HTTP/1.1 supaya keep-alive benar-benar dipakai oleh client
+    protocol_version = 'HTTP/1.1'
+
+    def send_head(self):
+        """Tambah ETag (mtime + size) dan jawab If-None-Match dengan 304"""
+        self._etag = None
+        path = self.translate_path(self.path)
+        if os.path.isfile(path):
+            st = os.stat(path)
+            self._etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+            if self.headers.get('If-None-Match') == self._etag:
+                self.send_response(304)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return None
+
+        return super().send_head()
+
+    def end_headers(self):
+        if getattr(self, '_etag', None):
+            self.send_header('ETag', self._etag)
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
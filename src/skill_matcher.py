@@ -0,0 +1,104 @@
+# src/skill_matcher.py
+import re
+
+import numpy as np
+import pandas as pd
+
+# Alias umum di job description → nama skill canonical
+DEFAULT_SKILL_ALIASES = {
+    'js': 'JavaScript',
+    'nodejs': 'Node.js',
+    'node': 'Node.js',
+    'vue': 'Vue.js',
+    'vuejs': 'Vue.js',
+    'reactjs': 'React',
+    'react.js': 'React',
+    'golang': 'Go',
+    'postgres': 'PostgreSQL',
+    'k8s': 'Kubernetes'
+}
+
+# Skill hanya match di token boundary: tidak diapit huruf/angka/_/+/#
+# ("Java" tidak match di "JavaScript", "SQL" tidak match di "MySQL", "C" tidak match di "C++")
+BOUNDARY_BEFORE = r'(?<![\w+#])'
+BOUNDARY_AFTER = r'(?![\w+#])'
+
+
+def _normalize(phrase):
+    return ' '.join(phrase.lower().split())
+
+
+def _trie_pattern(phrases):
+    """Regex dari trie semua phrase: prefix yang sama di-share, jadi scan tetap cepat
+    walaupun dictionary berisi ribuan skill (alternation biasa dicoba satu per satu)."""
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        is_end = '' in node
+        branches = []
+        for char in sorted(key for key in node if key):
+            token = r'\s+' if char == ' ' else re.escape(char)
+            branches.append(token + build(node[char]))
+
+        if not branches:
+            return ''
+        if len(branches) == 1 and not is_end:
+            return branches[0]
+
+        # Quantifier ? greedy: phrase terpanjang dicoba dulu
+        pattern = '(?:' + '|'.join(branches) + ')'
+        return pattern + '?' if is_end else pattern
+
+    return build(trie)
+
+
+class SkillMatcher:
+    """Multi-pattern skill matcher yang dibangun sekali dari skill dictionary.
+
+    Semua skill dan alias dikompilasi jadi satu regex trie, lalu description di-scan
+    sekali (single pass) dengan longest match di token boundary.
+    """
+
+    def __init__(self, skills, aliases=None, default='General Programming'):
+        self.skills = list(skills)
+        self.default = default
+
+        skill_ids = {skill: i for i, skill in enumerate(self.skills)}
+        self.phrase_ids = {}
+        for skill, skill_id in skill_ids.items():
+            self.phrase_ids.setdefault(_normalize(skill), skill_id)
+        for alias, skill in (aliases or {}).items():
+            if skill in skill_ids:
+                self.phrase_ids.setdefault(_normalize(alias), skill_ids[skill])
+
+        self.pattern = re.compile(BOUNDARY_BEFORE + '(' + _trie_pattern(self.phrase_ids) + ')' + BOUNDARY_AFTER)
+
+    def match_ids(self, text):
+        """Skill id yang ditemukan di text (urut sesuai skill dictionary)"""
+        if not isinstance(text, str) or not self.phrase_ids:
+            return []
+
+        phrase_ids = self.phrase_ids
+        found = {phrase_ids[_normalize(match)] for match in self.pattern.findall(text.lower())}
+        return sorted(found)
+
+    def extract(self, text):
+        """Skill yang ditemukan sebagai string 'A, B, C' (atau default)"""
+        skill_ids = self.match_ids(text)
+        if not skill_ids:
+            return self.default
+        return ', '.join(self.skills[skill_id] for skill_id in skill_ids)
+
+    def extract_batch(self, descriptions):
+        """Extract skills untuk satu kolom description; description duplikat diproses sekali"""
+        codes, uniques = pd.factorize(pd.Series(descriptions), use_na_sentinel=True)
+        extracted = np.array([self.extract(text) for text in uniques] + [self.default], dtype=object)
+
+        # code -1 (NaN) menunjuk ke elemen terakhir, yaitu default
+        result = extracted[codes]
+        return pd.Series(result, index=getattr(descriptions, 'index', None), dtype=object)
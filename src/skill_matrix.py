@@ -0,0 +1,162 @@
+# src/skill_matrix.py
+import os
+
+import numpy as np
+import pandas as pd
+
+
+def _split_skills(skills_str):
+    """'A, B, A' → ['A', 'B'] (urutan pertama muncul, tanpa string kosong)"""
+    skills = (skill.strip() for skill in skills_str.split(','))
+    return list(dict.fromkeys(skill for skill in skills if skill))
+
+
+def _gather_rows(indptr, indices, rows):
+    """CSR arrays untuk subset row (boleh berulang) tanpa loop per row"""
+    rows = np.asarray(rows, dtype=np.int64)
+    lengths = np.diff(indptr)[rows]
+
+    new_indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=new_indptr[1:])
+
+    # Posisi tiap element = start row asal + offset di dalam row
+    offsets = np.arange(new_indptr[-1]) - np.repeat(new_indptr[:-1], lengths)
+    positions = np.repeat(indptr[:-1][rows], lengths) + offsets
+    return new_indptr, indices[positions]
+
+
+class SkillMatrix:
+    """Job × skill sparse matrix (CSR) dengan vocabulary skill yang di-intern.
+
+    Row i adalah job ke-i di it_jobs_cleaned.csv, indices berisi skill id yang
+    menunjuk ke vocabulary. Skill id stabil kalau vocabulary lama diberikan (misalnya
+    load_vocabulary dari matrix run sebelumnya): skill baru hanya ditambahkan di
+    belakang, urut alfabet. Tanpa vocabulary lama seluruh vocabulary urut alfabet.
+    """
+
+    def __init__(self, indptr, indices, vocabulary):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.vocabulary = list(vocabulary)
+        self.skill_ids = {skill: i for i, skill in enumerate(self.vocabulary)}
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    @property
+    def nnz(self):
+        return len(self.indices)
+
+    @classmethod
+    def from_skill_strings(cls, skills, vocabulary=None):
+        """Bangun matrix dari kolom required_skills ('A, B, C').
+
+        String yang sama hanya di-split sekali (factorize), lalu di-broadcast ke row.
+        """
+        codes, uniques = pd.factorize(pd.Series(skills, dtype=object), use_na_sentinel=True)
+        split_uniques = [_split_skills(str(value)) for value in uniques]
+
+        vocabulary = list(vocabulary or [])
+        known = set(vocabulary)
+        vocabulary += sorted({skill for skills in split_uniques for skill in skills} - known)
+        skill_ids = {skill: i for i, skill in enumerate(vocabulary)}
+
+        # CSR untuk nilai unik, row terakhir kosong untuk NaN (code -1)
+        unique_ids = [sorted(skill_ids[skill] for skill in skills) for skills in split_uniques] + [[]]
+        unique_indptr = np.zeros(len(unique_ids) + 1, dtype=np.int64)
+        np.cumsum([len(ids) for ids in unique_ids], out=unique_indptr[1:])
+        unique_indices = np.fromiter((i for ids in unique_ids for i in ids),
+                                     dtype=np.int32, count=unique_indptr[-1])
+
+        rows = np.where(codes < 0, len(unique_ids) - 1, codes)
+        indptr, indices = _gather_rows(unique_indptr, unique_indices, rows)
+        return cls(indptr, indices, vocabulary)
+
+    @classmethod
+    def concat(cls, parts, vocabulary=None):
+        """Gabung matrix per chunk (row berurutan) dengan vocabulary gabungan.
+
+        Hasilnya sama dengan from_skill_strings atas seluruh kolom sekaligus (dengan
+        vocabulary lama yang sama). concat([matrix], vocabulary) me-remap satu matrix.
+        """
+        vocabulary = list(vocabulary or [])
+        vocabulary += sorted(set().union(*(part.vocabulary for part in parts)) - set(vocabulary))
+        skill_ids = {skill: i for i, skill in enumerate(vocabulary)}
+
+        indptr = [np.zeros(1, dtype=np.int64)]
+        indices = []
+        offset = 0
+        for part in parts:
+            remap = np.array([skill_ids[skill] for skill in part.vocabulary], dtype=np.int32)
+            indptr.append(part.indptr[1:] + offset)
+            indices.append(remap[part.indices])
+            offset += part.nnz
+
+        indptr = np.concatenate(indptr)
+        indices = np.concatenate(indices) if indices else np.zeros(0, dtype=np.int32)
+        # Remap ke vocabulary lama tidak monoton: urutkan lagi skill id di dalam tiap row
+        rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        return cls(indptr, indices[np.lexsort((indices, rows))], vocabulary)
+
+    def take_rows(self, rows):
+        """Sub-matrix untuk row positions (misalnya hasil filter dashboard)"""
+        indptr, indices = _gather_rows(self.indptr, self.indices, rows)
+        return SkillMatrix(indptr, indices, self.vocabulary)
+
+    def row_ids(self):
+        """Row id untuk tiap element indices"""
+        return np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.indptr))
+
+    def ids_for(self, skills):
+        """Skill id untuk skill yang ada di vocabulary (yang tidak ada dilewati)"""
+        return np.array([self.skill_ids[skill] for skill in skills if skill in self.skill_ids],
+                        dtype=np.int32)
+
+    def skill_counts(self):
+        """Jumlah job per skill (Series, urut descending)"""
+        counts = np.bincount(self.indices, minlength=len(self.vocabulary))
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0]
+        return pd.Series(counts[order], index=pd.Index(np.array(self.vocabulary, dtype=object)[order]))
+
+    def skill_means(self, values):
+        """Rata-rata values (satu nilai per job) untuk job yang membutuhkan tiap skill"""
+        values = np.asarray(values, dtype=float)
+        weights = np.repeat(values, np.diff(self.indptr))
+        valid = ~np.isnan(weights)
+
+        sums = np.bincount(self.indices[valid], weights=weights[valid], minlength=len(self.vocabulary))
+        counts = np.bincount(self.indices[valid], minlength=len(self.vocabulary))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+        return pd.Series(means, index=pd.Index(self.vocabulary, dtype=object)).dropna()
+
+    def rows_with_any(self, skills):
+        """Boolean mask job yang membutuhkan minimal satu skill dari skills"""
+        hit = np.isin(self.indices, self.ids_for(skills))
+        return np.bincount(self.row_ids()[hit], minlength=len(self)) > 0
+
+    def category_counts(self, categories):
+        """{category: jumlah mention skill di category} dari skill_counts"""
+        counts = np.bincount(self.indices, minlength=len(self.vocabulary))
+        return {name: int(counts[self.ids_for(skills)].sum()) for name, skills in categories.items()}
+
+    def memory_usage(self):
+        return self.indptr.nbytes + self.indices.nbytes
+
+    def save(self, path):
+        np.savez_compressed(path, indptr=self.indptr, indices=self.indices,
+                            vocabulary=np.array(self.vocabulary, dtype=str))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data['indptr'], data['indices'], data['vocabulary'].tolist())
+
+
+def load_vocabulary(path):
+    """Vocabulary matrix yang tersimpan ([] kalau belum ada), tanpa load indptr/indices"""
+    if not os.path.exists(path):
+        return []
+    with np.load(path, allow_pickle=False) as data:
+        return data['vocabulary'].tolist()
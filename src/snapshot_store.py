@@ -0,0 +1,386 @@
+# src/snapshot_store.py
+import hashlib
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from columnar_store import PARQUET_AVAILABLE, ParquetWriter, parquet_path, read_datasets
+from date_parser import OUTPUT_DATE_FORMAT, parse_dates
+from dedup_index import key_hashes
+from job_store import partition_keys
+from schema import JOB_SCHEMA, TECH_SCHEMA
+
+SNAPSHOT_DIR = 'data/snapshots'
+
+# Identitas posting per table untuk diff (sama dengan key dedup di cleaning);
+# table tanpa key memakai hash seluruh row (perubahan = removed + added)
+TABLE_KEYS = {'jobs': ['company', 'title', 'location']}
+# Parquet menyimpan dtype persis; schema hanya dipakai kalau partition tersimpan sebagai CSV
+TABLE_SCHEMAS = {'jobs': JOB_SCHEMA, 'tech': TECH_SCHEMA}
+
+# Table tanpa posted_date disimpan sebagai satu partition
+SINGLE_PARTITION = 'all'
+
+_commit_lock = threading.Lock()
+
+
+def row_hashes(df):
+    """Hash (uint64) isi tiap row. Seperti data_profiler, numeric disamakan ke float64 dan
+    datetime ke ns, supaya dtype yang berbeda antar chunk (int8 vs Int8 vs float64 dengan
+    NaN, datetime us vs ns) tidak mempengaruhi hash"""
+    normalised = {}
+    for col in df.columns:
+        values = df[col]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            normalised[col] = values.dt.as_unit('ns')
+        elif pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            normalised[col] = values.astype(np.float64)
+    if normalised:
+        df = df.assign(**normalised)
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def posting_keys(df, key_columns=None):
+    """Hash identitas posting per row (key berulang dibedakan saat diff)"""
+    return key_hashes(df, key_columns) if key_columns else row_hashes(df)
+
+
+def _storable(df):
+    """Kolom object campuran (mis. posted_date raw: Timestamp + string dari scraping) dijadikan
+    string seperti di raw CSV, supaya bisa ditulis ke Parquet dan hash-nya stabil"""
+    mixed = [col for col in df.columns if df[col].dtype == object
+             and pd.api.types.infer_dtype(df[col], skipna=True) not in ('string', 'empty')]
+    if not mixed:
+        return df
+    return df.assign(**{col: df[col].where(df[col].isna(), df[col].astype(str)) for col in mixed})
+
+
+def split_partitions(df):
+    """(key, partition) per bulan posted_date; table tanpa posted_date = satu partition"""
+    if 'posted_date' not in df.columns:
+        return [(SINGLE_PARTITION, df)]
+    dates = df['posted_date']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = parse_dates(dates)[0]
+    return list(df.groupby(partition_keys(dates).to_numpy(), sort=True))
+
+
+class _StagedPartition:
+    """Partition yang ditulis per chunk ke file sementara (Parquet, atau CSV tanpa pyarrow),
+    lalu dipindah ke objects/ dengan nama hash-nya setelah semua chunk masuk"""
+
+    def __init__(self, path):
+        self.path = path
+        self.writer = ParquetWriter(path) if PARQUET_AVAILABLE else None
+        self.columns = None
+        self.rows = 0
+
+    def write(self, chunk):
+        if self.writer is not None:
+            self.writer.write(chunk)
+        else:
+            chunk.to_csv(self.path, mode='a', header=self.rows == 0, index=False, date_format=OUTPUT_DATE_FORMAT)
+        self.rows += len(chunk)
+
+    def finish(self, target):
+        if self.writer is not None:
+            self.writer.close()
+            os.replace(parquet_path(self.path), parquet_path(target))
+        else:
+            os.replace(self.path, target)
+
+    def discard(self):
+        if self.writer is not None:
+            self.writer.close()
+        for path in [self.path, parquet_path(self.path)]:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def print_snapshot_summary(store, version):
+    """Ringkasan version: row dan partition (baru vs sudah ada) per table, dan diff
+    posting terhadap version sebelumnya"""
+    print(f"🗂️ Snapshot {version['id']} ({version['kind']})")
+    for name, table in version['tables'].items():
+        partitions = len(table['partitions'])
+        line = (f"   {name}: {table['rows']:,} rows in {partitions} partition(s), "
+                f"{table['written']} written, {partitions - table['written']} shared")
+        if version['parent'] and table['key_columns']:
+            counts = store.diff_counts(version['parent'], version['id'], name)
+            line += (f" | vs {version['parent']}: +{counts['added']:,} added, -{counts['removed']:,} removed, "
+                     f"~{counts['changed']:,} changed")
+        print(line)
+
+
+def _occurrence_ids(index, columns):
+    """(kolom..., urutan kemunculan) per row: row dengan nilai sama tetap punya id berbeda"""
+    occurrence = index.groupby(columns, sort=False).cumcount()
+    return pd.MultiIndex.from_arrays([index[col] for col in columns] + [occurrence])
+
+
+class SnapshotStore:
+    """Setiap collection/cleaning run disimpan sebagai version yang immutable.
+
+    Partition (bulan posted_date, atau satu file per partition streaming) disimpan
+    content-addressed di objects/: partition yang isinya sama dipakai bersama antar
+    version. Tiap partition punya index hash key + hash isi per row, jadi diff dua
+    version hanya membuka partition yang hash-nya berbeda.
+    """
+
+    def __init__(self, directory=SNAPSHOT_DIR):
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, 'objects')
+        self.versions_dir = os.path.join(directory, 'versions')
+
+    # --- Version ---
+
+    def versions(self, kind=None):
+        """Semua version (paling lama dulu), opsional hanya satu kind ('collection'/'cleaning')"""
+        if not os.path.exists(self.versions_dir):
+            return []
+        versions = [self.get(os.path.splitext(name)[0]) for name in sorted(os.listdir(self.versions_dir))
+                    if name.endswith('.json')]
+        return [version for version in versions if kind is None or version['kind'] == kind]
+
+    def latest(self, kind=None):
+        versions = self.versions(kind)
+        return versions[-1] if versions else None
+
+    def get(self, version_id):
+        with open(os.path.join(self.versions_dir, f'{version_id}.json'), 'r') as f:
+            return json.load(f)
+
+    def commit(self, kind, tables, metadata=None, base=None, extend=False):
+        """Simpan run sebagai version baru; return manifest version-nya.
+
+        tables = {nama: DataFrame atau iterable (partition key, partition)}, partition =
+        DataFrame atau iterable chunk DataFrame (partition besar tidak perlu di-load utuh).
+        Dengan base (version id), partition dan table yang tidak diberikan diambil dari base;
+        extend=True menambahkan row ke partition base dengan key yang sama.
+        """
+        base_tables = self.get(base)['tables'] if base else {}
+        version_tables = {name: dict(table, written=0) for name, table in base_tables.items()}
+
+        for name, partitions in tables.items():
+            if isinstance(partitions, pd.DataFrame):
+                partitions = split_partitions(partitions)
+            key_columns = TABLE_KEYS.get(name)
+            table = version_tables.get(name, {'key_columns': key_columns, 'partitions': {}, 'written': 0})
+            table['partitions'] = dict(table['partitions'])
+            for key, part in partitions:
+                extends = table['partitions'].get(key) if extend else None
+                entry, written = self._put_partition(name, part, key_columns, extends)
+                if entry is None:
+                    continue
+                table['partitions'][key] = entry
+                table['written'] += written
+            table['rows'] = sum(entry['rows'] for entry in table['partitions'].values())
+            version_tables[name] = table
+
+        previous = self.latest(kind)
+        version = {
+            'kind': kind,
+            'parent': previous['id'] if previous else None,
+            'base': base,
+            'created_at': datetime.now().isoformat(),
+            'metadata': metadata or {},
+            'tables': version_tables
+        }
+        return self._save_version(version)
+
+    def append(self, kind, name, df, metadata=None):
+        """Version baru = version kind terakhir + row baru di table name; hanya partition
+        yang kena row baru ditulis (dipakai incremental collection)"""
+        base = self.latest(kind)
+        return self.commit(kind, {name: df}, metadata, base=base['id'] if base else None, extend=True)
+
+    # --- Read ---
+
+    def load(self, version_id, name, columns=None):
+        """Isi table dari satu version (urutan partition key)"""
+        partitions = self.get(version_id)['tables'][name]['partitions']
+        paths = [self._object_path(partitions[key]['hash']) for key in sorted(partitions)]
+        return read_datasets(paths, self._schema(name), columns)
+
+    def diff(self, old_id, new_id, name='jobs'):
+        """Posting added/removed/changed dari old_id ke new_id.
+
+        Partition dengan hash sama dilewati tanpa dibuka; hanya index (hash key + isi)
+        partition yang berbeda dibaca, dan row hanya di-load untuk posting yang berubah.
+        changed = row di new_id, previous = row yang sama di old_id (urutan sama).
+        """
+        added, removed, changed, previous, stats = self._diff_index(old_id, new_id, name)
+        return {
+            'added': self._take_rows(name, added),
+            'removed': self._take_rows(name, removed),
+            'changed': self._take_rows(name, changed),
+            'previous': self._take_rows(name, previous),
+            'stats': stats
+        }
+
+    def diff_counts(self, old_id, new_id, name='jobs'):
+        """Jumlah posting added/removed/changed tanpa me-load row-nya"""
+        added, removed, changed, _, stats = self._diff_index(old_id, new_id, name)
+        return {'added': len(added), 'removed': len(removed), 'changed': len(changed), **stats}
+
+    # --- Internal ---
+
+    def _diff_index(self, old_id, new_id, name):
+        """Match row antar version dari index partition yang hash-nya berbeda.
+
+        Key posting bisa berulang (raw data), jadi dicocokkan sebagai multiset: row dengan
+        key + isi sama dianggap tidak berubah, sisanya dipasangkan per key (changed);
+        kelebihan di new = added, di old = removed.
+        """
+        old_partitions = self.get(old_id)['tables'].get(name, {'partitions': {}})['partitions']
+        new_partitions = self.get(new_id)['tables'].get(name, {'partitions': {}})['partitions']
+        changed_keys = sorted(key for key in set(old_partitions) | set(new_partitions)
+                              if old_partitions.get(key, {}).get('hash') != new_partitions.get(key, {}).get('hash'))
+
+        old = self._changed_index([old_partitions[key] for key in changed_keys if key in old_partitions])
+        new = self._changed_index([new_partitions[key] for key in changed_keys if key in new_partitions])
+
+        old_rows, new_rows = _occurrence_ids(old, ['key', 'row']), _occurrence_ids(new, ['key', 'row'])
+        old = old[~old_rows.isin(new_rows)]
+        new = new[~new_rows.isin(old_rows)]
+
+        old_keys, new_keys = _occurrence_ids(old, ['key']), _occurrence_ids(new, ['key'])
+        old_matched, new_matched = old_keys.isin(new_keys), new_keys.isin(old_keys)
+        # changed dan previous diurutkan per (key, occurrence) supaya row ke-i saling berpasangan
+        previous = old[old_matched].set_axis(old_keys[old_matched]).sort_index()
+        changed = new[new_matched].set_axis(new_keys[new_matched]).sort_index()
+
+        stats = {
+            'partitions': len(set(old_partitions) | set(new_partitions)),
+            'partitions_compared': len(changed_keys),
+            'rows_compared': len(old_rows) + len(new_rows)
+        }
+        return new[~new_matched], old[~old_matched], changed, previous, stats
+
+    def _put_partition(self, name, chunks, key_columns, extends=None):
+        """Simpan partition kalau isinya belum ada di objects/; return (entry manifest, 1/0 ditulis).
+
+        chunks = DataFrame atau iterable chunk: tiap chunk di-hash lalu langsung ditulis ke
+        file staging, jadi yang disimpan di memory hanya hash per row. extends = entry
+        partition lama yang disambung di depan chunks (incremental, batch kecil): hash row
+        lama diambil dari index-nya, tidak dihitung ulang dari data yang dibaca ulang.
+        """
+        if isinstance(chunks, pd.DataFrame):
+            chunks = [chunks]
+        keys, rows = [], []
+        hashed = extends is not None
+        if extends is not None:
+            with np.load(self._index_path(extends['hash'])) as index:
+                keys.append(index['keys'])
+                rows.append(index['rows'])
+            new = [_storable(chunk) for chunk in chunks]
+            keys += [posting_keys(chunk, key_columns) for chunk in new]
+            rows += [row_hashes(chunk) for chunk in new]
+            chunks = [pd.concat([self._read_partition(name, extends)] + new, ignore_index=True)]
+
+        os.makedirs(self._staging_dir, exist_ok=True)
+        staged = _StagedPartition(os.path.join(self._staging_dir, f'{uuid.uuid4().hex}.csv'))
+        try:
+            for chunk in chunks:
+                chunk = _storable(chunk)
+                if staged.columns is None:
+                    staged.columns = list(chunk.columns)
+                chunk = chunk.reindex(columns=staged.columns)
+                if not hashed:
+                    keys.append(posting_keys(chunk, key_columns))
+                    rows.append(row_hashes(chunk))
+                staged.write(chunk)
+        except BaseException:
+            staged.discard()
+            raise
+        if staged.columns is None:  # tidak ada chunk sama sekali
+            return None, 0
+
+        keys, rows = np.concatenate(keys), np.concatenate(rows)
+        digest = hashlib.sha256()
+        # Hash dari nama kolom + hash row (bukan dtype): Int8 vs float64 dengan nilai yang sama
+        # dari mode cleaning berbeda tetap satu partition
+        digest.update(json.dumps(staged.columns).encode())
+        digest.update(keys.tobytes())
+        digest.update(rows.tobytes())
+        partition_hash = digest.hexdigest()
+        entry = {'hash': partition_hash, 'rows': staged.rows}
+
+        index_path = self._index_path(partition_hash)
+        if os.path.exists(index_path):
+            staged.discard()
+            return entry, 0
+
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        staged.finish(self._object_path(partition_hash))
+        # Index ditulis terakhir: partition dianggap ada kalau index-nya ada
+        with open(index_path + '.tmp', 'wb') as f:
+            np.savez(f, keys=keys, rows=rows)
+        os.replace(index_path + '.tmp', index_path)
+        return entry, 1
+
+    def _changed_index(self, entries):
+        """Index gabungan partition: hash key posting + hash isi + posisi row di partition-nya"""
+        frames = []
+        for entry in entries:
+            with np.load(self._index_path(entry['hash'])) as index:
+                frames.append(pd.DataFrame({'key': index['keys'], 'row': index['rows'],
+                                            'hash': entry['hash'], 'position': np.arange(len(index['keys']))}))
+        if not frames:
+            return pd.DataFrame({'key': np.zeros(0, dtype=np.uint64), 'row': np.zeros(0, dtype=np.uint64),
+                                 'hash': pd.Series([], dtype=object), 'position': np.zeros(0, dtype=np.int64)})
+        return pd.concat(frames, ignore_index=True)
+
+    def _take_rows(self, name, index):
+        """Row pada (partition hash, posisi) di index, urutan mengikuti index"""
+        index = index.reset_index(drop=True)
+        frames = []
+        for partition_hash, group in index.groupby('hash', sort=False):
+            rows = self._read_partition(name, {'hash': partition_hash}).iloc[group['position'].to_numpy()]
+            frames.append(rows.set_axis(group.index))
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames).sort_index().reset_index(drop=True)
+
+    def _read_partition(self, name, entry):
+        return read_datasets([self._object_path(entry['hash'])], self._schema(name))
+
+    @staticmethod
+    def _schema(name):
+        return {} if PARQUET_AVAILABLE else TABLE_SCHEMAS.get(name, {})
+
+    @property
+    def _staging_dir(self):
+        return os.path.join(self.objects_dir, 'tmp')
+
+    def _object_path(self, partition_hash):
+        # Nama CSV dipakai sebagai base path (write_parquet/read_datasets memakai .parquet-nya)
+        return os.path.join(self.objects_dir, partition_hash[:2], f'{partition_hash}.csv')
+
+    def _index_path(self, partition_hash):
+        return os.path.join(self.objects_dir, partition_hash[:2], f'{partition_hash}.npz')
+
+    def _save_version(self, version):
+        """Version id berurutan; file version dibuat eksklusif dan tidak pernah ditimpa"""
+        os.makedirs(self.versions_dir, exist_ok=True)
+        with _commit_lock:
+            number = len([name for name in os.listdir(self.versions_dir) if name.endswith('.json')])
+            while True:
+                number += 1
+                record = {'id': f'{number:06d}', **version}
+                path = os.path.join(self.versions_dir, f"{record['id']}.json")
+                with open(path + '.tmp', 'w') as f:
+                    json.dump(record, f, indent=2)
+                try:
+                    # link gagal kalau id sudah dipakai proses lain: coba id berikutnya
+                    os.link(path + '.tmp', path)
+                    return record
+                except FileExistsError:
+                    continue
+                finally:
+                    os.remove(path + '.tmp')
@@ -0,0 +1,136 @@
+# src/stage_cache.py
+import hashlib
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def code_version(*modules):
+    """Hash source code modules: cache otomatis invalid kalau logic cleaning berubah"""
+    digest = hashlib.sha256()
+    for module in modules:
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def row_fingerprints(df):
+    """Content hash (uint64) per row atas semua kolom, termasuk nama kolom (schema)"""
+    schema = pd.util.hash_array(np.array(['\x1f'.join(map(str, df.columns))], dtype=object))[0]
+    return pd.util.hash_pandas_object(df, index=False).to_numpy() ^ schema
+
+
+class StageCache:
+    """Content-addressed cache untuk output stage cleaning yang row-local.
+
+    Key = fingerprint row input stage, value = row output stage. Row yang di-drop
+    stage (misalnya salary tidak valid) dicatat terpisah. Entry yang tidak dipakai
+    di run terakhir dibuang saat save, jadi ukuran cache mengikuti dataset terbaru.
+    """
+
+    def __init__(self, path='data/cache/cleaning/stage_cache.pkl', version=''):
+        self.path = path
+        self.version = version
+
+        self.hits = 0
+        self.misses = 0
+        self.seconds = 0.0
+        self.entries = None
+        self.dropped = np.zeros(0, dtype=np.uint64)
+        self.used = []
+
+        if os.path.exists(path):
+            try:
+                payload = pd.read_pickle(path)
+            except Exception:
+                # Cache rusak: mulai dari cache kosong daripada gagal cleaning
+                payload = None
+            if payload is not None and payload.get('version') == version:
+                self.entries = payload['entries']
+                self.dropped = payload['dropped']
+
+    def contains(self, fingerprints):
+        known = np.isin(fingerprints, self.dropped)
+        if self.entries is not None:
+            known |= np.isin(fingerprints, self.entries.index.to_numpy())
+        return known
+
+    def add(self, fingerprints, outputs, kept):
+        """Simpan output stage untuk row baru; outputs berisi row yang kept saja (urutan sama)"""
+        entries = outputs.set_axis(pd.Index(fingerprints[kept], dtype=np.uint64), axis=0)
+        self.entries = entries if self.entries is None else pd.concat([self.entries, entries])
+        self.dropped = np.union1d(self.dropped, fingerprints[~kept])
+
+    def get(self, fingerprints):
+        """(mask row yang kept, output stage untuk row tersebut)"""
+        kept = ~np.isin(fingerprints, self.dropped)
+        positions = self.entries.index.get_indexer(fingerprints[kept])
+        return kept, self.entries.iloc[positions]
+
+    def apply(self, df, stages, columns):
+        """Jalankan stages (yang hanya membaca columns) untuk row yang belum ada di cache.
+
+        Fingerprint dihitung dari columns saja, jadi perubahan kolom lain (description,
+        company, ...) tidak membuat row dihitung ulang. Return df dengan row yang di-drop
+        stage sudah dibuang dan kolom output stage diisi dari cache.
+        """
+        start = time.perf_counter()
+        inputs = df[[col for col in columns if col in df.columns]]
+        fingerprints = row_fingerprints(inputs)
+        self.used.append(fingerprints)
+
+        hit = self.contains(fingerprints)
+        self.hits += int(hit.sum())
+        self.misses += int((~hit).sum())
+
+        if not hit.all():
+            # Input identik cukup diproses sekali
+            new_rows = ~hit & ~pd.Series(fingerprints).duplicated().to_numpy()
+            outputs = stages(inputs[new_rows].copy())
+            kept = inputs.index[new_rows].isin(outputs.index)
+            self.add(fingerprints[new_rows], outputs, kept)
+
+        kept, outputs = self.get(fingerprints)
+        df = df[kept].copy()
+        for col in outputs.columns:
+            values = outputs[col].set_axis(df.index)
+            # Entry dari run berbeda bisa beda dtype numeric: ikuti dtype input run ini
+            if (col in df.columns and pd.api.types.is_numeric_dtype(df[col].dtype)
+                    and pd.api.types.is_numeric_dtype(values.dtype)):
+                values = values.astype(df[col].dtype)
+            df[col] = values
+
+        self.seconds += time.perf_counter() - start
+        return df
+
+    def save(self, prune=True):
+        """Simpan cache (atomic write); prune = buang entry yang tidak dipakai run ini"""
+        entries, dropped = self.entries, self.dropped
+        if entries is not None:
+            entries = entries[~entries.index.duplicated()]
+        if prune:
+            used = np.unique(np.concatenate(self.used)) if self.used else np.zeros(0, dtype=np.uint64)
+            dropped = dropped[np.isin(dropped, used)]
+            if entries is not None:
+                entries = entries[entries.index.isin(used)]
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        pd.to_pickle({
+            'version': self.version,
+            'entries': entries,
+            'dropped': dropped
+        }, tmp_path)
+        os.replace(tmp_path, self.path)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': 0 if self.entries is None else len(self.entries),
+            'seconds': self.seconds
+        }
@@ -0,0 +1,165 @@
+# src/survey_loader.py
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Kolom single-value yang dibutuhkan dari Stack Overflow Developer Survey (results CSV)
+SURVEY_DTYPES = {
+    'ResponseId': 'int32',
+    'Country': 'category',
+    'YearsCodePro': 'category',
+    'ConvertedCompYearly': 'float32',
+    'OrgSize': 'category',
+    'RemoteWork': 'category'
+}
+
+# Kolom multi-select, nilai dipisah ';' (contoh: "Bash/Shell;JavaScript;Python")
+MULTI_SELECT_COLUMNS = [
+    'LanguageHaveWorkedWith',
+    'WebframeHaveWorkedWith',
+    'DatabaseHaveWorkedWith',
+    'PlatformHaveWorkedWith',
+    'ToolsTechHaveWorkedWith'
+]
+
+# OrgSize survey → kategori company_size yang dipakai tech trends
+ORG_SIZE_MAPPING = {
+    'Just me - I am a freelancer, sole proprietor, etc.': 'Small',
+    '2 to 9 employees': 'Small',
+    '10 to 19 employees': 'Small',
+    '20 to 99 employees': 'Small',
+    '100 to 499 employees': 'Medium',
+    '500 to 999 employees': 'Medium',
+    '1,000 to 4,999 employees': 'Large',
+    '5,000 to 9,999 employees': 'Large',
+    '10,000 or more employees': 'Large'
+}
+
+COMPANY_SIZES = ['Small', 'Medium', 'Large']
+
+
+class SurveyTechTable:
+    """Respondent × technology sparse table (CSR) plus kolom respondent yang compact.
+
+    respondents punya satu row per respondent (categorical/float32), indptr/indices
+    menyimpan technology id per respondent, technologies adalah vocabulary-nya.
+    """
+
+    def __init__(self, respondents, indptr, indices, technologies):
+        self.respondents = respondents
+        self.indptr = indptr
+        self.indices = indices
+        self.technologies = technologies
+
+    def __len__(self):
+        return len(self.respondents)
+
+    @property
+    def nnz(self):
+        return len(self.indices)
+
+    def slice_respondents(self, start, stop):
+        """Sub-table untuk respondent [start, stop) tanpa copy matrix penuh"""
+        stop = min(stop, len(self))
+        lo, hi = self.indptr[start], self.indptr[stop]
+        return SurveyTechTable(
+            self.respondents.iloc[start:stop].reset_index(drop=True),
+            self.indptr[start:stop + 1] - lo,
+            self.indices[lo:hi],
+            self.technologies
+        )
+
+    def memory_usage(self):
+        """Total bytes (respondents + sparse arrays)"""
+        return (int(self.respondents.memory_usage(deep=True).sum())
+                + self.indptr.nbytes + self.indices.nbytes)
+
+
+def _parse_years(values):
+    """YearsCodePro: 'Less than 1 year' → 0, 'More than 50 years' → 50, angka → angka"""
+    years = values.astype(object).replace({'Less than 1 year': '0', 'More than 50 years': '50'})
+    return pd.to_numeric(years, errors='coerce').astype('float32')
+
+
+def load_survey_chunked(path, chunk_size=50000, countries=None, multi_select_columns=None):
+    """Stream survey CSV per chunk dan bangun SurveyTechTable.
+
+    Hanya kolom yang dibutuhkan yang dibaca (dengan dtype compact), multi-select
+    langsung diubah ke technology id, jadi peak memory ~ satu chunk + hasil sparse.
+    """
+    multi_select_columns = multi_select_columns or MULTI_SELECT_COLUMNS
+    wanted = set(SURVEY_DTYPES) | set(multi_select_columns)
+    dtypes = dict(SURVEY_DTYPES, **{col: 'object' for col in multi_select_columns})
+
+    tech_ids = {}
+    respondent_frames = []
+    row_counts = []
+    index_chunks = []
+    n_respondents = 0
+
+    reader = pd.read_csv(path, usecols=lambda col: col in wanted, dtype=dtypes,
+                         chunksize=chunk_size, low_memory=True)
+    for chunk in reader:
+        present = [col for col in multi_select_columns if col in chunk.columns]
+        chunk = chunk.reindex(columns=list(SURVEY_DTYPES) + present)
+
+        if countries is not None:
+            chunk = chunk[chunk['Country'].isin(countries)]
+        if chunk.empty:
+            continue
+        chunk = chunk.reset_index(drop=True)
+
+        # Multi-select → (row dalam chunk, technology) pairs, unik per respondent
+        exploded = [chunk[col].str.split(';').explode() for col in present]
+        selected = pd.concat(exploded).dropna() if exploded else pd.Series(dtype=object)
+        selected = selected[selected != '']
+        pairs = pd.DataFrame({'row': selected.index.to_numpy(), 'tech': selected.to_numpy()})
+        pairs = pairs.drop_duplicates().sort_values('row', kind='stable')
+
+        for tech in pd.unique(pairs['tech']):
+            if tech not in tech_ids:
+                tech_ids[tech] = len(tech_ids)
+
+        index_chunks.append(pairs['tech'].map(tech_ids).to_numpy(dtype=np.int32))
+        row_counts.append(np.bincount(pairs['row'].to_numpy(dtype=np.int64), minlength=len(chunk)))
+
+        respondent_ids = chunk['ResponseId']
+        if respondent_ids.isna().all():
+            respondent_ids = np.arange(n_respondents + 1, n_respondents + len(chunk) + 1)
+
+        respondent_frames.append(pd.DataFrame({
+            'respondent_id': np.asarray(respondent_ids, dtype=np.int32),
+            'country': chunk['Country'].astype(object).astype('category'),
+            'experience_years': _parse_years(chunk['YearsCodePro']),
+            'salary_usd': chunk['ConvertedCompYearly'].to_numpy(dtype='float32'),
+            'company_size': pd.Categorical(chunk['OrgSize'].astype(object).map(ORG_SIZE_MAPPING),
+                                           categories=COMPANY_SIZES),
+            'remote_work': chunk['RemoteWork'].astype(object).astype('category')
+        }))
+        n_respondents += len(chunk)
+
+    if respondent_frames:
+        # Categories per chunk bisa beda, jadi digabung dengan union_categoricals
+        respondents = pd.DataFrame({
+            col: (union_categoricals([frame[col] for frame in respondent_frames])
+                  if col in ('country', 'remote_work') else
+                  pd.concat([frame[col] for frame in respondent_frames], ignore_index=True))
+            for col in respondent_frames[0].columns
+        })
+    else:
+        # Tidak ada respondent yang lolos filter: frame kosong dengan dtype yang sama
+        respondents = pd.DataFrame({
+            'respondent_id': np.zeros(0, dtype=np.int32),
+            'country': pd.Categorical([]),
+            'experience_years': np.zeros(0, dtype='float32'),
+            'salary_usd': np.zeros(0, dtype='float32'),
+            'company_size': pd.Categorical([], categories=COMPANY_SIZES),
+            'remote_work': pd.Categorical([])
+        })
+
+    counts = np.concatenate(row_counts) if row_counts else np.zeros(0, dtype=np.int64)
+    indptr = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    indices = np.concatenate(index_chunks) if index_chunks else np.zeros(0, dtype=np.int32)
+
+    return SurveyTechTable(respondents, indptr, indices, list(tech_ids))
@@ -0,0 +1,104 @@
+# src/watermarks.py
+import json
+import os
+
+import pandas as pd
+
+
+class WatermarkStore:
+    """High-water mark per source untuk incremental collection.
+
+    Per source disimpan posted_date terbaru yang sudah di-collect, plus job_id yang
+    posted tepat di tanggal itu (supaya posting dengan tanggal sama tidak dobel).
+    Row lama tidak perlu dibaca ulang: biaya filter sebanding dengan batch baru.
+    """
+
+    def __init__(self, path='data/raw/watermarks.json'):
+        self.path = path
+        self.state = {}
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                self.state = json.load(f)
+
+    def get(self, source):
+        return self.state.setdefault(source, {
+            'last_posted_date': None,
+            'boundary_ids': [],
+            'undated_ids': [],
+            'next_id': 1,
+            'rows_collected': 0
+        })
+
+    def filter_new(self, source, df):
+        """Boolean mask untuk row yang lebih baru dari watermark source"""
+        watermark = self.get(source)
+        posted = pd.to_datetime(df['posted_date'], errors='coerce')
+        job_ids = df['job_id'].astype(str)
+
+        undated = posted.isna()
+        is_new = undated & ~job_ids.isin(watermark['undated_ids'])
+
+        if watermark['last_posted_date'] is None:
+            return is_new | ~undated
+
+        last_posted = pd.Timestamp(watermark['last_posted_date'])
+        newer = posted > last_posted
+        same_day_unseen = (posted == last_posted) & ~job_ids.isin(watermark['boundary_ids'])
+
+        return is_new | newer | same_day_unseen
+
+    def advance(self, source, new_rows):
+        """Geser watermark source setelah new_rows berhasil disimpan"""
+        watermark = self.get(source)
+        watermark['rows_collected'] += len(new_rows)
+        if new_rows.empty:
+            return watermark
+
+        posted = pd.to_datetime(new_rows['posted_date'], errors='coerce')
+        job_ids = new_rows['job_id'].astype(str)
+
+        watermark['undated_ids'] = sorted(set(watermark['undated_ids']) | set(job_ids[posted.isna()]))
+
+        if posted.notna().any():
+            newest = posted.max()
+            last_posted = pd.Timestamp(watermark['last_posted_date']) if watermark['last_posted_date'] else None
+
+            at_newest = set(job_ids[posted == newest])
+            if last_posted is not None and newest == last_posted:
+                at_newest |= set(watermark['boundary_ids'])
+
+            if last_posted is None or newest >= last_posted:
+                watermark['last_posted_date'] = newest.isoformat()
+                watermark['boundary_ids'] = sorted(at_newest)
+
+        return watermark
+
+    def reset(self):
+        """Mulai dari kosong (full collection menulis ulang seluruh raw store)"""
+        self.state = {}
+
+    def observe(self, rows):
+        """Geser watermark semua source dari row yang sudah ada di raw store.
+
+        Dipakai full/streaming collection dan untuk seed dari raw file lama yang belum
+        punya watermarks.json. next_id generated ikut digeser melewati job_id terbesar.
+        """
+        for source, source_rows in rows.groupby('source', sort=False):
+            watermark = self.advance(source, source_rows)
+            numbers = pd.to_numeric(source_rows['job_id'].astype(str).str.extract(r'(\d+)$', expand=False),
+                                    errors='coerce')
+            if numbers.notna().any():
+                watermark['next_id'] = max(watermark['next_id'], int(numbers.max()) + 1)
+
+    def observe_csv(self, path, chunk_size=100000):
+        """observe() dari CSV per chunk (hanya kolom watermark, memory tetap kecil)"""
+        for chunk in pd.read_csv(path, usecols=['job_id', 'posted_date', 'source'], dtype=str,
+                                 chunksize=chunk_size):
+            self.observe(chunk)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+import sys
+
+# Module di src/ di-import langsung seperti run_*.py (sys.path.append('src'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
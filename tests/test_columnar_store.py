@@ -0,0 +1,58 @@
+# tests/test_columnar_store.py
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from columnar_store import (PARQUET_AVAILABLE, has_parquet, iter_dataset, read_dataset, read_datasets,
+                            write_parquet)
+from schema import JOB_SCHEMA, apply_schema
+
+pytestmark = pytest.mark.skipif(not PARQUET_AVAILABLE, reason="pyarrow tidak ter-install")
+
+
+def _cleaned_jobs(titles, days):
+    return apply_schema(pd.DataFrame({
+        'title': titles,
+        'salary_min': [5000000 + i for i in range(len(titles))],
+        'posted_date': pd.Timestamp('2025-05-01') + pd.to_timedelta(days, unit='D')
+    }), JOB_SCHEMA)
+
+
+def test_parquet_keeps_dtypes_metadata_and_projection(tmp_path):
+    path = str(tmp_path / 'it_jobs_cleaned.csv')
+    df = _cleaned_jobs(['Data Analyst', 'QA Engineer', 'Data Analyst'], [0, 1, 2])
+    df.to_csv(path, index=False)
+    write_parquet(df, path, {'dataset_version': '1.0'})
+    assert has_parquet(path)
+
+    loaded = read_dataset(path, JOB_SCHEMA, columns=['title', 'posted_date', 'missing'])
+    assert list(loaded.columns) == ['title', 'posted_date']
+    assert loaded['title'].dtype == 'category' and loaded['posted_date'].dtype == 'datetime64[us]'
+    assert loaded.attrs['metadata'] == {'dataset_version': '1.0'}
+    assert [len(chunk) for chunk in iter_dataset(path, JOB_SCHEMA, chunk_size=2)] == [2, 1]
+
+
+def test_stale_parquet_falls_back_to_csv(tmp_path):
+    path = str(tmp_path / 'it_jobs_cleaned.csv')
+    df = _cleaned_jobs(['Data Analyst'], [0])
+    write_parquet(df, path)
+    time.sleep(0.01)
+    # Incremental cleaning hanya append ke CSV: Parquet jadi lebih lama dari CSV
+    pd.concat([df, _cleaned_jobs(['QA Engineer'], [1])]).to_csv(path, index=False)
+    os.utime(path)
+
+    assert not has_parquet(path)
+    assert read_dataset(path, JOB_SCHEMA)['title'].tolist() == ['Data Analyst', 'QA Engineer']
+
+
+def test_read_datasets_unifies_categories(tmp_path):
+    paths = [str(tmp_path / 'a.csv'), str(tmp_path / 'b.csv')]
+    write_parquet(_cleaned_jobs(['Data Analyst'], [0]), paths[0])
+    write_parquet(_cleaned_jobs(['QA Engineer', 'Data Analyst'], [1, 2]), paths[1])
+
+    df = read_datasets(paths, JOB_SCHEMA)
+    assert df['title'].dtype == 'category'
+    assert df['title'].tolist() == ['Data Analyst', 'QA Engineer', 'Data Analyst']
+    assert df['salary_min'].dtype == 'int32'
@@ -0,0 +1,27 @@
+# tests/test_data_profiler.py
+import numpy as np
+import pandas as pd
+
+from data_profiler import DataProfiler, HyperLogLog
+
+
+def test_distinct_counts_are_exact_for_small_columns():
+    df = pd.DataFrame({
+        'job_id': [f'JOB_{i:04d}' for i in range(752)],
+        'posted_date': pd.Timestamp('2025-01-01') + pd.to_timedelta(np.arange(752) % 89, unit='D'),
+        'salary_min': np.where(np.arange(752) % 10 == 0, np.nan, np.arange(752) % 40)
+    })
+    profiler = DataProfiler()
+    for start in range(0, len(df), 100):
+        profiler.update(df.iloc[start:start + 100])
+
+    assert profiler.distinct_counts() == df.nunique().to_dict()
+
+
+def test_large_columns_switch_to_registers():
+    hll = HyperLogLog(precision=10)
+    for start in range(0, 200000, 20000):
+        hll.add(pd.util.hash_array(np.arange(start, start + 20000)))
+
+    assert hll.registers is not None and hll.exact is None
+    assert abs(hll.estimate() - 200000) / 200000 < 0.1
@@ -0,0 +1,33 @@
+# tests/test_date_parser.py
+import pandas as pd
+
+from date_parser import OUTPUT_DATE_FORMAT, detect_date_format, parse_dates
+
+
+def test_mixed_formats_parse_like_to_datetime():
+    values = pd.Series(['2025-03-15 05:34:48.254323', '2025-05-20', None, '2025-03-15 05:34:48.254323',
+                        '2025-04-01T08:30:00', 'not a date'], index=[5, 6, 7, 8, 9, 10], name='posted_date')
+    parsed, date_format = parse_dates(values)
+
+    assert date_format == OUTPUT_DATE_FORMAT  # format mayoritas di sample
+    assert parsed.index.tolist() == values.index.tolist() and parsed.name == 'posted_date'
+    assert parsed.tolist()[:2] == [pd.Timestamp('2025-03-15 05:34:48.254323'), pd.Timestamp('2025-05-20')]
+    assert parsed.iloc[3] == parsed.iloc[0]
+    assert parsed.iloc[4] == pd.Timestamp('2025-04-01 08:30:00')
+    assert parsed.isna().tolist() == [False, False, True, False, False, True]
+
+
+def test_result_does_not_depend_on_row_order():
+    values = ['2025-05-20', '2025-05-21', '2025-03-15 05:34:48.254323']
+    forward, _ = parse_dates(values)
+    backward, _ = parse_dates(values[::-1])
+    assert forward.tolist() == backward.tolist()[::-1]
+
+
+def test_known_format_skips_detection_and_datetimes_pass_through():
+    assert detect_date_format(['2025-05-20', '2025-05-21']) == '%Y-%m-%d'
+    parsed, date_format = parse_dates(['2025-05-20 00:00:00'], '%Y-%m-%d %H:%M:%S')
+    assert date_format == '%Y-%m-%d %H:%M:%S' and parsed[0] == pd.Timestamp('2025-05-20')
+
+    already = pd.Series(pd.to_datetime(['2025-05-20']))
+    pd.testing.assert_series_equal(parse_dates(already)[0], already)
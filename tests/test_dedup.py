@@ -0,0 +1,63 @@
+# tests/test_dedup.py
+import numpy as np
+import pandas as pd
+
+from dedup_index import DedupIndex, key_hashes
+from near_duplicates import NearDuplicateDetector
+
+KEYS = ['company', 'title', 'location']
+
+
+def _jobs(companies):
+    return pd.DataFrame({'company': companies, 'title': 'Data Engineer', 'location': 'Jakarta'})
+
+
+def test_filter_new_across_runs_and_after_compact(tmp_path):
+    directory = str(tmp_path / 'dedup')
+    index = DedupIndex(directory)
+    for run in range(5):
+        keep, hashes = index.filter_new(_jobs([f'Company {run}', f'Company {run}']), KEYS)
+        assert keep.tolist() == [True, False]  # duplikat di dalam batch juga dibuang
+        index.add(hashes)
+    assert len(index.segment_paths) == 5
+
+    index.compact()
+    assert len(index.segment_paths) == 1 and len(index) == 5
+
+    # Index dibuka ulang dari disk: key lama dikenal, key baru tidak
+    reopened = DedupIndex(directory)
+    keep, hashes = reopened.filter_new(_jobs(['Company 0', 'Company 4', 'Company 9']), KEYS)
+    assert keep.tolist() == [False, False, True]
+    assert reopened.stats()['known'] == 2
+    np.testing.assert_array_equal(hashes, key_hashes(_jobs(['Company 9']), KEYS))
+
+
+def test_add_compacts_when_segments_exceed_limit(tmp_path):
+    index = DedupIndex(str(tmp_path / 'dedup'))
+    for i in range(DedupIndex.MAX_SEGMENTS + 1):
+        index.add(key_hashes(_jobs([f'Company {i}']), KEYS))
+    assert len(index.segment_paths) == 1 and len(index) == DedupIndex.MAX_SEGMENTS + 1
+    assert index.contains(key_hashes(_jobs(['Company 0', 'Company X']), KEYS)).tolist() == [True, False]
+
+
+def test_near_duplicate_threshold():
+    description = ('We are hiring a backend engineer to build payment APIs with Python, PostgreSQL, '
+                   'Docker and Kubernetes on a fast growing fintech platform in Jakarta')
+    df = pd.DataFrame({
+        'title': ['Backend Engineer', 'Backend Engineer', 'Backend Engineer', 'Data Analyst'],
+        'company': ['Xendit', 'Xendit', 'Xendit', 'Xendit'],
+        'description': [
+            description,
+            description + ' team',  # repost dengan satu kata tambahan
+            'Looking for an engineer to maintain legacy PHP monolith and jQuery frontend code',
+            'Analyze sales data with SQL and Tableau dashboards for the commercial team'
+        ]
+    })
+
+    detector = NearDuplicateDetector(threshold=0.8)
+    keep = detector.find(df)
+    assert keep.tolist() == [True, False, True, True]
+    assert detector.stats['near_duplicate_pairs'] == 1 and detector.stats['near_duplicates'] == 1
+
+    # Posting lain dari company yang sama (Jaccard rendah) tidak pernah di-merge
+    assert NearDuplicateDetector(threshold=0.3).find(df.drop(index=1)).all()
@@ -0,0 +1,54 @@
+# tests/test_http_cache.py
+import os
+
+from http_cache import HTTPResponseCache
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = HTTPResponseCache(str(tmp_path), max_bytes=300)
+    for page in range(3):
+        cache.store(f'http://jobs.test/?page={page}', 'x' * 100)
+
+    # page 0 paling lama disimpan tapi baru diakses → page 1 yang di-evict
+    cache.record_hit('http://jobs.test/?page=0')
+    cache.store('http://jobs.test/?page=3', 'x' * 100)
+
+    assert cache.lookup('http://jobs.test/?page=1') is None
+    assert cache.lookup('http://jobs.test/?page=0') is not None
+    assert not os.path.exists(cache._body_path(cache._key('http://jobs.test/?page=1')))
+    assert cache.stats()['bytes'] == 300 and cache.evictions == 1
+
+
+def test_index_order_survives_reload(tmp_path):
+    cache = HTTPResponseCache(str(tmp_path), max_bytes=250)
+    cache.store('http://jobs.test/a', 'x' * 100)
+    cache.store('http://jobs.test/b', 'x' * 100)
+    cache.record_hit('http://jobs.test/a')
+    cache.save_index()
+
+    reloaded = HTTPResponseCache(str(tmp_path), max_bytes=250)
+    reloaded.store('http://jobs.test/c', 'x' * 100)
+    assert reloaded.lookup('http://jobs.test/b') is None
+    assert reloaded.lookup('http://jobs.test/a') is not None
+
+
+def test_body_evicted_after_lookup_is_a_miss(tmp_path):
+    cache = HTTPResponseCache(str(tmp_path), max_bytes=150)
+    cache.store('http://jobs.test/a', 'x' * 100)
+    entry = cache.lookup('http://jobs.test/a')
+    assert entry is not None
+
+    # Store lain (thread lain) meng-evict a di antara lookup dan read body
+    cache.store('http://jobs.test/b', 'x' * 100)
+    assert cache.record_hit('http://jobs.test/a') is None
+    assert cache.record_revalidation('http://jobs.test/a') is None
+    assert cache.stats()['hits'] == 0 and cache.stats()['revalidations'] == 0
+
+
+def test_missing_body_file_drops_entry(tmp_path):
+    cache = HTTPResponseCache(str(tmp_path))
+    cache.store('http://jobs.test/a', 'x' * 100)
+    os.remove(cache._body_path(cache._key('http://jobs.test/a')))
+
+    assert cache.read_body('http://jobs.test/a') is None
+    assert cache.stats()['entries'] == 0 and cache.stats()['bytes'] == 0
@@ -0,0 +1,69 @@
+# tests/test_incremental_collection.py
+import os
+
+import pandas as pd
+import pytest
+
+import data_collection
+from schema import load_metadata
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Collection menulis ke data/raw relatif terhadap cwd"""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('data/raw')
+    return tmp_path
+
+
+def _read_raw():
+    return pd.read_csv('data/raw/it_jobs_raw.csv', usecols=['job_id', 'posted_date', 'source'])
+
+
+def _assert_only_newer_rows(history, new_rows):
+    """Tidak ada row baru yang posted sebelum posting terbaru source-nya di history"""
+    newest = pd.to_datetime(history['posted_date'], format='mixed').groupby(history['source']).max()
+    posted = pd.to_datetime(new_rows['posted_date'], format='mixed')
+    assert (posted >= new_rows['source'].map(newest)).all()
+
+
+def test_full_then_incremental_keeps_job_ids_unique(workdir):
+    data_collection.main(n_rows=300)
+    assert os.path.exists(data_collection.WATERMARK_PATH)
+    history = _read_raw()
+
+    new_rows = data_collection.main(n_rows=300, incremental=True)
+    assert _read_raw()['job_id'].is_unique
+    _assert_only_newer_rows(history, new_rows)
+
+    generated_ids = new_rows.loc[new_rows['source'] == 'generated', 'job_id'].str[4:].astype(int)
+    assert (generated_ids > 300).all()
+
+
+def test_incremental_seeds_watermarks_from_existing_raw_file(workdir):
+    data_collection.main(n_rows=300)
+    os.remove(data_collection.WATERMARK_PATH)  # raw store dari run sebelum ada watermark
+    history = _read_raw()
+
+    new_rows = data_collection.main(n_rows=300, incremental=True)
+    assert _read_raw()['job_id'].is_unique
+    _assert_only_newer_rows(history, new_rows)
+
+
+def test_incremental_migrates_legacy_raw_layout(workdir):
+    data_collection.main(n_rows=300)
+    # Raw store layout lama: metadata di setiap row, di akhir header
+    legacy = pd.read_csv('data/raw/it_jobs_raw.csv')
+    legacy['data_collection_date'] = '2025-05-27 05:34:48.519446'
+    legacy['dataset_version'] = '1.0'
+    legacy.to_csv('data/raw/it_jobs_raw.csv', index=False)
+
+    new_rows = data_collection.main(n_rows=300, incremental=True)
+    raw = pd.read_csv('data/raw/it_jobs_raw.csv')
+    assert list(raw.columns) == data_collection.RAW_JOB_COLUMNS
+    assert raw['job_id'].is_unique
+    assert raw['source'].isin(['generated', 'scraped', 'stackoverflow']).all()
+    assert len(raw) == len(legacy) + len(new_rows)
+    assert load_metadata('data/raw/it_jobs_raw.csv')['metadata'] == {
+        'data_collection_date': '2025-05-27 05:34:48.519446', 'dataset_version': '1.0'
+    }
@@ -0,0 +1,39 @@
+# tests/test_job_store.py
+import numpy as np
+import pandas as pd
+
+from job_store import PartitionedJobStore, active_mask, dataset_reference_time
+
+
+def _jobs():
+    return pd.DataFrame({
+        'job_id': [f'JOB_{i}' for i in range(6)],
+        'title': ['Data Analyst', 'Backend Developer', 'DevOps Engineer', 'QA Engineer', 'Data Engineer', 'UI Designer'],
+        'posted_date': pd.to_datetime(['2025-01-10', '2025-01-20', '2025-03-05', '2025-04-15', '2025-05-01', None]),
+        'application_deadline': pd.to_datetime(['2025-02-10', '2025-02-20', '2025-06-05', '2025-05-20', '2025-07-01', None]),
+        'salary_avg': [8e6, 12e6, 15e6, 7e6, 14e6, 9e6]
+    })
+
+
+def test_active_only_prunes_expired_partitions(tmp_path):
+    store = PartitionedJobStore(str(tmp_path / 'it_jobs'))
+    store.write(_jobs(), {'reference_time': '2025-05-27 00:00:00'})
+
+    active = store.load(['job_id'], active_only=True)
+    assert active['job_id'].tolist() == ['JOB_2', 'JOB_4']
+    # Partition Januari (semua deadline lewat), April (20 Mei) dan unknown tidak dibuka
+    assert store.scan_stats == {'partitions': 5, 'opened': 2, 'skipped': 3}
+
+    posted = PartitionedJobStore(str(tmp_path / 'it_jobs')).load(
+        ['job_id'], posted_from='2025-01-15', posted_to='2025-04-30')
+    assert posted['job_id'].tolist() == ['JOB_1', 'JOB_2', 'JOB_3']
+
+
+def test_csv_active_filter_matches_store(tmp_path):
+    """Dashboard tanpa store memakai active_mask + dataset_reference_time atas CSV"""
+    jobs = _jobs()
+    store = PartitionedJobStore(str(tmp_path / 'it_jobs'))
+    store.write(jobs, {'data_collection_date': '2025-05-27 05:34:48'})
+
+    rows = np.flatnonzero(active_mask(jobs, dataset_reference_time({'data_collection_date': '2025-05-27 05:34:48'})))
+    assert sorted(jobs['job_id'].iloc[rows]) == sorted(store.load(['job_id'], active_only=True)['job_id'])
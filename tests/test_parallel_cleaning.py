@@ -0,0 +1,28 @@
+# tests/test_parallel_cleaning.py
+import pandas as pd
+
+from data_cleaning import ITJobDataCleaner
+from data_collection import ITJobDataCollector
+
+
+def _raw_with_location_variants():
+    """Generated jobs + salinan dengan location lowercase dan alias ('DKI Jakarta')"""
+    raw = ITJobDataCollector().generate_job_data_vectorized(n_rows=300)
+    lowered = raw.head(100).assign(location=raw['location'].head(100).str.lower())
+    jakarta = raw[raw['location'] == 'Jakarta'].head(50).assign(location='dki jakarta')
+    return pd.concat([raw, lowered, jakarta], ignore_index=True)
+
+
+def _clean(raw, workers):
+    cleaner = ITJobDataCleaner(verbose=False)
+    cleaner.raw_jobs = raw
+    return cleaner.clean_job_data(workers=workers).reset_index(drop=True)
+
+
+def test_parallel_cleaning_matches_serial_on_location_variants():
+    raw = _raw_with_location_variants()
+    serial = _clean(raw, workers=None)
+    parallel = _clean(raw, workers=2)
+
+    assert not serial.duplicated(['company', 'title', 'location']).any()
+    pd.testing.assert_frame_equal(parallel, serial)
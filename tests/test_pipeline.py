@@ -0,0 +1,69 @@
+# tests/test_pipeline.py
+import pandas as pd
+
+from pipeline import Artifact, Pipeline, Stage
+
+
+def _pipeline(tmp_path, calls, force=()):
+    raw, cleaned, report = (str(tmp_path / name) for name in ('raw.csv', 'cleaned.csv', 'report.txt'))
+
+    def clean(raw_jobs):
+        calls.append('clean')
+        df = raw_jobs.drop_duplicates()
+        df.to_csv(cleaned, index=False)
+        return {'cleaned_jobs': df}
+
+    def summarize(cleaned_jobs):
+        calls.append('summarize')
+        with open(report, 'w') as f:
+            f.write(f"{len(cleaned_jobs)} jobs")
+        return {}
+
+    artifacts = {
+        'raw_jobs': Artifact(raw, load=pd.read_csv),
+        'cleaned_jobs': Artifact(cleaned, load=pd.read_csv),
+        'report': Artifact(report)
+    }
+    stages = [
+        Stage('clean', clean, inputs=['raw_jobs'], outputs=['cleaned_jobs'], params={'keep': 'first'}),
+        Stage('summarize', summarize, inputs=['cleaned_jobs'], outputs=['report'])
+    ]
+    return Pipeline(stages, artifacts, state_path=str(tmp_path / 'state.json'), force=force)
+
+
+def test_skips_up_to_date_stages_and_reruns_changed_ones(tmp_path):
+    pd.DataFrame({'title': ['A', 'A', 'B']}).to_csv(tmp_path / 'raw.csv', index=False)
+    calls = []
+    _pipeline(tmp_path, calls).run()
+    assert calls == ['clean', 'summarize']
+
+    # Tidak ada yang berubah: semua stage di-skip
+    calls.clear()
+    _pipeline(tmp_path, calls).run()
+    assert calls == []
+
+    # Output yang dihapus → hanya stage yang menghasilkannya dijalankan ulang
+    (tmp_path / 'report.txt').unlink()
+    _pipeline(tmp_path, calls).run()
+    assert calls == ['summarize']
+    assert (tmp_path / 'report.txt').read_text() == '2 jobs'
+
+    # Input berubah → stage dan downstream dijalankan ulang
+    calls.clear()
+    pd.DataFrame({'title': ['A', 'B', 'C']}).to_csv(tmp_path / 'raw.csv', index=False)
+    _pipeline(tmp_path, calls).run()
+    assert calls == ['clean', 'summarize']
+    assert (tmp_path / 'report.txt').read_text() == '3 jobs'
+
+
+def test_forced_stage_loads_input_of_skipped_producer(tmp_path):
+    pd.DataFrame({'title': ['A', 'A', 'B']}).to_csv(tmp_path / 'raw.csv', index=False)
+    _pipeline(tmp_path, []).run()
+
+    calls = []
+    pipeline = _pipeline(tmp_path, calls, force=['summarize'])
+    values = pipeline.run()
+    assert calls == ['summarize']
+    # cleaned_jobs tidak ada di memory: dibaca dari file output stage clean
+    assert values['cleaned_jobs']['title'].tolist() == ['A', 'B']
+    assert {t['stage']: t['status'] for t in pipeline.timings} == {'clean': 'skipped', 'summarize': 'ran'}
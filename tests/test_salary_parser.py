@@ -0,0 +1,24 @@
+# tests/test_salary_parser.py
+import pandas as pd
+
+from salary_parser import DEFAULT_SALARY_MAX, DEFAULT_SALARY_MIN, USD_TO_IDR, parse_salary_text
+
+
+def test_parses_common_salary_formats():
+    texts = ['8-12 juta', 'Rp 8.000.000 - Rp 12.000.000', '8jt - 12jt', 'IDR 8,000K - 12,000K',
+             '500rb-800rb', '7,5 juta', 'USD 1,500 - 2,000', '$1.5K-$2K']
+    parsed = parse_salary_text(texts)
+
+    assert parsed['salary_min'].tolist() == [8000000, 8000000, 8000000, 8000000,
+                                             500000, 7500000, 1500 * USD_TO_IDR, 1500 * USD_TO_IDR]
+    assert parsed['salary_max'].tolist() == [12000000, 12000000, 12000000, 12000000,
+                                             800000, 9500000, 2000 * USD_TO_IDR, 2000 * USD_TO_IDR]
+    assert not parsed['salary_parse_failed'].any()
+
+
+def test_unparseable_text_gets_default_range():
+    parsed = parse_salary_text(pd.Series(['Negotiable', None, '10-15 juta'], index=[3, 4, 5]))
+    assert parsed.index.tolist() == [3, 4, 5]
+    assert parsed['salary_parse_failed'].tolist() == [True, True, False]
+    assert parsed.loc[3, 'salary_min'] == DEFAULT_SALARY_MIN and parsed.loc[4, 'salary_max'] == DEFAULT_SALARY_MAX
+    assert parsed['salary_min'].dtype == 'int64'
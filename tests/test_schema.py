@@ -0,0 +1,52 @@
+# tests/test_schema.py
+import pandas as pd
+
+from schema import (JOB_SCHEMA, apply_schema, load_metadata, migrate_metadata_columns, read_csv_with_schema,
+                    save_metadata, split_metadata)
+
+
+def _raw_jobs():
+    return pd.DataFrame({
+        'title': ['Data Analyst', 'Data Analyst', 'QA Engineer'],
+        'salary_min': [5000000.0, 7000000.0, None],
+        'experience_years_min': [0.0, 2.0, 5.0],
+        'skill_category_mask': [1, 3, 300],  # 300 tidak muat uint8
+        'posted_date': ['2025-05-01 00:00:00.000000', '2025-05-02 00:00:00.000000', None],
+        'dataset_version': ['1.0', '1.0', '1.0'],
+        'data_collection_date': ['2025-05-27', '2025-05-28', '2025-05-28']
+    })
+
+
+def test_apply_schema_compacts_and_keeps_values():
+    df = apply_schema(_raw_jobs(), JOB_SCHEMA)
+    assert df['title'].dtype == 'category'
+    assert str(df['salary_min'].dtype) == 'Int32'  # NaN → nullable integer
+    assert df['experience_years_min'].dtype == 'int8'
+    assert df['skill_category_mask'].dtype == 'int64'  # tidak muat: dtype asal
+    assert df['posted_date'].dtype == 'datetime64[us]'
+    assert df['salary_min'].tolist()[:2] == [5000000, 7000000]
+
+
+def test_split_metadata_moves_only_constant_columns():
+    df, metadata = split_metadata(_raw_jobs())
+    assert metadata == {'dataset_version': '1.0'}
+    assert 'dataset_version' not in df.columns and 'data_collection_date' in df.columns
+
+
+def test_metadata_file_roundtrip_and_legacy_migration(tmp_path):
+    path = str(tmp_path / 'it_jobs_raw.csv')
+    _raw_jobs().to_csv(path, index=False)
+
+    # Nilai dari row terakhir (collection run terbaru) yang dipindah ke metadata file
+    assert migrate_metadata_columns(path, chunk_size=2) == {'dataset_version': '1.0',
+                                                             'data_collection_date': '2025-05-28'}
+    assert migrate_metadata_columns(path) == {}
+    migrated = pd.read_csv(path)
+    assert 'dataset_version' not in migrated.columns and len(migrated) == 3
+
+    df = read_csv_with_schema(path, JOB_SCHEMA)
+    assert df.attrs['metadata']['data_collection_date'] == '2025-05-28'
+
+    save_metadata(path, {'dataset_version': '2.0'}, df)
+    saved = load_metadata(path)
+    assert saved['metadata'] == {'dataset_version': '2.0'} and saved['columns']['title'] == 'category'
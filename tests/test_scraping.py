@@ -0,0 +1,71 @@
+# tests/test_scraping.py
+import os
+import socket
+
+import pandas as pd
+
+from data_collection import ITJobDataCollector
+from http_cache import HTTPResponseCache
+from scraping import LISTING_COLUMNS, AsyncListingFetcher, parse_listing_page, serve_fixture_pages
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _unused_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_failed_listing_pages_give_empty_batch():
+    """Semua URL gagal (connection refused) → batch kosong, bukan KeyError"""
+    port = _unused_port()
+    collector = ITJobDataCollector(http_cache_dir=None)
+
+    scraped = collector.scrape_listing_pages([f'http://127.0.0.1:{port}/jobs?page={page}' for page in range(3)])
+    assert list(scraped.columns) == LISTING_COLUMNS
+    assert collector.scrape_stats['errors'] == 3
+
+    processed = collector._process_scraped_data(scraped)
+    assert len(processed) == 0
+    assert {'salary_min', 'salary_max', 'required_skills'} <= set(processed.columns)
+
+
+def test_cards_without_location_or_description():
+    html = """
+    <div class="job-card" data-job-id="SCR_1">
+      <h2 class="job-title">Backend Developer</h2><span class="company">Tokopedia</span>
+      <span class="salary">Rp 8-12 juta</span><time class="posted-date" datetime="2025-05-20"></time>
+    </div>
+    <div class="job-card" data-job-id="SCR_2">
+      <h2 class="job-title">Data Engineer</h2><span class="company">Gojek</span>
+      <span class="location">Remote, Indonesia</span><p class="description">Python and SQL</p>
+    </div>
+    """
+    scraped = pd.DataFrame(parse_listing_page(html, 'http://jobs.test/'), columns=LISTING_COLUMNS)
+    assert scraped['location'].isna().tolist() == [True, False]
+
+    processed = ITJobDataCollector(http_cache_dir=None)._process_scraped_data(scraped)
+    assert processed['remote_option'].tolist() == ['On-site', 'Remote']
+    assert processed['required_skills'].notna().all()
+
+
+def test_cache_hits_are_counted_outside_throughput(tmp_path):
+    server, base_url = serve_fixture_pages(os.path.join(REPO_ROOT, 'data', 'fixtures', 'listings'))
+    try:
+        urls = [f'{base_url}/{page}' for page in sorted(os.listdir(os.path.join(REPO_ROOT, 'data', 'fixtures', 'listings')))]
+        cache = HTTPResponseCache(str(tmp_path))
+
+        first = AsyncListingFetcher(cache=cache, parse_workers=1)
+        first.fetch(urls)
+        assert first.stats()['pages'] == len(urls) and first.stats()['cache_hits'] == 0
+
+        second = AsyncListingFetcher(cache=cache, parse_workers=1)
+        jobs = second.fetch(urls)
+        stats = second.stats()
+    finally:
+        server.shutdown()
+
+    assert len(jobs) > 0
+    assert stats['pages'] == 0 and stats['pages_per_second'] == 0.0
+    assert stats['cache_hits'] == len(urls)
@@ -0,0 +1,28 @@
+# tests/test_skill_matcher.py
+import pandas as pd
+
+from skill_matcher import DEFAULT_SKILL_ALIASES, SkillMatcher
+
+SKILLS = ['Python', 'JavaScript', 'Java', 'C', 'C++', 'SQL', 'MySQL', 'Node.js', 'Vue.js', 'Machine Learning']
+
+
+def test_matches_only_at_token_boundaries():
+    matcher = SkillMatcher(SKILLS)
+    assert matcher.extract('Senior JavaScript engineer, MySQL experience') == 'JavaScript, MySQL'
+    assert matcher.extract('C++ and C, some Java') == 'Java, C, C++'
+    assert matcher.extract('machine   learning with python') == 'Python, Machine Learning'
+
+
+def test_aliases_and_default():
+    matcher = SkillMatcher(SKILLS, aliases=DEFAULT_SKILL_ALIASES)
+    assert matcher.extract('nodejs + vue backend, JS everywhere') == 'JavaScript, Node.js, Vue.js'
+    assert matcher.extract('Excellent communication skills') == 'General Programming'
+    # Alias ke skill yang tidak ada di dictionary diabaikan
+    assert matcher.extract('k8s and golang') == 'General Programming'
+
+
+def test_extract_batch_keeps_index_and_fills_missing():
+    matcher = SkillMatcher(SKILLS)
+    descriptions = pd.Series(['Python, SQL', None, 'Python, SQL'], index=[10, 11, 12])
+    extracted = matcher.extract_batch(descriptions)
+    assert extracted.to_dict() == {10: 'Python, SQL', 11: 'General Programming', 12: 'Python, SQL'}
@@ -0,0 +1,35 @@
+# tests/test_skill_matrix.py
+import numpy as np
+
+from skill_matrix import SkillMatrix, load_vocabulary
+
+
+def _row_skills(matrix):
+    return [[matrix.vocabulary[i] for i in matrix.indices[start:stop]]
+            for start, stop in zip(matrix.indptr[:-1], matrix.indptr[1:])]
+
+
+def test_concat_matches_single_pass_and_keeps_saved_ids(tmp_path):
+    first = ['Python, SQL', 'Java, Python', None]
+    second = ['Go, SQL', 'Python, Python, Docker']
+
+    saved = SkillMatrix.from_skill_strings(first)
+    path = tmp_path / 'it_jobs_skills.npz'
+    saved.save(path)
+    vocabulary = load_vocabulary(path)
+    assert vocabulary == ['Java', 'Python', 'SQL']
+
+    # Skill baru (Docker, Go) ditambahkan di belakang, id skill lama tidak bergeser
+    combined = SkillMatrix.concat([SkillMatrix.load(path), SkillMatrix.from_skill_strings(second)], vocabulary)
+    assert combined.vocabulary == ['Java', 'Python', 'SQL', 'Docker', 'Go']
+    assert _row_skills(combined) == [['Python', 'SQL'], ['Java', 'Python'], [], ['SQL', 'Go'], ['Python', 'Docker']]
+
+    single = SkillMatrix.from_skill_strings(first + second, vocabulary)
+    assert single.vocabulary == combined.vocabulary
+    np.testing.assert_array_equal(single.indptr, combined.indptr)
+    np.testing.assert_array_equal(single.indices, combined.indices)
+
+
+def test_load_vocabulary_without_saved_matrix(tmp_path):
+    assert load_vocabulary(tmp_path / 'missing.npz') == []
+    assert SkillMatrix.concat([SkillMatrix.from_skill_strings(['B, A'])], []).vocabulary == ['A', 'B']
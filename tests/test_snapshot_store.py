@@ -0,0 +1,56 @@
+# tests/test_snapshot_store.py
+import pandas as pd
+
+from schema import JOB_SCHEMA, apply_schema
+from snapshot_store import SnapshotStore
+
+
+def _jobs():
+    return apply_schema(pd.DataFrame({
+        'company': ['Gojek', 'Tokopedia', 'Traveloka', 'Bukalapak', 'Shopee'],
+        'title': ['Data Analyst', 'Backend Developer', 'DevOps Engineer', 'QA Engineer', 'Data Engineer'],
+        'location': ['Jakarta', 'Jakarta', 'Tangerang', 'Jakarta', 'Jakarta'],
+        'posted_date': ['2025-01-10', '2025-02-20', '2025-03-05', '2025-03-15', '2025-04-01'],
+        'salary_min': [8000000, 12000000, 15000000, 7000000, 14000000]
+    }), JOB_SCHEMA)
+
+
+def test_diff_counts_added_removed_changed(tmp_path):
+    store = SnapshotStore(str(tmp_path / 'snapshots'))
+    old = store.commit('cleaning', {'jobs': _jobs()})
+    assert old['tables']['jobs']['written'] == 4  # Jan, Feb, Mar, Apr
+
+    jobs = _jobs()
+    jobs.loc[2, 'salary_min'] = 16000000            # changed (Maret)
+    jobs = jobs.drop(index=3)                       # removed (Maret)
+    jobs = pd.concat([jobs, apply_schema(pd.DataFrame({
+        'company': ['Blibli'], 'title': ['UI Designer'], 'location': ['Jakarta'],
+        'posted_date': ['2025-04-20'], 'salary_min': [9000000]
+    }), JOB_SCHEMA)], ignore_index=True)             # added (April)
+    new = store.commit('cleaning', {'jobs': jobs})
+
+    # Partition Januari dan Februari sama persis → dipakai bersama, tidak ditulis ulang
+    assert new['tables']['jobs']['written'] == 2
+    assert new['parent'] == old['id']
+
+    counts = store.diff_counts(old['id'], new['id'])
+    assert (counts['added'], counts['removed'], counts['changed']) == (1, 1, 1)
+    assert (counts['partitions'], counts['partitions_compared']) == (4, 2)
+
+    diff = store.diff(old['id'], new['id'])
+    assert diff['added']['company'].tolist() == ['Blibli']
+    assert diff['removed']['company'].tolist() == ['Bukalapak']
+    assert diff['changed']['salary_min'].tolist() == [16000000]
+    assert diff['previous']['salary_min'].tolist() == [15000000]
+
+    assert store.diff_counts(new['id'], new['id'])['rows_compared'] == 0
+
+
+def test_load_round_trips_version(tmp_path):
+    store = SnapshotStore(str(tmp_path / 'snapshots'))
+    version = store.commit('cleaning', {'jobs': _jobs()})
+
+    loaded = store.load(version['id'], 'jobs')
+    assert loaded['company'].astype(str).tolist() == _jobs()['company'].astype(str).tolist()
+    assert loaded['salary_min'].tolist() == _jobs()['salary_min'].tolist()
+    assert store.latest('cleaning')['id'] == version['id']
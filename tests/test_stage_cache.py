@@ -0,0 +1,51 @@
+# tests/test_stage_cache.py
+import pandas as pd
+
+from data_cleaning import ITJobDataCleaner
+from data_collection import ITJobDataCollector
+from stage_cache import StageCache
+
+
+def _clean(raw, stage_cache):
+    cleaner = ITJobDataCleaner(verbose=False, stage_cache=stage_cache)
+    cleaner.raw_jobs = raw.copy()
+    cleaner.reference_time = pd.Timestamp('2025-06-01')
+    df = cleaner.clean_job_data()
+    return df.reset_index(drop=True), cleaner.skill_cleaning_stats
+
+
+def test_cached_rows_give_same_output_and_skip_stages(tmp_path):
+    path = str(tmp_path / 'stage_cache.pkl')
+    raw = ITJobDataCollector().generate_job_data_vectorized(n_rows=200)
+    expected, _ = _clean(raw, None)
+
+    cache = StageCache(path, version='v1')
+    first, first_stats = _clean(raw, cache)
+    cache.save()
+    assert first_stats['cached_rows'] == 0 and first_stats['rows'] > 0
+
+    # Run kedua: semua row hit, stage row-local tidak dijalankan sama sekali
+    cache = StageCache(path, version='v1')
+    second, second_stats = _clean(raw, cache)
+    assert cache.hits == len(raw) and cache.misses == 0
+    assert second_stats['rows'] == 0 and second_stats['cached_rows'] == len(raw)
+
+    pd.testing.assert_frame_equal(first, expected)
+    pd.testing.assert_frame_equal(second, expected)
+
+
+def test_changed_rows_and_code_version_miss(tmp_path):
+    path = str(tmp_path / 'stage_cache.pkl')
+    raw = ITJobDataCollector().generate_job_data_vectorized(n_rows=50)
+    cache = StageCache(path, version='v1')
+    _clean(raw, cache)
+    cache.save()
+
+    changed = raw.copy()
+    changed.loc[:4, 'required_skills'] = 'python, docker'
+    cache = StageCache(path, version='v1')
+    _, stats = _clean(changed, cache)
+    assert cache.misses == 5 and stats['cached_rows'] == len(raw) - 5
+
+    # Versi code cleaning berbeda: cache lama tidak dipakai
+    assert StageCache(path, version='v2').entries is None
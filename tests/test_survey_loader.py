@@ -0,0 +1,44 @@
+# tests/test_survey_loader.py
+import pandas as pd
+import pytest
+
+from data_collection import ITJobDataCollector
+from survey_loader import load_survey_chunked
+
+
+@pytest.fixture
+def survey_path(tmp_path):
+    path = tmp_path / 'survey_results_public.csv'
+    pd.DataFrame({
+        'ResponseId': [1, 2, 3],
+        'Country': ['Indonesia', 'Germany', 'Indonesia'],
+        'YearsCodePro': ['3', 'Less than 1 year', 'More than 50 years'],
+        'ConvertedCompYearly': [12000.0, 60000.0, None],
+        'OrgSize': ['2 to 9 employees', '10,000 or more employees', '100 to 499 employees'],
+        'RemoteWork': ['Remote', 'Hybrid', 'Remote'],
+        'LanguageHaveWorkedWith': ['Python;SQL', 'Java', 'Python;Go;Python']
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+def test_country_filter_builds_sparse_table(survey_path):
+    table = load_survey_chunked(survey_path, chunk_size=2, countries=['Indonesia'])
+
+    assert table.respondents['respondent_id'].tolist() == [1, 3]
+    assert table.respondents['experience_years'].tolist() == [3, 50]
+    assert table.respondents['company_size'].tolist() == ['Small', 'Medium']
+    # Technology yang dipilih dua kali oleh satu respondent dihitung sekali
+    assert table.indptr.tolist() == [0, 2, 4]
+    assert sorted(table.technologies[i] for i in table.indices) == ['Go', 'Python', 'Python', 'SQL']
+
+
+def test_empty_country_filter_keeps_dtypes(survey_path):
+    collector = ITJobDataCollector()
+    table = collector.load_stackoverflow_data(survey_path, countries=['Nowhere'])
+    assert len(table) == 0
+    assert table.respondents['country'].dtype == 'category'
+    assert table.respondents['salary_usd'].dtype == 'float32'
+
+    tech = collector._process_stackoverflow_data(table)
+    assert len(tech) == 0
+    assert tech['company_size'].dtype == 'category'
@@ -1,34 +1,50 @@
 # verify_data.py
-import pandas as pd
+import sys
 import os
 
-def verify_collected_data():
-    """Verify collected data quality"""
+# Add src to path
+sys.path.append('src')
+
+from schema import JOB_SCHEMA, TECH_SCHEMA, read_csv_with_schema, with_schema, bytes_per_row
+
+def verify_collected_data(datasets=None):
+    """Verify collected data quality (datasets = {path: DataFrame} yang sudah di memory, dari pipeline)"""
     
     print("🔍 Verifying collected data...")
     
-    # Check if files exist
-    files_to_check = [
-        'data/raw/it_jobs_raw.csv',
-        'data/raw/tech_trends_raw.csv'
-    ]
+    # Check if files exist (dibaca sekali dengan compact schema, dipakai ulang untuk analysis)
+    files_to_check = {
+        'data/raw/it_jobs_raw.csv': JOB_SCHEMA,
+        'data/raw/tech_trends_raw.csv': TECH_SCHEMA
+    }
+    loaded = {}
     
-    for file_path in files_to_check:
-        if os.path.exists(file_path):
+    for file_path, schema in files_to_check.items():
+        if datasets and file_path in datasets:
+            print(f"✅ {file_path} loaded")
+            df = with_schema(datasets[file_path], schema)
+        elif os.path.exists(file_path):
             print(f"✅ {file_path} exists")
-            
-            # Load and check data
-            df = pd.read_csv(file_path)
+            df = read_csv_with_schema(file_path, schema)
+        else:
+            df = None
+        
+        if df is not None:
+            # Check data
+            loaded[file_path] = df
             print(f"   📊 Shape: {df.shape}")
             print(f"   📋 Columns: {list(df.columns)}")
-            print(f"   🔢 Data types: {df.dtypes.value_counts().to_dict()}")
+            print(f"   🔢 Data types: {df.dtypes.astype(str).value_counts().to_dict()}")
+            print(f"   💾 Memory: {bytes_per_row(df):.0f} bytes per row")
+            if df.attrs['metadata']:
+                print(f"   🏷️ Dataset metadata: {df.attrs['metadata']}")
             print()
         else:
             print(f"❌ {file_path} not found")
     
     # Detailed analysis of main dataset
-    if os.path.exists('data/raw/it_jobs_raw.csv'):
-        df = pd.read_csv('data/raw/it_jobs_raw.csv')
+    if 'data/raw/it_jobs_raw.csv' in loaded:
+        df = loaded['data/raw/it_jobs_raw.csv']
         
         print("📈 Main Dataset Analysis:")
         print(f"   Total jobs: {len(df)}")
@@ -47,4 +63,4 @@ def verify_collected_data():
         print(df['title'].value_counts().head())
 
 if __name__ == "__main__":
-    verify_collected_data()
\ No newline at end of file
+    verify_collected_data()